@@ -5,6 +5,7 @@ from .value_objects.user_id import UserId
 from .value_objects.vehicle_id import VehicleId
 from .value_objects.workshop_id import WorkshopId
 from .value_objects.message_content import MessageContent
+from .value_objects.normalized_text import NormalizedText, normalize_text
 from .value_objects.message_role import MessageRole
 from .value_objects.session_status import SessionStatus
 from .value_objects.attachment_url import AttachmentUrl, AttachmentType
@@ -15,6 +16,7 @@ from .value_objects.cost_estimate import CostEstimate, Currency
 from .value_objects.sentiment_label import SentimentLabel
 
 from .entities.diagnosis_session import DiagnosisSession
+from .entities.diagnosis_session_summary import DiagnosisSessionSummary
 from .entities.diagnosis_message import DiagnosisMessage, Attachment
 from .entities.problem_classification import ProblemClassification
 from .entities.sentiment_analysis import SentimentAnalysis
@@ -43,12 +45,14 @@ from .repository.sentiment_analysis_repository import SentimentAnalysisRepositor
 
 __all__ = [
     "SessionId", "MessageId", "UserId", "VehicleId", "WorkshopId",
-    "MessageContent", "MessageRole", "SessionStatus",
+    "MessageContent", "NormalizedText", "normalize_text",
+    "MessageRole", "SessionStatus",
     "AttachmentUrl", "AttachmentType",
     "ProblemCategory", "ProblemCategoryEnum",
     "ConfidenceScore", "UrgencyLevel", "UrgencyLevelEnum",
     "CostEstimate", "Currency", "SentimentLabel",
-    "DiagnosisSession", "DiagnosisMessage", "Attachment",
+    "DiagnosisSession", "DiagnosisSessionSummary",
+    "DiagnosisMessage", "Attachment",
     "ProblemClassification", "SentimentAnalysis",
     "SessionDomainException", "SessionNotFoundException",
     "SessionNotOwnedByUserException", "SessionNotActiveException",
@@ -1,12 +1,14 @@
 
 
 from .diagnosis_session import DiagnosisSession
+from .diagnosis_session_summary import DiagnosisSessionSummary
 from .diagnosis_message import DiagnosisMessage
 from .problem_classification import ProblemClassification
 from .sentiment_analysis import SentimentAnalysis
 
 __all__ = [
     "DiagnosisSession",
+    "DiagnosisSessionSummary",
     "DiagnosisMessage",
     "ProblemClassification",
     "SentimentAnalysis",
@@ -7,6 +7,7 @@ from ..value_objects import (
     MessageId,
     MessageRole,
     MessageContent,
+    NormalizedText,
     AttachmentType,
 )
 from ..exceptions import (
@@ -67,6 +68,7 @@ class DiagnosisMessage:
         self._content = content
         self._attachments = attachments or []
         self._timestamp = timestamp or datetime.utcnow()
+        self._normalized_content: Optional[NormalizedText] = None
         
         if len(self._attachments) > Attachment.MAX_ATTACHMENTS:
             raise TooManyAttachmentsException(
@@ -115,6 +117,13 @@ class DiagnosisMessage:
     def content(self) -> MessageContent:
         return self._content
     
+    @property
+    def normalized_content(self) -> NormalizedText:
+        """Contenido normalizado para los matchers de palabras clave (se calcula una vez)."""
+        if self._normalized_content is None:
+            self._normalized_content = NormalizedText.from_raw(self._content.value)
+        return self._normalized_content
+    
     @property
     def attachments(self) -> list[Attachment]:
         return self._attachments.copy()
@@ -27,6 +27,7 @@ class DiagnosisSession:
         summary: Optional[str] = None,
         started_at: Optional[datetime] = None,
         completed_at: Optional[datetime] = None,
+        detected_symptoms: Optional[list[str]] = None,
     ):
         self._session_id = session_id
         self._user_id = user_id
@@ -36,6 +37,9 @@ class DiagnosisSession:
         self._summary = summary
         self._started_at = started_at or datetime.utcnow()
         self._completed_at = completed_at
+        self._detected_symptoms = list(detected_symptoms or [])
+        # Mensajes agregados desde que se cargó la sesión y aún no guardados
+        self._pending_messages: list[DiagnosisMessage] = []
     
     @staticmethod
     def create(
@@ -93,6 +97,16 @@ class DiagnosisSession:
     def completed_at(self) -> Optional[datetime]:
         return self._completed_at
     
+    @property
+    def detected_symptoms(self) -> list[str]:
+        return list(self._detected_symptoms)
+    
+    def add_detected_symptoms(self, symptoms: list[str]) -> None:
+        """Acumula síntomas detectados, sin duplicados y en orden de aparición"""
+        for symptom in symptoms:
+            if symptom not in self._detected_symptoms:
+                self._detected_symptoms.append(symptom)
+    
     def add_message(self, message: DiagnosisMessage) -> None:
         if not self.is_active():
             raise SessionNotActiveException(
@@ -101,6 +115,14 @@ class DiagnosisSession:
             )
         
         self._messages.append(message)
+        self._pending_messages.append(message)
+    
+    @property
+    def pending_messages(self) -> list[DiagnosisMessage]:
+        return list(self._pending_messages)
+    
+    def mark_messages_persisted(self) -> None:
+        self._pending_messages = []
     
     def complete(self, summary: Optional[str] = None) -> None:
         if self._status != SessionStatus.ACTIVE:
@@ -160,6 +182,14 @@ class DiagnosisSession:
         
         return "\n".join(texts)
     
+    def get_normalized_conversation_text(self) -> str:
+        texts = []
+        for message in self._messages:
+            role_prefix = "usuario" if message.is_user_message() else "asistente"
+            texts.append(f"{role_prefix}: {message.normalized_content.value}")
+        
+        return "\n".join(texts)
+    
     def to_dict(self) -> dict:
         return {
             "id": str(self._session_id.value),
@@ -170,6 +200,7 @@ class DiagnosisSession:
             "summary": self._summary,
             "started_at": self._started_at.isoformat(),
             "completed_at": self._completed_at.isoformat() if self._completed_at else None,
+            "detected_symptoms": list(self._detected_symptoms),
         }
     
     @staticmethod
@@ -182,6 +213,7 @@ class DiagnosisSession:
         summary: Optional[str],
         started_at: datetime,
         completed_at: Optional[datetime],
+        detected_symptoms: Optional[list[str]] = None,
     ) -> "DiagnosisSession":
         """Reconstruct entity from primitives."""
         return DiagnosisSession(
@@ -193,4 +225,5 @@ class DiagnosisSession:
             summary=summary,
             started_at=started_at,
             completed_at=completed_at,
+            detected_symptoms=detected_symptoms,
         )
\ No newline at end of file
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from ..value_objects import SessionId, SessionStatus
+
+
+@dataclass(frozen=True)
+class DiagnosisSessionSummary:
+    """
+    Proyección de solo lectura de una sesión: datos de cabecera y número de
+    mensajes, sin cargar el contenido de la conversación. messages_count es
+    None cuando no se pidió el conteo.
+    """
+
+    session_id: SessionId
+    user_id: UUID
+    vehicle_id: UUID
+    status: SessionStatus
+    messages_count: Optional[int]
+    summary: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    @property
+    def id(self) -> SessionId:
+        return self.session_id
+
+    def is_active(self) -> bool:
+        return self.status == SessionStatus.ACTIVE
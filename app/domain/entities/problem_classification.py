@@ -27,6 +27,7 @@ class ProblemClassification:
         confidence_score: ConfidenceScore,
         symptoms: list[str],
         created_at: Optional[datetime] = None,
+        tables_version: Optional[str] = None,
     ):
         self._classification_id = classification_id
         self._session_id = session_id
@@ -35,6 +36,7 @@ class ProblemClassification:
         self._confidence_score = confidence_score
         self._symptoms = symptoms
         self._created_at = created_at or datetime.utcnow()
+        self._tables_version = tables_version
         
         if confidence_score.value < self.MIN_CONFIDENCE_THRESHOLD:
             raise LowConfidenceClassificationException(
@@ -50,6 +52,7 @@ class ProblemClassification:
         subcategory: Optional[str],
         confidence: float,
         symptoms: list[str],
+        tables_version: Optional[str] = None,
     ) -> "ProblemClassification":
         """Factory method para crear una nueva clasificación"""
         
@@ -62,6 +65,7 @@ class ProblemClassification:
             subcategory=subcategory,
             confidence_score=ConfidenceScore(confidence),
             symptoms=symptoms,
+            tables_version=tables_version,
         )
     
     
@@ -93,6 +97,10 @@ class ProblemClassification:
     def created_at(self) -> datetime:
         return self._created_at
     
+    @property
+    def tables_version(self) -> Optional[str]:
+        return self._tables_version
+    
     def is_high_confidence(self) -> bool:
         return self._confidence_score.value >= 0.8
     
@@ -112,6 +120,7 @@ class ProblemClassification:
             "confidence_score": self._confidence_score.value,
             "symptoms": self._symptoms,
             "created_at": self._created_at.isoformat(),
+            "tables_version": self._tables_version,
         }
     
     @staticmethod
@@ -123,6 +132,7 @@ class ProblemClassification:
         confidence_score: float,
         symptoms: list[str],
         created_at: datetime,
+        tables_version: Optional[str] = None,
     ) -> "ProblemClassification":
         """Reconstruye la entidad desde primitivos"""
         
@@ -134,4 +144,5 @@ class ProblemClassification:
             confidence_score=ConfidenceScore(confidence_score),
             symptoms=symptoms,
             created_at=created_at,
+            tables_version=tables_version,
         )
\ No newline at end of file
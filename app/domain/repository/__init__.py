@@ -2,9 +2,11 @@
 from .diagnosis_session_repository import DiagnosisSessionRepository
 from .problem_classification_repository import ProblemClassificationRepository
 from .sentiment_analysis_repository import SentimentAnalysisRepository
+from .workshop_recommendation_repository import WorkshopRecommendationRepository
 
 __all__ = [
     "DiagnosisSessionRepository",
     "ProblemClassificationRepository",
     "SentimentAnalysisRepository",
+    "WorkshopRecommendationRepository",
 ]
\ No newline at end of file
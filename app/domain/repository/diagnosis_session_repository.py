@@ -4,7 +4,7 @@ from typing import Protocol, Optional
 from uuid import UUID
 from datetime import datetime
 
-from ..entities import DiagnosisSession, DiagnosisMessage
+from ..entities import DiagnosisSession, DiagnosisMessage, DiagnosisSessionSummary
 
 
 class DiagnosisSessionRepository(Protocol):
@@ -18,6 +18,14 @@ class DiagnosisSessionRepository(Protocol):
 
         ...
     
+    async def find_header_by_id(
+        self,
+        session_id: UUID,
+        with_messages_count: bool = False,
+    ) -> Optional[DiagnosisSessionSummary]:
+
+        ...
+    
     async def find_by_user_id(
         self,
         user_id: UUID,
@@ -27,6 +35,15 @@ class DiagnosisSessionRepository(Protocol):
 
         ...
     
+    async def find_summaries_by_user_id(
+        self,
+        user_id: UUID,
+        vehicle_id: Optional[UUID] = None,
+        limit: int = 10,
+    ) -> list[DiagnosisSessionSummary]:
+
+        ...
+    
     async def find_by_vehicle_id(self, vehicle_id: UUID) -> list[DiagnosisSession]:
 
         ...
@@ -0,0 +1,34 @@
+
+from typing import Protocol, Optional, List, Dict, Any
+from uuid import UUID
+
+from ..entities import ProblemClassification
+
+
+class WorkshopRecommendationRepository(Protocol):
+
+    
+    async def find_for_classification(
+        self,
+        session_id: UUID,
+        classification: ProblemClassification,
+        catalog_version: str,
+        user_location: Dict[str, float],
+    ) -> Optional[List[Dict[str, Any]]]:
+
+        ...
+    
+    async def replace_for_classification(
+        self,
+        session_id: UUID,
+        classification: ProblemClassification,
+        catalog_version: str,
+        user_location: Dict[str, float],
+        recommendations: List[Dict[str, Any]],
+    ) -> int:
+
+        ...
+    
+    async def delete_by_session(self, session_id: UUID) -> None:
+
+        ...
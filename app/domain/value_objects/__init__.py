@@ -6,6 +6,7 @@ from .vehicle_id import VehicleId
 from .workshop_id import WorkshopId
 
 from .message_content import MessageContent
+from .normalized_text import NormalizedText, normalize_text
 from .message_role import MessageRole
 
 from .session_status import SessionStatus
@@ -28,6 +29,8 @@ __all__ = [
     "WorkshopId",
     
     "MessageContent",
+    "NormalizedText",
+    "normalize_text",
     "MessageRole",
     
     "SessionStatus",
@@ -0,0 +1,30 @@
+import re
+import unicodedata
+from dataclasses import dataclass
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Casefold, quita acentos/diacríticos y colapsa espacios.
+    "Bujía  TRANSMISIÓN" -> "bujia transmision"
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _WHITESPACE_RE.sub(" ", stripped).strip()
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+
+    value: str
+
+    @classmethod
+    def from_raw(cls, text: str) -> 'NormalizedText':
+
+        return cls(value=normalize_text(text))
+
+    def __str__(self) -> str:
+        return self.value
@@ -1,5 +1,6 @@
 
 
+import asyncio
 from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from datetime import datetime, timedelta
@@ -22,6 +23,7 @@ from app.infrastructure.api.routers.schemas import (
     ReportResponse,
     ErrorResponse
 )
+from app.infrastructure.config.settings import get_settings
 
 router = APIRouter()
 
@@ -57,7 +59,7 @@ async def get_analytics_dashboard(
     # Queries reales a Prisma
     try:
         # Total de diagnósticos en el período
-        total_diagnoses = await session_repo.db.diagnosissession.count(
+        total_diagnoses = await session_repo.read_db.diagnosissession.count(
             where={
                 "startedAt": {
                     "gte": from_date,
@@ -67,31 +69,10 @@ async def get_analytics_dashboard(
         )
         
         # Usuarios únicos en el período
-        sessions_in_period = await session_repo.db.diagnosissession.find_many(
-            where={
-                "startedAt": {
-                    "gte": from_date,
-                    "lte": to_date
-                }
-            }
-        )
-        unique_users = len(set(s.userId for s in sessions_in_period))
+        unique_users = await session_repo.count_unique_users(from_date, to_date)
         
         # Top problemas (categorías más frecuentes)
-        classifications = await classification_repo.db.problemclassification.find_many(
-            where={
-                "createdAt": {
-                    "gte": from_date,
-                    "lte": to_date
-                }
-            }
-        )
-        
-        # Contar por categoría
-        category_counts = {}
-        for c in classifications:
-            cat = c.category
-            category_counts[cat] = category_counts.get(cat, 0) + 1
+        category_counts = await classification_repo.get_category_distribution(from_date, to_date)
         
         # Top 5 problemas
         top_problems = [
@@ -108,7 +89,7 @@ async def get_analytics_dashboard(
         prev_from_date = from_date - timedelta(days=period_duration)
         prev_to_date = from_date
         
-        prev_diagnoses = await session_repo.db.diagnosissession.count(
+        prev_diagnoses = await session_repo.read_db.diagnosissession.count(
             where={
                 "startedAt": {
                     "gte": prev_from_date,
@@ -123,7 +104,7 @@ async def get_analytics_dashboard(
             diagnoses_growth = 100.0 if total_diagnoses > 0 else 0.0
         
         # Calcular tiempo promedio de respuesta (sesiones completadas)
-        completed_sessions = await session_repo.db.diagnosissession.find_many(
+        completed_sessions = await session_repo.read_db.diagnosissession.find_many(
             where={
                 "startedAt": {
                     "gte": from_date,
@@ -218,7 +199,7 @@ async def get_problems_analytics(
     # Queries reales para problemas
     try:
         # Obtener todas las clasificaciones del período
-        classifications = await classification_repo.db.problemclassification.find_many(
+        classifications = await classification_repo.read_db.problemclassification.find_many(
             where={
                 "createdAt": {
                     "gte": from_date,
@@ -258,13 +239,13 @@ async def get_problems_analytics(
         }
         
         for c in classifications:
-            # Calcular urgencia basado en categoría y síntomas
-            urgency_level = urgency_service.calculate_urgency(
-                category=c.category,
-                symptoms=c.symptoms or []
+            # Calcular urgencia basado en categoría y síntomas (tabla de decisión precalculada)
+            urgency_level, _, _, _ = urgency_service.calculate_urgency_from_primitives(
+                c.category,
+                c.symptoms or []
             )
             
-            level_key = urgency_level.get_level().value.lower()
+            level_key = urgency_level.value.lower()
             if level_key in urgency_counts:
                 urgency_counts[level_key] += 1
         
@@ -317,29 +298,41 @@ async def get_workshops_performance(
             workshops_response = await workshop_client.get_workshops(limit=limit)
             workshops = workshops_response.get("data", [])
         
-        # 2. Para cada taller, obtener estadísticas
-        performance_list = []
+        # 2. Estadísticas de reviews en paralelo (concurrencia acotada) y
+        #    scores de sentimiento de todos los talleres en una sola consulta
+        workshop_ids = [workshop.get("id") for workshop in workshops]
+        semaphore = asyncio.Semaphore(get_settings().ANALYTICS_WORKSHOP_CONCURRENCY)
         
-        for workshop in workshops:
-            workshop_id = workshop.get("id")
-            
-            # Obtener estadísticas de reviews del workshop-service
-            try:
-                review_stats = await workshop_client.get_review_statistics(workshop_id)
-            except Exception:
-                review_stats = {
-                    "totalReviews": 0,
-                    "averageRating": 0.0,
-                    "ratingDistribution": {}
-                }
-            
-            # Obtener análisis de sentimiento local (si existe)
+        async def fetch_review_stats(workshop_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await workshop_client.get_review_statistics(workshop_id)
+                except Exception:
+                    return {
+                        "totalReviews": 0,
+                        "averageRating": 0.0,
+                        "ratingDistribution": {}
+                    }
+        
+        async def fetch_sentiment_scores() -> Dict[str, float]:
             try:
-                # Buscar análisis de sentimiento relacionados a este taller usando el nuevo campo workshopId
-                sentiment_score = await sentiment_repo.get_sentiment_score_by_workshop(workshop_id)
+                return await sentiment_repo.get_sentiment_scores_by_workshops(
+                    [workshop_id for workshop_id in workshop_ids if workshop_id]
+                )
             except Exception as e:
-                print(f"Error obteniendo sentiment score para taller {workshop_id}: {e}")
-                sentiment_score = 0.0
+                print(f"Error obteniendo sentiment scores de talleres: {e}")
+                return {}
+        
+        sentiment_scores, *reviews = await asyncio.gather(
+            fetch_sentiment_scores(),
+            *(fetch_review_stats(workshop_id) for workshop_id in workshop_ids)
+        )
+        
+        performance_list = []
+        
+        for workshop, review_stats in zip(workshops, reviews):
+            workshop_id = workshop.get("id")
+            sentiment_score = sentiment_scores.get(workshop_id, 0.0)
             
             # Construir respuesta de performance
             performance_list.append({
@@ -392,17 +385,13 @@ async def get_ml_models_metrics(
     try:
         # 1. PROBLEM CLASSIFIER METRICS
         # Obtener todas las clasificaciones
-        all_classifications = await classification_repo.db.problemclassification.find_many()
-        
-        total_classifications = len(all_classifications)
+        total_classifications, avg_confidence, high_confidence = (
+            await classification_repo.get_confidence_summary(high_threshold=0.7)
+        )
         
         if total_classifications > 0:
-            # Accuracy: promedio de confidence scores
-            avg_confidence = sum(c.confidenceScore for c in all_classifications) / total_classifications
-            
             # Precision/Recall/F1: simplificado (basado en confidence)
             # En un sistema real, necesitarías ground truth labels
-            high_confidence = sum(1 for c in all_classifications if c.confidenceScore >= 0.7)
             precision = high_confidence / total_classifications
             recall = precision  # Simplificado
             f1_score = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
@@ -423,17 +412,19 @@ async def get_ml_models_metrics(
         
         # 2. WORKSHOP RECOMMENDER METRICS
         # Obtener recomendaciones generadas
-        workshop_recommendations = await session_repo.db.workshoprecommendation.find_many()
-        
-        total_recommendations = len(workshop_recommendations)
+        total_recommendations = await session_repo.read_db.workshoprecommendation.count()
         
         if total_recommendations > 0:
             # Click-through rate: simplificado (basado en match score alto)
-            high_match_recommendations = sum(1 for r in workshop_recommendations if r.matchScore >= 0.7)
+            high_match_recommendations = await session_repo.read_db.workshoprecommendation.count(
+                where={"matchScore": {"gte": 0.7}}
+            )
             click_through_rate = high_match_recommendations / total_recommendations
             
             # Conversion rate: simplificado (asumiendo que match score alto = conversión)
-            conversion_rate = sum(1 for r in workshop_recommendations if r.matchScore >= 0.85) / total_recommendations
+            conversion_rate = await session_repo.read_db.workshoprecommendation.count(
+                where={"matchScore": {"gte": 0.85}}
+            ) / total_recommendations
             
             workshop_recommender_metrics = {
                 "clickThroughRate": round(click_through_rate, 3),
@@ -447,14 +438,9 @@ async def get_ml_models_metrics(
         
         # 3. SENTIMENT ANALYZER METRICS
         # Obtener análisis de sentimiento
-        sentiment_analyses = await sentiment_repo.db.sentimentanalysis.find_many()
-        
-        total_analyzed = len(sentiment_analyses)
+        total_analyzed, avg_sentiment_score = await sentiment_repo.get_score_summary()
         
         if total_analyzed > 0:
-            # Accuracy: promedio de scores
-            avg_sentiment_score = sum(s.score for s in sentiment_analyses) / total_analyzed
-            
             sentiment_analyzer_metrics = {
                 "accuracy": round(avg_sentiment_score, 3),
                 "totalAnalyzed": total_analyzed
@@ -540,7 +526,7 @@ async def generate_custom_report(
         if data.reportType in ["MONTHLY_SUMMARY", "QUARTERLY_SUMMARY", "CUSTOM"]:
             # Obtener datos del dashboard
             try:
-                total_diagnoses = await session_repo.db.diagnosissession.count(
+                total_diagnoses = await session_repo.read_db.diagnosissession.count(
                     where={
                         "startedAt": {
                             "gte": from_date,
@@ -549,29 +535,9 @@ async def generate_custom_report(
                     }
                 )
 
-                sessions_in_period = await session_repo.db.diagnosissession.find_many(
-                    where={
-                        "startedAt": {
-                            "gte": from_date,
-                            "lte": to_date
-                        }
-                    }
-                )
-                unique_users = len(set(s.userId for s in sessions_in_period))
-
-                classifications = await classification_repo.db.problemclassification.find_many(
-                    where={
-                        "createdAt": {
-                            "gte": from_date,
-                            "lte": to_date
-                        }
-                    }
-                )
+                unique_users = await session_repo.count_unique_users(from_date, to_date)
 
-                category_counts = {}
-                for c in classifications:
-                    cat = c.category
-                    category_counts[cat] = category_counts.get(cat, 0) + 1
+                category_counts = await classification_repo.get_category_distribution(from_date, to_date)
 
                 top_problems = [
                     {
@@ -586,7 +552,7 @@ async def generate_custom_report(
                 prev_from_date = from_date - timedelta(days=period_duration)
                 prev_to_date = from_date
 
-                prev_diagnoses = await session_repo.db.diagnosissession.count(
+                prev_diagnoses = await session_repo.read_db.diagnosissession.count(
                     where={
                         "startedAt": {
                             "gte": prev_from_date,
@@ -600,7 +566,7 @@ async def generate_custom_report(
                 else:
                     diagnoses_growth = 100.0 if total_diagnoses > 0 else 0.0
 
-                completed_sessions = await session_repo.db.diagnosissession.find_many(
+                completed_sessions = await session_repo.read_db.diagnosissession.find_many(
                     where={
                         "startedAt": {
                             "gte": from_date,
@@ -52,7 +52,8 @@ async def classify_problem(
         subcategory=classification.subcategory,
         confidenceScore=classification.confidence_score.value, 
         symptoms=classification.symptoms,
-        createdAt=datetime.utcnow()
+        createdAt=datetime.utcnow(),
+        tablesVersion=classification.tables_version
     )
 
 
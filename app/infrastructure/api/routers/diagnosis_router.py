@@ -1,5 +1,5 @@
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Header
+from fastapi import APIRouter, Depends, HTTPException, Query, Header, Response
 from uuid import UUID
 
 from app.infrastructure.dependencies import (
@@ -41,7 +41,7 @@ async def get_user_sessions(
 ):
     user_id = user["userId"]
     
-    sessions = await repo.find_by_user_id(
+    sessions = await repo.find_summaries_by_user_id(
         user_id=user_id,
         vehicle_id=vehicleId,
         limit=limit
@@ -55,7 +55,7 @@ async def get_user_sessions(
             status=s.status.value,
             startedAt=s.started_at,
             completedAt=s.completed_at,
-            messagesCount=len(s.messages),
+            messagesCount=s.messages_count,
             summary=s.summary
         )
         for s in sessions
@@ -89,7 +89,7 @@ async def create_diagnosis_session(
 
     # Validación de vehículo (opcional, no bloqueante)
     try:
-        vehicle = await vehicle_client.get_vehicle(
+        vehicle = await vehicle_client.get_vehicle_location(
             vehicle_id=vehicle_id,
             user_id=user_id,
             auth_token=authorization
@@ -172,6 +172,7 @@ async def get_session_by_id(
         get_urgency_calculator_service,
         get_cost_estimator_service,
         get_workshop_recommender_service,
+        get_workshop_recommendation_repository,
         get_vehicle_client,
         get_workshop_client
     )
@@ -185,7 +186,7 @@ async def get_session_by_id(
 
     user_id = user["userId"]
 
-    session = await repo.find_by_id(UUID(sessionId))
+    session = await repo.find_header_by_id(UUID(sessionId), with_messages_count=True)
 
     if not session:
         raise HTTPException(
@@ -255,13 +256,15 @@ async def get_session_by_id(
 
             # Obtener recomendaciones de talleres
             try:
+                recommender_service = get_workshop_recommender_service()
+                recommendation_repo = get_workshop_recommendation_repository()
                 vehicle_client = get_vehicle_client()
 
                 # Obtener ubicación del vehículo
                 vehicle_id = str(session.vehicle_id)
 
                 try:
-                    vehicle_data = await vehicle_client.get_vehicle(vehicle_id, user_id, authorization)
+                    vehicle_data = await vehicle_client.get_vehicle_location(vehicle_id, user_id, authorization)
 
                     if vehicle_data and vehicle_data.get("latitude") and vehicle_data.get("longitude"):
                         user_location = {
@@ -280,26 +283,49 @@ async def get_session_by_id(
                         "longitude": -99.1332
                     }
 
-                # Obtener recomendaciones
-                recommender_service = get_workshop_recommender_service()
-                category = classification.category.value
+                # Ranking guardado para esta clasificación, catálogo y
+                # ubicación; sin catálogo local siempre se recalcula
+                catalog_version = recommender_service.catalog_version
+                recommendations = None
 
-                recommendations = await recommender_service.recommend_workshops(
-                    category=category,
-                    user_location=user_location,
-                    limit=3
-                )
+                if catalog_version is not None:
+                    try:
+                        recommendations = await recommendation_repo.find_for_classification(
+                            session.id.value, classification, catalog_version, user_location
+                        )
+                    except Exception as e:
+                        print(f"Error leyendo recomendaciones guardadas: {e}")
+
+                if recommendations is None:
+                    # Obtener recomendaciones
+                    category = classification.category.value
+
+                    recommendations = await recommender_service.recommend_workshops(
+                        category=category,
+                        user_location=user_location,
+                        limit=recommendation_repo.MAX_RECOMMENDATIONS
+                    )
+
+                    if recommendations and catalog_version is not None:
+                        try:
+                            await recommendation_repo.replace_for_classification(
+                                session.id.value, classification, catalog_version,
+                                user_location, recommendations
+                            )
+                        except Exception as e:
+                            print(f"Error guardando recomendaciones: {e}")
+
+                recommendations = recommendations[:3]
 
                 # Enriquecer con datos del workshop-service
                 workshop_client = get_workshop_client()
+                workshops_details = await workshop_client.get_workshops_by_ids(
+                    rec["workshop_id"] for rec in recommendations
+                )
 
                 for rec in recommendations:
                     workshop_id = rec["workshop_id"]
-
-                    try:
-                        workshop_details = await workshop_client.get_workshop(workshop_id)
-                    except Exception:
-                        workshop_details = None
+                    workshop_details = workshops_details.get(workshop_id)
 
                     recommendations_data.append({
                         "workshopId": workshop_id,
@@ -330,7 +356,7 @@ async def get_session_by_id(
         status=session.status.value,
         startedAt=session.started_at,
         completedAt=session.completed_at,
-        messagesCount=len(session.messages),
+        messagesCount=session.messages_count,
         summary=session.summary,
         classification=classification_data,
         urgency=urgency_data,
@@ -346,12 +372,22 @@ async def get_session_by_id(
 )
 async def get_session_messages(
     sessionId: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Tamaño de página; sin él se retornan todos los mensajes"),
+    before: Optional[str] = Query(None, description="Cursor para cargar mensajes anteriores (X-Next-Cursor)"),
+    after: Optional[str] = Query(None, description="Cursor para cargar mensajes posteriores (X-Prev-Cursor)"),
     user: Dict[str, Any] = Depends(get_current_user),
     repo: PrismaDiagnosisSessionRepository = Depends(get_diagnosis_session_repository)
 ):
     user_id = user["userId"]
     
-    session = await repo.find_by_id(UUID(sessionId))
+    if before and after:
+        raise HTTPException(
+            status_code=400,
+            detail="Use solo uno de los cursores: before o after"
+        )
+    
+    session = await repo.find_header_by_id(UUID(sessionId))
     
     if not session:
         raise HTTPException(
@@ -365,6 +401,24 @@ async def get_session_messages(
             detail="No tienes acceso a esta sesión"
         )
     
+    if limit is None and not before and not after:
+        messages = await repo.find_messages_by_session_id(UUID(sessionId))
+    else:
+        try:
+            messages, older_cursor, newer_cursor = await repo.find_messages_page(
+                session_id=UUID(sessionId),
+                limit=limit or 50,
+                before=before,
+                after=after
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        if older_cursor:
+            response.headers["X-Next-Cursor"] = older_cursor
+        if newer_cursor:
+            response.headers["X-Prev-Cursor"] = newer_cursor
+    
     return [
         MessageResponse(
             id=str(msg.id.value),
@@ -373,7 +427,7 @@ async def get_session_messages(
             content=msg.content.value,
             timestamp=msg.timestamp
         )
-        for msg in session.messages
+        for msg in messages
     ]
 
 
@@ -9,6 +9,7 @@ from app.infrastructure.dependencies import (
     get_current_vehicle_owner,
     get_diagnosis_session_repository,
     get_problem_classification_repository,
+    get_workshop_recommendation_repository,
     get_workshop_recommender_service,
     get_vehicle_client,
     get_workshop_client
@@ -18,7 +19,10 @@ from app.infrastructure.api.routers.schemas import (
     ErrorResponse
 )
 
-from app.infrastructure.repositories import PrismaDiagnosisSessionRepository
+from app.infrastructure.repositories import (
+    PrismaDiagnosisSessionRepository,
+    PrismaWorkshopRecommendationRepository
+)
 from app.infrastructure.services import WorkshopRecommenderService
 from app.infrastructure.clients import VehicleServiceClient, WorkshopServiceClient
 
@@ -45,6 +49,7 @@ async def get_workshop_recommendations(
     user: Dict[str, Any] = Depends(get_current_vehicle_owner),
     session_repo: PrismaDiagnosisSessionRepository = Depends(get_diagnosis_session_repository),
     classification_repo = Depends(get_problem_classification_repository),
+    recommendation_repo: PrismaWorkshopRecommendationRepository = Depends(get_workshop_recommendation_repository),
     recommender_service: WorkshopRecommenderService = Depends(get_workshop_recommender_service),
     vehicle_client: VehicleServiceClient = Depends(get_vehicle_client),
     workshop_client: WorkshopServiceClient = Depends(get_workshop_client)
@@ -56,13 +61,14 @@ async def get_workshop_recommendations(
     1. Valida que la sesión pertenezca al usuario
     2. Verifica que exista una clasificación del problema
     3. Obtiene la ubicación del vehículo
-    4. Ejecuta el algoritmo ML de recomendación
+    4. Usa el ranking guardado si es de esta clasificación, catálogo y
+       ubicación; si no, ejecuta el algoritmo ML de recomendación y lo guarda
     5. Enriquece las recomendaciones con datos del taller
     """
     
     # 1. Validar que la sesión existe y pertenece al usuario
     try:
-        session = await session_repo.find_by_id(sessionId)
+        session = await session_repo.find_header_by_id(UUID(sessionId))
     except Exception as e:
         raise HTTPException(
             status_code=404,
@@ -95,53 +101,59 @@ async def get_workshop_recommendations(
         )
     
     # 3. Obtener ubicación del vehículo
-    vehicle_id = str(session.vehicle_id)
-
-    try:
-        vehicle_data = await vehicle_client.get_vehicle(vehicle_id, user["userId"], authorization)
-    except Exception as e:
-        # Si falla, usar ubicación por defecto (Suchiapa)
-        print(f"Error obteniendo vehículo: {e}")
-        vehicle_data = None
+    user_location = await _resolve_user_location(
+        vehicle_client, str(session.vehicle_id), user["userId"], authorization
+    )
     
-    # Extraer ubicación
-    if vehicle_data and vehicle_data.get("latitude") and vehicle_data.get("longitude"):
-        user_location = {
-            "latitude": vehicle_data["latitude"],
-            "longitude": vehicle_data["longitude"]
-        }
-    else:
-        # Ubicación por defecto: Suchiapa
-        user_location = {
-            "latitude": 16.62640635652556,
-            "longitude": -93.10006537851791
-        }
+    # 4. Ranking guardado para esta clasificación, catálogo y ubicación. Sin
+    # catálogo local (búsqueda remota) no hay versión: siempre se recalcula
+    catalog_version = recommender_service.catalog_version
+    recommendations = None
     
-    # 4. Ejecutar algoritmo de recomendación
-    category = classification.get_category().value
+    if catalog_version is not None:
+        try:
+            recommendations = await recommendation_repo.find_for_classification(
+                session.id.value, classification, catalog_version, user_location
+            )
+        except Exception as e:
+            print(f"Error leyendo recomendaciones guardadas: {e}")
     
-    try:
-        recommendations = await recommender_service.recommend_workshops(
-            category=category,
-            user_location=user_location,
-            limit=limit
-        )
-    except Exception as e:
-        print(f"Error en recomendación: {e}")
-        # Retornar lista vacía si falla el servicio
-        recommendations = []
+    if recommendations is None:
+        category = classification.get_category().value
+        
+        try:
+            recommendations = await recommender_service.recommend_workshops(
+                category=category,
+                user_location=user_location,
+                limit=recommendation_repo.MAX_RECOMMENDATIONS
+            )
+        except Exception as e:
+            print(f"Error en recomendación: {e}")
+            # Retornar lista vacía si falla el servicio
+            recommendations = []
+        
+        # Un solo create_many con el ranking completo
+        if recommendations and catalog_version is not None:
+            try:
+                await recommendation_repo.replace_for_classification(
+                    session.id.value, classification, catalog_version, user_location, recommendations
+                )
+            except Exception as e:
+                print(f"Error guardando recomendaciones: {e}")
+    
+    recommendations = recommendations[:limit]
     
     # 5. Enriquecer recomendaciones con datos completos del taller
     enriched_recommendations = []
     
+    # Detalles de todos los talleres en paralelo; los que fallan quedan en None
+    workshops_details = await workshop_client.get_workshops_by_ids(
+        rec["workshop_id"] for rec in recommendations
+    )
+    
     for rec in recommendations:
         workshop_id = rec["workshop_id"]
-        
-        # Obtener detalles completos del taller
-        try:
-            workshop_details = await workshop_client.get_workshop(workshop_id)
-        except Exception:
-            workshop_details = None
+        workshop_details = workshops_details.get(workshop_id)
         
         # Construir respuesta
         enriched_recommendations.append(
@@ -162,4 +174,31 @@ async def get_workshop_recommendations(
             )
         )
     
-    return enriched_recommendations
\ No newline at end of file
+    return enriched_recommendations
+
+
+async def _resolve_user_location(
+    vehicle_client: VehicleServiceClient,
+    vehicle_id: str,
+    user_id: str,
+    authorization: str
+) -> Dict[str, float]:
+
+    try:
+        vehicle_data = await vehicle_client.get_vehicle_location(vehicle_id, user_id, authorization)
+    except Exception as e:
+        # Si falla, usar ubicación por defecto (Suchiapa)
+        print(f"Error obteniendo vehículo: {e}")
+        vehicle_data = None
+    
+    if vehicle_data and vehicle_data.get("latitude") and vehicle_data.get("longitude"):
+        return {
+            "latitude": vehicle_data["latitude"],
+            "longitude": vehicle_data["longitude"]
+        }
+    
+    # Ubicación por defecto: Suchiapa
+    return {
+        "latitude": 16.62640635652556,
+        "longitude": -93.10006537851791
+    }
@@ -136,6 +136,7 @@ class ClassificationResponse(BaseModel):
     confidenceScore: float = Field(..., ge=0.0, le=1.0, description="Nivel de confianza (0-1)")
     symptoms: List[str] = []
     createdAt: datetime
+    tablesVersion: Optional[str] = None
     
     class Config:
         from_attributes = True
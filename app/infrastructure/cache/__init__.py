@@ -0,0 +1,21 @@
+from .redis_cache import (
+    RedisCache,
+    get_cache,
+    initialize_cache,
+    close_cache,
+    check_cache_health,
+)
+from .ttl_cache import (
+    AsyncTTLCache,
+    ttl_cache_stats,
+)
+
+__all__ = [
+    "RedisCache",
+    "get_cache",
+    "initialize_cache",
+    "close_cache",
+    "check_cache_health",
+    "AsyncTTLCache",
+    "ttl_cache_stats",
+]
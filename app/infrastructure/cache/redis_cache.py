@@ -0,0 +1,235 @@
+import json
+import logging
+from collections import Counter
+from typing import Any, Dict, Optional
+
+import redis.asyncio as redis
+
+from app.infrastructure.config.settings import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = versión, KEYS[2..] = claves de datos
+# ARGV[1] = versión esperada, ARGV[2] = '1' si es una escritura, ARGV[3] = TTL,
+# ARGV[4..] = valores JSON en el orden de KEYS[2..]
+VERSIONED_SET_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local ttl = tonumber(ARGV[3])
+local is_write = ARGV[2] == '1'
+
+if current ~= tonumber(ARGV[1]) then
+    if is_write then
+        redis.call('SET', KEYS[1], current + 1, 'EX', ttl)
+        if #KEYS > 1 then
+            redis.call('DEL', unpack(KEYS, 2))
+        end
+    end
+    return -1
+end
+
+local version = current
+if is_write then
+    version = current + 1
+end
+
+redis.call('SET', KEYS[1], version, 'EX', ttl)
+for i = 2, #KEYS do
+    redis.call('SET', KEYS[i], ARGV[i + 2], 'EX', ttl)
+end
+
+return version
+"""
+
+
+class RedisCache:
+    """
+    Cache JSON sobre Redis con métricas de aciertos/fallos por espacio de
+    nombres. Los errores de Redis se registran y se tratan como un fallo de
+    cache: el servicio sigue funcionando contra Postgres.
+    """
+
+    def __init__(self, client: redis.Redis, prefix: str = "diagnosis"):
+        self._client = client
+        self._prefix = prefix
+        self._stats: Counter = Counter()
+        self._versioned_set = client.register_script(VERSIONED_SET_SCRIPT)
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+
+    async def get_json(self, key: str, namespace: str) -> Optional[Any]:
+
+        try:
+            raw = await self._client.get(self._key(key))
+        except Exception as e:
+            self._stats[f"{namespace}.errors"] += 1
+            logger.warning(f"Error leyendo cache {key}: {e}")
+            return None
+
+        if raw is None:
+            self._stats[f"{namespace}.misses"] += 1
+            return None
+
+        self._stats[f"{namespace}.hits"] += 1
+        return json.loads(raw)
+
+    async def set_json(self, key: str, value: Any, ttl_seconds: int, namespace: str) -> None:
+
+        try:
+            await self._client.set(self._key(key), json.dumps(value), ex=ttl_seconds)
+            self._stats[f"{namespace}.sets"] += 1
+        except Exception as e:
+            self._stats[f"{namespace}.errors"] += 1
+            logger.warning(f"Error escribiendo cache {key}: {e}")
+
+    async def delete(self, *keys: str) -> None:
+
+        if not keys:
+            return
+
+        try:
+            await self._client.delete(*(self._key(k) for k in keys))
+        except Exception as e:
+            self._stats["invalidation.errors"] += 1
+            logger.warning(f"Error invalidando cache {keys}: {e}")
+
+    async def get_version(self, key: str) -> Optional[int]:
+        """Versión actual (0 si no existe), o None si Redis falla."""
+
+        try:
+            raw = await self._client.get(self._key(key))
+        except Exception as e:
+            self._stats["version.errors"] += 1
+            logger.warning(f"Error leyendo versión {key}: {e}")
+            return None
+
+        return int(raw) if raw is not None else 0
+
+    async def set_json_versioned(
+        self,
+        version_key: str,
+        expected_version: int,
+        values: Dict[str, Any],
+        ttl_seconds: int,
+        namespace: str,
+        bump: bool = False
+    ) -> Optional[int]:
+        """
+        Escribe values solo si la versión sigue siendo expected_version, de
+        forma atómica. Las lecturas (bump=False) no la cambian; las escrituras
+        la incrementan y, si no coincide, igual la incrementan y borran las
+        claves para que nadie repueble el cache con un estado anterior.
+
+        Devuelve la versión con la que quedaron los datos, o None si no se
+        escribieron.
+        """
+        keys = list(values)
+
+        try:
+            version = await self._versioned_set(
+                keys=[self._key(version_key)] + [self._key(k) for k in keys],
+                args=[expected_version, "1" if bump else "0", ttl_seconds]
+                + [json.dumps(values[k]) for k in keys]
+            )
+        except Exception as e:
+            self._stats[f"{namespace}.errors"] += 1
+            logger.warning(f"Error escribiendo cache {keys}: {e}")
+            return None
+
+        if version < 0:
+            self._stats[f"{namespace}.conflicts"] += 1
+            return None
+
+        self._stats[f"{namespace}.sets"] += 1
+        return int(version)
+
+    async def invalidate_versioned(self, version_key: str, *keys: str, ttl_seconds: int) -> None:
+        """Incrementa la versión y borra las claves en una sola transacción."""
+
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.incr(self._key(version_key))
+                pipe.expire(self._key(version_key), ttl_seconds)
+                if keys:
+                    pipe.delete(*(self._key(k) for k in keys))
+                await pipe.execute()
+        except Exception as e:
+            self._stats["invalidation.errors"] += 1
+            logger.warning(f"Error invalidando cache {keys}: {e}")
+
+    async def ping(self) -> bool:
+        return await self._client.ping()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+
+        namespaces = {}
+        for name, value in self._stats.items():
+            namespace, metric = name.rsplit(".", 1)
+            namespaces.setdefault(
+                namespace, {"hits": 0, "misses": 0, "sets": 0, "conflicts": 0, "errors": 0}
+            )[metric] = value
+
+        for metrics in namespaces.values():
+            lookups = metrics["hits"] + metrics["misses"]
+            metrics["hitRatio"] = round(metrics["hits"] / lookups, 4) if lookups else 0.0
+
+        return namespaces
+
+
+_cache: Optional[RedisCache] = None
+
+
+def get_cache() -> Optional[RedisCache]:
+    """Cache activo, o None si está deshabilitado o Redis no está disponible."""
+    return _cache
+
+
+async def initialize_cache() -> Optional[RedisCache]:
+
+    global _cache
+
+    settings = get_settings()
+
+    if not settings.CACHE_ENABLED:
+        logger.info("Cache deshabilitado (CACHE_ENABLED=false)")
+        return None
+
+    client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+    try:
+        await client.ping()
+    except Exception as e:
+        logger.error(f"Redis no disponible, se continúa sin cache: {e}")
+        await client.aclose()
+        return None
+
+    _cache = RedisCache(client)
+    return _cache
+
+
+async def close_cache() -> None:
+
+    global _cache
+
+    if _cache is not None:
+        try:
+            await _cache.close()
+        except Exception as e:
+            logger.error(f"Error al cerrar Redis: {e}")
+        _cache = None
+
+
+async def check_cache_health() -> dict:
+
+    if _cache is None:
+        return {"status": "disabled"}
+
+    try:
+        await _cache.ping()
+        return {"status": "healthy", "metrics": _cache.stats()}
+    except Exception as e:
+        return {"status": "unhealthy", "error": str(e), "metrics": _cache.stats()}
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from app.infrastructure.cache.redis_cache import get_cache
+
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Optional[Any]]]
+
+_caches: Dict[str, "AsyncTTLCache"] = {}
+
+
+class AsyncTTLCache:
+    """
+    Cache en memoria LRU + TTL para respuestas de servicios externos.
+
+    - Una entrada vencida se sigue sirviendo durante stale_seconds mientras
+      se refresca en segundo plano (stale-while-revalidate).
+    - Los fallos concurrentes de la misma clave comparten una sola llamada al
+      loader (single-flight).
+    - Si hay Redis (get_cache()), se usa como segundo nivel compartido entre
+      workers antes de llamar al loader.
+
+    Los None del loader no se cachean, salvo con cache_none=True, donde
+    duran negative_ttl_seconds (p. ej. un 404).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        max_entries: int = 1000,
+        cache_none: bool = False,
+        negative_ttl_seconds: Optional[float] = None
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.cache_none = cache_none
+        self.negative_ttl_seconds = negative_ttl_seconds if negative_ttl_seconds is not None else ttl_seconds
+
+        # clave -> (valor, fresco_hasta, servible_hasta)
+        self._entries: "OrderedDict[str, Tuple[Any, float, float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._refreshing: Set[asyncio.Task] = set()
+        self._stats: Counter = Counter()
+        # Se incrementa al invalidar: una carga iniciada antes no se guarda
+        self._versions: Counter = Counter()
+
+        _caches[name] = self
+
+    async def get_or_load(self, key: str, loader: Loader) -> Optional[Any]:
+
+        now = time.monotonic()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            value, fresh_until, stale_until = entry
+
+            if now < fresh_until:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return value
+
+            if now < stale_until:
+                self._entries.move_to_end(key)
+                self._stats["staleHits"] += 1
+                if key not in self._inflight:
+                    task = self._start_load(key, loader)
+                    self._refreshing.add(task)
+                    task.add_done_callback(self._refreshing.discard)
+                return value
+
+            del self._entries[key]
+
+        self._stats["misses"] += 1
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats["coalesced"] += 1
+        else:
+            task = self._start_load(key, loader)
+
+        # shield: si quien espera se cancela (wait_for), la carga compartida sigue
+        return await asyncio.shield(task)
+
+    def _start_load(self, key: str, loader: Loader) -> asyncio.Task:
+        task = asyncio.ensure_future(self._load(key, loader))
+        task.add_done_callback(self._log_failure)
+        self._inflight[key] = task
+        return task
+
+    def _log_failure(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Error cargando {self.name}: {task.exception()!r}")
+
+    async def _load(self, key: str, loader: Loader) -> Optional[Any]:
+
+        version = self._versions[key]
+
+        try:
+            redis_cache = get_cache()
+            redis_key = f"{self.name}:{key}"
+
+            if redis_cache is not None:
+                cached = await redis_cache.get_json(redis_key, self.name)
+                if cached is not None:
+                    if version == self._versions[key]:
+                        self._store(key, cached)
+                    return cached
+
+            self._stats["loads"] += 1
+            try:
+                value = await loader()
+            except Exception:
+                self._stats["loadErrors"] += 1
+                raise
+
+            if version != self._versions[key]:
+                return value
+
+            if value is not None:
+                self._store(key, value)
+                if redis_cache is not None:
+                    await redis_cache.set_json(redis_key, value, int(self.ttl_seconds), self.name)
+            elif self.cache_none:
+                self._store(key, None, self.negative_ttl_seconds)
+
+            return value
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    def _store(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        now = time.monotonic()
+
+        self._entries[key] = (value, now + ttl, now + ttl + self.stale_seconds)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    async def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._inflight.pop(key, None)
+        self._versions[key] += 1
+        self._stats["invalidations"] += 1
+
+        redis_cache = get_cache()
+        if redis_cache is not None:
+            await redis_cache.delete(f"{self.name}:{key}")
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["staleHits"] + self._stats["misses"]
+        served = self._stats["hits"] + self._stats["staleHits"]
+
+        return {
+            "entries": len(self._entries),
+            "hits": self._stats["hits"],
+            "staleHits": self._stats["staleHits"],
+            "misses": self._stats["misses"],
+            "coalesced": self._stats["coalesced"],
+            "loads": self._stats["loads"],
+            "loadErrors": self._stats["loadErrors"],
+            "evictions": self._stats["evictions"],
+            "invalidations": self._stats["invalidations"],
+            "hitRatio": round(served / lookups, 4) if lookups else 0.0,
+        }
+
+
+def ttl_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Métricas de todos los AsyncTTLCache del proceso, por nombre."""
+    return {name: cache.stats() for name, cache in _caches.items()}
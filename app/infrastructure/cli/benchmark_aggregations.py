@@ -0,0 +1,175 @@
+"""
+Benchmark de las estadísticas agregadas: conteo en Python sobre find_many
+(implementación anterior) contra group_by en la base de datos.
+
+Siembra filas sintéticas con generate_series (ids con prefijo "bench-") en
+diagnosis_sessions, problem_classifications y sentiment_analyses. Usar solo
+contra una base de datos de desarrollo.
+
+Uso:
+    python -m app.infrastructure.cli.benchmark_aggregations --seed --rows 1000000
+    python -m app.infrastructure.cli.benchmark_aggregations --repeat 5
+    python -m app.infrastructure.cli.benchmark_aggregations --cleanup
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List
+
+from app.infrastructure.config.database import (
+    initialize_database,
+    close_database,
+    get_prisma_client
+)
+from app.infrastructure.repositories import (
+    PrismaProblemClassificationRepository,
+    PrismaSentimentAnalysisRepository
+)
+from app.domain.value_objects import ProblemCategory
+
+
+logger = logging.getLogger(__name__)
+
+SEED_SESSIONS_SQL = """
+INSERT INTO diagnosis_sessions (id, "userId", "vehicleId", status, "startedAt", "updatedAt", "detectedSymptoms")
+SELECT 'bench-' || g, 'bench-user-' || (g % 50000), 'bench-vehicle-' || (g % 80000),
+       'COMPLETED'::"SessionStatus", now() - (g % 365) * interval '1 day', now(), '{}'
+FROM generate_series(1, $1) AS g
+"""
+
+SEED_CLASSIFICATIONS_SQL = """
+INSERT INTO problem_classifications (id, "sessionId", category, "confidenceScore", symptoms, "createdAt")
+SELECT 'bench-' || g, 'bench-' || g,
+       (ARRAY['ENGINE','TRANSMISSION','BRAKES','ELECTRICAL','AIR_CONDITIONING','SUSPENSION','EXHAUST',
+              'FUEL_SYSTEM','COOLING_SYSTEM','TIRES','BATTERY','LIGHTS','OTHER'])[1 + g % 13]::"ProblemCategory",
+       0.5 + (g % 50) / 100.0, '{}', now() - (g % 365) * interval '1 day'
+FROM generate_series(1, $1) AS g
+"""
+
+SEED_SENTIMENTS_SQL = """
+INSERT INTO sentiment_analyses (id, text, context, "workshopId", label, score, scores, "analyzedAt")
+SELECT 'bench-' || g, 'benchmark', '{"source": "benchmark"}'::jsonb, 'bench-workshop-' || (g % 500),
+       (ARRAY['POSITIVE','NEUTRAL','NEGATIVE'])[1 + g % 3]::"SentimentLabel",
+       0.5 + (g % 50) / 100.0, '{}'::jsonb, now() - (g % 365) * interval '1 day'
+FROM generate_series(1, $1) AS g
+"""
+
+
+async def seed(rows: int) -> None:
+
+    prisma = get_prisma_client()
+
+    for name, sql in (
+        ("diagnosis_sessions", SEED_SESSIONS_SQL),
+        ("problem_classifications", SEED_CLASSIFICATIONS_SQL),
+        ("sentiment_analyses", SEED_SENTIMENTS_SQL),
+    ):
+        started = time.perf_counter()
+        await prisma.execute_raw(sql, rows)
+        logger.info(f"{rows} filas en {name} ({time.perf_counter() - started:.1f} s)")
+
+    await prisma.execute_raw("ANALYZE diagnosis_sessions, problem_classifications, sentiment_analyses")
+
+
+async def cleanup() -> None:
+
+    prisma = get_prisma_client()
+
+    # problem_classifications se borra en cascada con las sesiones
+    await prisma.execute_raw("DELETE FROM diagnosis_sessions WHERE id LIKE 'bench-%'")
+    await prisma.execute_raw("DELETE FROM sentiment_analyses WHERE id LIKE 'bench-%'")
+
+
+async def _legacy_category_distribution(prisma) -> Dict[str, int]:
+    classifications = await prisma.problemclassification.find_many(select={"category": True})
+    distribution = {}
+    for c in classifications:
+        distribution[c.category] = distribution.get(c.category, 0) + 1
+    return distribution
+
+
+async def _legacy_average_confidence(prisma, category: str) -> float:
+    classifications = await prisma.problemclassification.find_many(
+        where={"category": category},
+        select={"confidenceScore": True}
+    )
+    if not classifications:
+        return 0.0
+    return sum(c.confidenceScore for c in classifications) / len(classifications)
+
+
+async def _legacy_sentiment_distribution(prisma) -> Dict[str, int]:
+    sentiments = await prisma.sentimentanalysis.find_many(select={"label": True})
+    distribution = {}
+    for s in sentiments:
+        distribution[s.label] = distribution.get(s.label, 0) + 1
+    return distribution
+
+
+async def _time(fn: Callable[[], Awaitable], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def run_benchmark(repeat: int) -> None:
+
+    prisma = get_prisma_client()
+    classification_repo = PrismaProblemClassificationRepository(prisma)
+    sentiment_repo = PrismaSentimentAnalysisRepository(prisma)
+    engine = ProblemCategory.from_string("ENGINE")
+
+    cases = [
+        ("category_distribution", lambda: _legacy_category_distribution(prisma), classification_repo.get_category_distribution),
+        ("average_confidence", lambda: _legacy_average_confidence(prisma, "ENGINE"), lambda: classification_repo.get_average_confidence_by_category(engine)),
+        ("sentiment_distribution", lambda: _legacy_sentiment_distribution(prisma), sentiment_repo.get_sentiment_distribution),
+    ]
+
+    print(f"{'consulta':<26}{'find_many (ms)':>16}{'group_by (ms)':>16}{'speedup':>10}")
+    for name, legacy, aggregated in cases:
+        legacy_ms = statistics.median(await _time(legacy, repeat))
+        aggregated_ms = statistics.median(await _time(aggregated, repeat))
+        print(f"{name:<26}{legacy_ms:>16.1f}{aggregated_ms:>16.1f}{legacy_ms / aggregated_ms:>9.1f}x")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark de agregaciones en base de datos contra conteo en Python"
+    )
+    parser.add_argument("--seed", action="store_true", help="Siembra filas sintéticas antes de medir")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Filas por tabla al sembrar")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por consulta (se reporta la mediana)")
+    parser.add_argument("--cleanup", action="store_true", help="Borra las filas sintéticas y termina")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = _parse_args()
+
+    await initialize_database()
+
+    try:
+        if args.cleanup:
+            await cleanup()
+            return
+
+        if args.seed:
+            await seed(args.rows)
+
+        await run_benchmark(args.repeat)
+    finally:
+        await close_database()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    asyncio.run(main())
@@ -0,0 +1,208 @@
+"""
+Benchmark del puntaje de talleres: implementación escalar (un taller a la vez
+con math y sort de la lista completa) contra la vectorizada con NumPy y
+argpartition.
+
+Las funciones escalares de este módulo son la referencia de las fórmulas de
+workshop_scoring; el servicio solo usa la versión vectorizada.
+
+No usa red ni base de datos: genera talleres sintéticos alrededor de un punto.
+
+Uso:
+    python -m app.infrastructure.cli.benchmark_recommender
+    python -m app.infrastructure.cli.benchmark_recommender --sizes 10 1000 100000 --repeat 7
+"""
+
+import argparse
+import math
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from app.infrastructure.services.workshop_catalog import (
+    KNOWN_SPECIALTIES,
+    WorkshopCatalog,
+    WorkshopCatalogProvider
+)
+from app.infrastructure.services.workshop_recommender_service import WorkshopRecommenderService
+from app.infrastructure.services.recommendation_cell_cache import RecommendationCellCache
+from app.infrastructure.services.workshop_scoring import EARTH_RADIUS_KM, haversine_km
+
+
+USER_LAT = 16.7516
+USER_LON = -93.1029
+RADIUS_KM = 50.0
+SPECIALTY = "FRENOS"
+
+
+def _synthetic_workshops(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+
+    rng = random.Random(seed)
+
+    return [
+        {
+            "id": f"bench-{i}",
+            "businessName": f"Taller {i}",
+            "latitude": USER_LAT + rng.uniform(-0.5, 0.5),
+            "longitude": USER_LON + rng.uniform(-0.5, 0.5),
+            "overallRating": round(rng.uniform(0, 5), 1),
+            "specialties": [{"specialtyType": s} for s in rng.sample(KNOWN_SPECIALTIES, 3)]
+        }
+        for i in range(count)
+    ]
+
+
+def scalar_haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+
+    lat1_rad = math.radians(lat1)
+    lon1_rad = math.radians(lon1)
+    lat2_rad = math.radians(lat2)
+    lon2_rad = math.radians(lon2)
+
+    dlat = lat2_rad - lat1_rad
+    dlon = lon2_rad - lon1_rad
+
+    a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return EARTH_RADIUS_KM * c
+
+
+def scalar_specialization_score(specialties: List[Dict[str, Any]], target_specialty: str) -> float:
+    """1.0 con la especialidad exacta, 0.5 si es taller general, 0.0 si no"""
+    specialty_types = [s.get("specialtyType") for s in specialties if s.get("specialtyType")]
+
+    if target_specialty in specialty_types:
+        return 1.0
+
+    if "GENERAL" in specialty_types:
+        return 0.5
+
+    return 0.0
+
+
+def scalar_proximity_score(distance_km: float, max_radius_km: float) -> float:
+    """1.0 hasta 5 km, decae linealmente hasta 0.0 en max_radius_km"""
+    if distance_km <= 5.0:
+        return 1.0
+
+    if distance_km >= max_radius_km:
+        return 0.0
+
+    score = 1.0 - ((distance_km - 5.0) / (max_radius_km - 5.0))
+
+    return max(0.0, min(1.0, score))
+
+
+def scalar_rating_score(rating: float) -> float:
+    if rating <= 0:
+        return 0.0
+
+    return min(rating / 5.0, 1.0)
+
+
+def scalar_match_score(
+    specialties: List[Dict[str, Any]],
+    target_specialty: str,
+    distance_km: float,
+    rating: float,
+    max_radius_km: float
+) -> float:
+
+    match_score = (
+        WorkshopRecommenderService.WEIGHT_SPECIALIZATION * scalar_specialization_score(specialties, target_specialty) +
+        WorkshopRecommenderService.WEIGHT_PROXIMITY * scalar_proximity_score(distance_km, max_radius_km) +
+        WorkshopRecommenderService.WEIGHT_RATING * scalar_rating_score(rating)
+    )
+
+    return round(match_score, 3)
+
+
+def _scalar(service: WorkshopRecommenderService, workshops: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """Implementación anterior: puntaje y razones para cada taller, sort completo."""
+    recommendations = []
+
+    for workshop in workshops:
+        distance_km = scalar_haversine_km(
+            USER_LAT, USER_LON, workshop["latitude"], workshop["longitude"]
+        )
+        recommendations.append({
+            "workshop_id": workshop["id"],
+            "match_score": scalar_match_score(
+                specialties=workshop["specialties"],
+                target_specialty=SPECIALTY,
+                distance_km=distance_km,
+                rating=workshop["overallRating"],
+                max_radius_km=RADIUS_KM
+            ),
+            "reasons": service._generate_reasons(
+                specialties=workshop["specialties"],
+                target_specialty=SPECIALTY,
+                distance_km=distance_km,
+                rating=workshop["overallRating"]
+            )
+        })
+
+    recommendations.sort(key=lambda x: x["match_score"], reverse=True)
+    return recommendations[:limit]
+
+
+def _vectorized(service: WorkshopRecommenderService, catalog: WorkshopCatalog, limit: int) -> List[Dict[str, Any]]:
+    indexes = np.arange(len(catalog))
+    distances = haversine_km(USER_LAT, USER_LON, catalog.latitudes, catalog.longitudes)
+    return service._rank(catalog, indexes, distances, SPECIALTY, RADIUS_KM, limit)
+
+
+def _median_ms(fn: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def run_benchmark(sizes: List[int], repeat: int, limit: int) -> None:
+
+    # Proveedor vacío: el benchmark no depende de settings ni de la red
+    service = WorkshopRecommenderService(
+        catalog_provider=WorkshopCatalogProvider(),
+        cell_cache=RecommendationCellCache()
+    )
+
+    print(f"{'talleres':>10}{'escalar (ms)':>16}{'numpy (ms)':>14}{'speedup':>10}{'mismo top-k':>14}")
+    for size in sizes:
+        workshops = _synthetic_workshops(size)
+        catalog = WorkshopCatalog(workshops, version=0)
+
+        scalar_top = _scalar(service, workshops, limit)
+        vectorized_top = _vectorized(service, catalog, limit)
+        same = [r["workshop_id"] for r in scalar_top] == [r["workshop_id"] for r in vectorized_top]
+
+        scalar_ms = _median_ms(lambda: _scalar(service, workshops, limit), repeat)
+        vectorized_ms = _median_ms(lambda: _vectorized(service, catalog, limit), repeat)
+
+        print(f"{size:>10}{scalar_ms:>16.3f}{vectorized_ms:>14.3f}{scalar_ms / vectorized_ms:>9.1f}x{str(same):>14}")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark del puntaje de talleres escalar contra NumPy"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1_000, 10_000, 100_000],
+                        help="Cantidades de talleres candidatos")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones por tamaño (se reporta la mediana)")
+    parser.add_argument("--limit", type=int, default=3, help="Talleres recomendados (k)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    run_benchmark(args.sizes, args.repeat, args.limit)
+
+
+if __name__ == "__main__":
+    main()
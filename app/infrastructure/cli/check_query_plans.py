@@ -0,0 +1,120 @@
+"""
+Verifica con EXPLAIN que el planificador usa los índices creados para las
+consultas calientes (migración 20261019000000_query_shape_indexes).
+
+Los planes se piden con la configuración normal del planificador, así que
+dependen de las estadísticas de las tablas: correrlo contra una base con
+datos representativos. tests/test_query_plans.py siembra datos y hace la
+misma verificación de forma automática. Sale con código 1 si alguna
+consulta no usa su índice.
+
+Uso:
+    python -m app.infrastructure.cli.check_query_plans
+"""
+
+import asyncio
+import json
+import logging
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from prisma import Prisma
+
+from app.infrastructure.config.database import (
+    initialize_database,
+    close_database,
+    get_prisma_client
+)
+
+
+logger = logging.getLogger(__name__)
+
+# (nombre, consulta con la forma que genera el repositorio, índice esperado)
+QUERY_SHAPES: List[Tuple[str, str, str]] = [
+    (
+        "sessions_by_user",
+        """SELECT id FROM diagnosis_sessions
+           WHERE "userId" = 'plan-check-user'
+           ORDER BY "startedAt" DESC LIMIT 10""",
+        "diagnosis_sessions_userId_startedAt_idx",
+    ),
+    (
+        "sessions_by_user_vehicle",
+        """SELECT id FROM diagnosis_sessions
+           WHERE "userId" = 'plan-check-user' AND "vehicleId" = 'plan-check-vehicle'
+           ORDER BY "startedAt" DESC LIMIT 10""",
+        "diagnosis_sessions_userId_vehicleId_startedAt_idx",
+    ),
+    (
+        "messages_page",
+        """SELECT id FROM diagnosis_messages
+           WHERE "sessionId" = 'plan-check-session'
+           ORDER BY timestamp DESC, id DESC LIMIT 21""",
+        "diagnosis_messages_sessionId_timestamp_id_idx",
+    ),
+    (
+        "sentiment_by_context",
+        """SELECT id FROM sentiment_analyses
+           WHERE context @> '{"appointmentId": "plan-check"}'::jsonb LIMIT 1""",
+        "sentiment_analyses_context_idx",
+    ),
+]
+
+
+def index_names(plan: Dict[str, Any]) -> Iterator[str]:
+    if "Index Name" in plan:
+        yield plan["Index Name"]
+    for child in plan.get("Plans", []):
+        yield from index_names(child)
+
+
+async def explain(client: Prisma, sql: str) -> Dict[str, Any]:
+
+    rows = await client.query_raw(f"EXPLAIN (FORMAT JSON) {sql}")
+
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return plan[0]["Plan"]
+
+
+async def check_query_plans(client: Optional[Prisma] = None) -> bool:
+
+    client = client or get_prisma_client()
+    ok = True
+
+    for name, sql, expected_index in QUERY_SHAPES:
+        plan = await explain(client, sql)
+        used = set(index_names(plan))
+
+        if expected_index in used:
+            logger.info(f"OK    {name}: {expected_index}")
+        else:
+            ok = False
+            logger.error(
+                f"FALLO {name}: se esperaba {expected_index}, "
+                f"el plan usa {sorted(used) or plan['Node Type']}"
+            )
+
+    return ok
+
+
+async def main() -> int:
+
+    await initialize_database()
+
+    try:
+        ok = await check_query_plans()
+    finally:
+        await close_database()
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,225 @@
+"""
+Job offline para reclasificar sesiones históricas con el clasificador actual.
+
+Recorre diagnosis_sessions en bloques (keyset pagination por id), clasifica
+cada bloque con ProblemClassifierService.classify_batch y escribe los
+resultados en bloque. La memoria queda acotada por --batch-size y el cursor
+se guarda después de cada bloque para poder reanudar.
+
+Las sesiones que ya no clasifican conservan su clasificación anterior: se
+reportan aparte y no cuentan como cambio de categoría.
+
+Uso:
+    python -m app.infrastructure.cli.reclassify_sessions --dry-run
+    python -m app.infrastructure.cli.reclassify_sessions --cursor-file .reclassify_cursor
+"""
+
+import argparse
+import asyncio
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from app.infrastructure.config.database import (
+    initialize_database,
+    close_database,
+    get_prisma_client
+)
+from app.infrastructure.cache import initialize_cache, close_cache, get_cache
+from app.infrastructure.repositories import (
+    PrismaDiagnosisSessionRepository,
+    PrismaProblemClassificationRepository,
+    CachedProblemClassificationRepository
+)
+from app.infrastructure.services import ProblemClassifierService
+
+
+logger = logging.getLogger(__name__)
+
+UNCLASSIFIED = "UNCLASSIFIED"
+
+
+class ReclassificationReport:
+
+    def __init__(self):
+        self.scanned = 0
+        self.written = 0
+        self.before = Counter()
+        self.after = Counter()
+        self.transitions = Counter()
+        # Sesiones que ya no clasifican; su fila anterior se conserva
+        self.unclassifiable = Counter()
+
+    def record(self, old_category: str, new_category: str) -> None:
+        self.scanned += 1
+        self.before[old_category] += 1
+        self.after[new_category] += 1
+
+        if old_category != new_category:
+            self.transitions[(old_category, new_category)] += 1
+
+    def record_unclassifiable(self, category: str) -> None:
+        self.record(category, category)
+        self.unclassifiable[category] += 1
+
+    @property
+    def changed(self) -> int:
+        return sum(self.transitions.values())
+
+    def format(self) -> str:
+        lines = [
+            f"Sesiones procesadas: {self.scanned}",
+            f"Clasificaciones con cambio de categoría: {self.changed}",
+            f"Clasificaciones escritas: {self.written}",
+            f"Ya no clasifican (se conserva la anterior): {sum(self.unclassifiable.values())}",
+            "",
+            "Delta por categoría (antes -> después):",
+        ]
+
+        categories = sorted(set(self.before) | set(self.after))
+        for category in categories:
+            before = self.before.get(category, 0)
+            after = self.after.get(category, 0)
+            lines.append(f"  {category:<18} {before:>8} -> {after:<8} ({after - before:+d})")
+
+        if self.transitions:
+            lines.append("")
+            lines.append("Cambios de categoría:")
+            for (old, new), count in self.transitions.most_common():
+                lines.append(f"  {old:<18} -> {new:<18} {count:>8}")
+
+        if self.unclassifiable:
+            lines.append("")
+            lines.append("Ya no clasifican, por categoría conservada:")
+            for category, count in self.unclassifiable.most_common():
+                lines.append(f"  {category:<18} {count:>8}")
+
+        return "\n".join(lines)
+
+
+def _read_cursor(cursor_file: Optional[Path]) -> Optional[str]:
+    if cursor_file and cursor_file.exists():
+        cursor = cursor_file.read_text().strip()
+        return cursor or None
+    return None
+
+
+def _write_cursor(cursor_file: Optional[Path], cursor: str) -> None:
+    if cursor_file:
+        tmp_file = cursor_file.with_suffix(cursor_file.suffix + ".tmp")
+        tmp_file.write_text(cursor)
+        tmp_file.replace(cursor_file)
+
+
+async def reclassify_sessions(
+    batch_size: int = 200,
+    dry_run: bool = False,
+    start_after: Optional[str] = None,
+    cursor_file: Optional[Path] = None,
+    max_sessions: Optional[int] = None
+) -> ReclassificationReport:
+
+    prisma = get_prisma_client()
+    session_repo = PrismaDiagnosisSessionRepository(prisma)
+    classification_repo = PrismaProblemClassificationRepository(prisma)
+    if get_cache() is not None:
+        classification_repo = CachedProblemClassificationRepository(classification_repo, get_cache())
+    classifier = ProblemClassifierService()
+
+    report = ReclassificationReport()
+    cursor = start_after or _read_cursor(cursor_file)
+
+    if cursor:
+        logger.info(f"Reanudando después de la sesión {cursor}")
+
+    while max_sessions is None or report.scanned < max_sessions:
+        limit = batch_size
+        if max_sessions is not None:
+            limit = min(batch_size, max_sessions - report.scanned)
+
+        sessions = await session_repo.find_batch_after(cursor=cursor, limit=limit)
+        if not sessions:
+            break
+
+        session_ids = [str(s.id) for s in sessions]
+        existing = await classification_repo.find_by_session_ids(session_ids)
+        results = await classifier.classify_batch(sessions)
+
+        to_save = []
+        for session, classification in results:
+            session_id = str(session.id)
+            previous = existing.get(session_id)
+
+            old_category = previous.category.value.value if previous else UNCLASSIFIED
+
+            if classification is None:
+                # No se escribe nada: la categoría en la base no cambia
+                if previous is not None:
+                    report.record_unclassifiable(old_category)
+                else:
+                    report.record(UNCLASSIFIED, UNCLASSIFIED)
+                continue
+
+            new_category = classification.category.value.value
+            report.record(old_category, new_category)
+
+            if not dry_run and old_category != new_category:
+                logger.info(f"{session_id}: {old_category} -> {new_category}")
+
+            to_save.append(classification)
+
+        if not dry_run:
+            report.written += await classification_repo.save_many(to_save)
+
+        cursor = session_ids[-1]
+
+        if not dry_run:
+            _write_cursor(cursor_file, cursor)
+            logger.info(f"Bloque procesado ({report.scanned} sesiones), cursor={cursor}")
+
+        if len(sessions) < limit:
+            break
+
+    return report
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Reclasifica sesiones de diagnóstico históricas"
+    )
+    parser.add_argument("--batch-size", type=int, default=200, help="Sesiones por bloque")
+    parser.add_argument("--dry-run", action="store_true", help="Solo imprime los deltas agregados")
+    parser.add_argument("--start-after", default=None, help="Id de sesión desde el que continuar")
+    parser.add_argument("--cursor-file", type=Path, default=None, help="Archivo donde guardar el cursor")
+    parser.add_argument("--max-sessions", type=int, default=None, help="Límite de sesiones a procesar")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = _parse_args()
+
+    await initialize_database()
+    await initialize_cache()
+
+    try:
+        report = await reclassify_sessions(
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            start_after=args.start_after,
+            cursor_file=args.cursor_file,
+            max_sessions=args.max_sessions
+        )
+    finally:
+        await close_cache()
+        await close_database()
+
+    print(report.format())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    asyncio.run(main())
@@ -1,4 +1,15 @@
 
+from .http_pool import (
+    PooledHttpClient,
+    close_http_clients
+)
+
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker_states
+)
+
 from .vehicle_service_client import (
     VehicleServiceClient,
     get_vehicle_service_client
@@ -15,7 +26,20 @@ from .appointment_service_client import (
 )
 
 
+def initialize_http_clients() -> None:
+    """Abre el pool de conexiones de cada cliente singleton (lifespan)."""
+    get_vehicle_service_client().open()
+    get_workshop_service_client().open()
+    get_appointment_service_client().open()
+
+
 __all__ = [
+    "PooledHttpClient",
+    "initialize_http_clients",
+    "close_http_clients",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "get_circuit_breaker_states",
 
     "VehicleServiceClient",
     "get_vehicle_service_client",
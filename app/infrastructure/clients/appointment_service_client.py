@@ -3,16 +3,20 @@ Cliente HTTP para comunicarse con el Appointment Service.
 """
 
 from typing import List, Dict, Any, Optional
-import httpx
 from datetime import datetime
 
+from app.infrastructure.clients.http_pool import PooledHttpClient
 
-class AppointmentServiceClient:
+
+class AppointmentServiceClient(PooledHttpClient):
     """
     Cliente para interactuar con el microservicio de citas (appointment-service).
     """
     
+    upstream = "appointment-service"
+    
     def __init__(self, base_url: str = "https://appointment-service-autodiag.onrender.com/api"):
+        super().__init__()
         self.base_url = base_url.rstrip("/")
         self.timeout = 10.0
     
@@ -48,18 +52,17 @@ class AppointmentServiceClient:
             if admin_token:
                 headers["Authorization"] = f"Bearer {admin_token}"
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/appointments",
-                    params=params,
-                    headers=headers
-                )
-                
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    print(f"Error obteniendo citas: {response.status_code}")
-                    return []
+            response = await self.http.get(
+                f"{self.base_url}/appointments",
+                params=params,
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                return response.json()
+            else:
+                print(f"Error obteniendo citas: {response.status_code}")
+                return []
                     
         except Exception as e:
             print(f"Error en AppointmentServiceClient.get_all_appointments: {e}")
@@ -85,15 +88,14 @@ class AppointmentServiceClient:
             Número total de citas
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/stats/count")
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("total", 0)
-                else:
-                    print(f"Error obteniendo conteo de citas: {response.status_code}")
-                    return 0
+            response = await self.http.get(f"{self.base_url}/stats/count")
+            
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("total", 0)
+            else:
+                print(f"Error obteniendo conteo de citas: {response.status_code}")
+                return 0
                     
         except Exception as e:
             print(f"Error en AppointmentServiceClient.count_appointments: {e}")
@@ -129,26 +131,30 @@ class AppointmentServiceClient:
             if admin_token:
                 headers["Authorization"] = f"Bearer {admin_token}"
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/workshops/{workshop_id}/appointments",
-                    params=params,
-                    headers=headers
-                )
-                
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    print(f"Error obteniendo citas del taller: {response.status_code}")
-                    return []
+            response = await self.http.get(
+                f"{self.base_url}/workshops/{workshop_id}/appointments",
+                params=params,
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                return response.json()
+            else:
+                print(f"Error obteniendo citas del taller: {response.status_code}")
+                return []
                     
         except Exception as e:
             print(f"Error en AppointmentServiceClient.get_workshop_appointments: {e}")
             return []
 
 
+_client_instance: Optional[AppointmentServiceClient] = None
+
 def get_appointment_service_client() -> AppointmentServiceClient:
     """
     Factory function para obtener instancia del cliente de appointments.
     """
-    return AppointmentServiceClient()
+    global _client_instance
+    if _client_instance is None:
+        _client_instance = AppointmentServiceClient()
+    return _client_instance
@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import httpx
+
+from app.infrastructure.config.settings import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """
+    El circuito del servicio está abierto y la llamada se rechaza sin salir a
+    la red. Hereda de httpx.HTTPError para que los clientes caigan en sus
+    fallbacks existentes (ubicación por defecto, lista vacía, None).
+    """
+
+    def __init__(self, upstream: str, retry_in_seconds: float):
+        super().__init__(f"Circuito abierto para {upstream}; reintento en {retry_in_seconds:.0f}s")
+        self.upstream = upstream
+        self.retry_in_seconds = retry_in_seconds
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker por servicio con ventana deslizante de tiempo.
+
+    Se abre cuando, con al menos min_calls en la ventana, la tasa de errores
+    (excepciones o 5xx) o la de llamadas lentas supera su umbral. Abierto,
+    rechaza las llamadas durante open_seconds; después deja pasar una sola
+    llamada de prueba (half-open) que lo cierra o lo vuelve a abrir.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 3.0,
+        slow_call_rate_threshold: float = 0.8,
+        window_seconds: float = 30.0,
+        min_calls: int = 10,
+        open_seconds: float = 30.0
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        # (instante, falló, fue lenta)
+        self._calls: Deque[Tuple[float, bool, bool]] = deque()
+        self._rejected = 0
+
+    def before_call(self) -> None:
+
+        if self.state == CLOSED:
+            return
+
+        now = time.monotonic()
+
+        if self.state == OPEN:
+            retry_in = self._opened_at + self.open_seconds - now
+            if retry_in > 0:
+                self._rejected += 1
+                raise CircuitOpenError(self.name, retry_in)
+            self.state = HALF_OPEN
+            logger.info(f"Circuito {self.name}: half-open, probando el servicio")
+
+        if self._probe_in_flight:
+            self._rejected += 1
+            raise CircuitOpenError(self.name, 0.0)
+
+        self._probe_in_flight = True
+
+    def record(self, failed: bool, duration_seconds: float) -> None:
+
+        now = time.monotonic()
+        slow = duration_seconds >= self.slow_call_seconds
+
+        if self.state == HALF_OPEN:
+            self._probe_in_flight = False
+            if failed or slow:
+                self._open(now)
+            else:
+                self.state = CLOSED
+                self._calls.clear()
+                logger.info(f"Circuito {self.name}: cerrado")
+            return
+
+        self._calls.append((now, failed, slow))
+        self._trim(now)
+
+        if self.state == CLOSED and len(self._calls) >= self.min_calls:
+            failure_rate, slow_rate = self._rates()
+            if failure_rate >= self.failure_rate_threshold or slow_rate >= self.slow_call_rate_threshold:
+                self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self._opened_at = now
+        self._probe_in_flight = False
+        logger.warning(f"Circuito {self.name}: abierto por {self.open_seconds:.0f}s")
+
+    def _trim(self, now: float) -> None:
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+
+    def _rates(self) -> Tuple[float, float]:
+        total = len(self._calls)
+        if not total:
+            return 0.0, 0.0
+
+        failures = sum(1 for _, failed, _ in self._calls if failed)
+        slow = sum(1 for _, _, is_slow in self._calls if is_slow)
+        return failures / total, slow / total
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        self._trim(now)
+        failure_rate, slow_rate = self._rates()
+
+        data = {
+            "state": self.state,
+            "calls": len(self._calls),
+            "failureRate": round(failure_rate, 4),
+            "slowCallRate": round(slow_rate, 4),
+            "rejected": self._rejected,
+        }
+        if self.state == OPEN:
+            data["retryInSeconds"] = round(max(0.0, self._opened_at + self.open_seconds - now), 1)
+
+        return data
+
+
+class CircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """Transporte httpx que pasa cada petición por el circuit breaker del servicio."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, breaker: CircuitBreaker):
+        self._transport = transport
+        self._breaker = breaker
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+
+        self._breaker.before_call()
+        started = time.perf_counter()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except asyncio.CancelledError:
+            # Cancelada por un deadline del llamador: cuenta solo como lenta
+            self._breaker.record(False, time.perf_counter() - started)
+            raise
+        except Exception:
+            self._breaker.record(True, time.perf_counter() - started)
+            raise
+
+        self._breaker.record(response.status_code >= 500, time.perf_counter() - started)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+
+    breaker = _breakers.get(name)
+
+    if breaker is None:
+        settings = get_settings()
+        breaker = CircuitBreaker(
+            name,
+            failure_rate_threshold=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+            slow_call_seconds=settings.CIRCUIT_BREAKER_SLOW_CALL_SECONDS,
+            slow_call_rate_threshold=settings.CIRCUIT_BREAKER_SLOW_CALL_RATE,
+            window_seconds=settings.CIRCUIT_BREAKER_WINDOW_SECONDS,
+            min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+            open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS
+        )
+        _breakers[name] = breaker
+
+    return breaker
+
+
+def get_circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Estado de los circuit breakers por servicio, para /health."""
+    return {name: breaker.snapshot() for name, breaker in _breakers.items()}
@@ -0,0 +1,97 @@
+import logging
+from typing import List, Optional
+
+import httpx
+
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.clients.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerTransport,
+    get_circuit_breaker
+)
+
+
+logger = logging.getLogger(__name__)
+
+_open_clients: List["PooledHttpClient"] = []
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_async_client(timeout: float, breaker: CircuitBreaker) -> httpx.AsyncClient:
+    """
+    AsyncClient con los límites del pool y keep-alive de settings. HTTP/2 se
+    activa solo si se pidió y el paquete h2 está instalado; si no, HTTP/1.1.
+    Cada petición pasa por el circuit breaker del servicio.
+    """
+    settings = get_settings()
+
+    http2 = settings.HTTP_CLIENT_HTTP2
+    if http2 and not _http2_available():
+        logger.warning("HTTP_CLIENT_HTTP2 activo pero h2 no está instalado; se usa HTTP/1.1")
+        http2 = False
+
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS
+        )
+    )
+
+    return httpx.AsyncClient(
+        timeout=timeout,
+        transport=CircuitBreakerTransport(transport, breaker)
+    )
+
+
+class PooledHttpClient:
+    """
+    Base de los clientes de servicios externos: un solo AsyncClient por
+    proceso, así las conexiones (DNS, TCP, TLS) se reutilizan entre
+    peticiones. Se abre en el lifespan; si se usa antes (CLI, scripts) se
+    crea al primer uso.
+    """
+
+    timeout: float = 10.0
+    upstream: str = "upstream"
+
+    def __init__(self):
+        self._http: Optional[httpx.AsyncClient] = None
+        self.breaker = get_circuit_breaker(self.upstream)
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self.open()
+        return self._http
+
+    def open(self) -> None:
+        if self._http is not None and not self._http.is_closed:
+            return
+
+        self._http = create_async_client(self.timeout, self.breaker)
+        if self not in _open_clients:
+            _open_clients.append(self)
+
+    async def close(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+
+async def close_http_clients() -> None:
+
+    while _open_clients:
+        client = _open_clients.pop()
+        try:
+            await client.close()
+        except Exception as e:
+            logger.error(f"Error cerrando cliente HTTP {type(client).__name__}: {e}")
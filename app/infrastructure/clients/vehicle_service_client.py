@@ -1,14 +1,22 @@
+import logging
 from typing import Optional, Dict, Any, Union
-import httpx
 from datetime import datetime
 from uuid import UUID
 
 from app.infrastructure.config.settings import get_settings
+from app.infrastructure.clients.http_pool import PooledHttpClient
+from app.infrastructure.cache import AsyncTTLCache
 
 
-class VehicleServiceClient:
+logger = logging.getLogger(__name__)
+
+
+class VehicleServiceClient(PooledHttpClient):
+    
+    upstream = "vehicle-service"
     
     def __init__(self):
+        super().__init__()
         self.settings = get_settings()
         self.base_url = self.settings.VEHICLE_SERVICE_URL
         # Asegurar que la URL incluya /api
@@ -19,49 +27,79 @@ class VehicleServiceClient:
                 self.base_url = self.base_url + '/api'
         self.timeout = 10.0
         
-    async def get_vehicle(
-        self,
-        vehicle_id: str,
-        user_id: str,
-        auth_token: str
-    ) -> Optional[Dict[str, Any]]:
-
-        url = f"{self.base_url}/vehicles/{vehicle_id}"
-        
+        # Dueño y ubicación por (vehicleId, userId). Los 404 se cachean como
+        # None con un TTL más corto; los errores no se cachean.
+        self.location_cache = AsyncTTLCache(
+            "vehicle_location",
+            ttl_seconds=self.settings.VEHICLE_CACHE_TTL_SECONDS,
+            max_entries=self.settings.VEHICLE_CACHE_MAX_ENTRIES,
+            cache_none=True,
+            negative_ttl_seconds=self.settings.VEHICLE_CACHE_NEGATIVE_TTL_SECONDS
+        )
+    
+    def _headers(self, auth_token: str) -> Dict[str, str]:
         if auth_token and not auth_token.startswith("Bearer "):
             auth_token = f"Bearer {auth_token}"
 
-        headers = {
+        return {
             "Authorization": auth_token,
             "Content-Type": "application/json",
             "Accept": "application/json",
             "User-Agent": "AutoDiag-DiagnosisService/1.0"
         }
         
+    async def get_vehicle_location(
+        self,
+        vehicle_id: str,
+        user_id: str,
+        auth_token: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Dueño y ubicación del vehículo (id, ownerId, latitude, longitude) desde
+        cache. None si no existe, no es del usuario o el servicio falla.
+        """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code == 404:
-                    return None
-                
-                if response.status_code in [401, 403]:
-                    print(f"DEBUG: Vehicle Auth Error {response.status_code}")
-                    return None
-                
-                response.raise_for_status()
-                
-                vehicle = response.json()
-                
-                if vehicle.get("ownerId") != user_id:
-                    return None
-                
-                return vehicle
-                
+            location = await self.location_cache.get_or_load(
+                f"{vehicle_id}:{user_id}",
+                lambda: self._fetch_vehicle_location(vehicle_id, auth_token)
+            )
         except Exception as e:
-            print(f"DEBUG: Vehicle Service Error: {e}")
+            logger.warning(f"Error consultando vehículo {vehicle_id} en vehicle-service: {e!r}")
+            return None
+        
+        if not location or location.get("ownerId") != user_id:
+            return None
+        
+        return location
+    
+    async def _fetch_vehicle_location(
+        self,
+        vehicle_id: str,
+        auth_token: str
+    ) -> Optional[Dict[str, Any]]:
+
+        url = f"{self.base_url}/vehicles/{vehicle_id}"
+        
+        response = await self.http.get(url, headers=self._headers(auth_token), follow_redirects=True)
+        
+        if response.status_code == 404:
             return None
+        
+        response.raise_for_status()
+        
+        vehicle = response.json()
+        
+        return {
+            "id": vehicle.get("id", vehicle_id),
+            "ownerId": vehicle.get("ownerId"),
+            "latitude": vehicle.get("latitude"),
+            "longitude": vehicle.get("longitude")
+        }
     
+    async def invalidate_vehicle_location(self, vehicle_id: str, user_id: str) -> None:
+
+        await self.location_cache.invalidate(f"{vehicle_id}:{user_id}")
+        
     async def validate_vehicle_ownership(
         self,
         vehicle_id: str,
@@ -69,7 +107,7 @@ class VehicleServiceClient:
         auth_token: str
     ) -> bool:
         try:
-            vehicle = await self.get_vehicle(vehicle_id, user_id, auth_token)
+            vehicle = await self.get_vehicle_location(vehicle_id, user_id, auth_token)
             return vehicle is not None
         except Exception:
             return False
@@ -112,17 +150,16 @@ class VehicleServiceClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=headers
-                )
-                
-                if response.status_code != 201:
-                    return None
-                
-                return response.json()
+            response = await self.http.post(
+                url,
+                json=payload,
+                headers=headers
+            )
+            
+            if response.status_code != 201:
+                return None
+            
+            return response.json()
                 
         except Exception:
             return None
@@ -141,14 +178,13 @@ class VehicleServiceClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code != 200:
-                    return None
-                
-                vehicle = response.json()
-                return vehicle.get("currentMileage")
+            response = await self.http.get(url, headers=headers)
+            
+            if response.status_code != 200:
+                return None
+            
+            vehicle = response.json()
+            return vehicle.get("currentMileage")
                 
         except Exception:
             return None
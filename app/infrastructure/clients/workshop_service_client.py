@@ -1,19 +1,36 @@
 
-from typing import Optional, Dict, Any, List
+import asyncio
+import logging
+from typing import Optional, Dict, Any, List, Iterable
 import httpx
 
 from app.infrastructure.config.settings import get_settings
+from app.infrastructure.clients.http_pool import PooledHttpClient
+from app.infrastructure.cache import AsyncTTLCache
 from app.domain.value_objects.problem_category import ProblemCategory
 
 
-class WorkshopServiceClient:
+logger = logging.getLogger(__name__)
 
+
+class WorkshopServiceClient(PooledHttpClient):
+
+    upstream = "workshop-service"
     
     def __init__(self):
 
+        super().__init__()
         self.settings = get_settings()
         self.base_url = self.settings.WORKSHOP_SERVICE_URL
         self.timeout = 10.0
+        
+        # Detalles de taller (nombre, dirección, teléfono, especialidades)
+        self.workshop_cache = AsyncTTLCache(
+            "workshop",
+            ttl_seconds=self.settings.WORKSHOP_CACHE_TTL_SECONDS,
+            stale_seconds=self.settings.WORKSHOP_CACHE_STALE_SECONDS,
+            max_entries=self.settings.WORKSHOP_CACHE_MAX_ENTRIES
+        )
     
     async def get_workshop(
         self,
@@ -21,6 +38,21 @@ class WorkshopServiceClient:
         auth_token: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
 
+        return await self.workshop_cache.get_or_load(
+            str(workshop_id),
+            lambda: self._fetch_workshop(workshop_id, auth_token)
+        )
+    
+    async def invalidate_workshop(self, workshop_id: str) -> None:
+
+        await self.workshop_cache.invalidate(str(workshop_id))
+    
+    async def _fetch_workshop(
+        self,
+        workshop_id: str,
+        auth_token: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+
         url = f"{self.base_url}/api/workshops/{workshop_id}"
         
         headers = {"Content-Type": "application/json"}
@@ -28,18 +60,46 @@ class WorkshopServiceClient:
             headers["Authorization"] = auth_token
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code == 404:
-                    return None
-                
-                response.raise_for_status()
-                return response.json()
+            response = await self.http.get(url, headers=headers)
+            
+            if response.status_code == 404:
+                return None
+            
+            response.raise_for_status()
+            return response.json()
                 
         except httpx.HTTPError:
             return None
     
+    async def get_workshops_by_ids(
+        self,
+        workshop_ids: Iterable[str],
+        auth_token: Optional[str] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Obtiene varios talleres en paralelo, con concurrencia acotada y un
+        límite de tiempo por consulta. Un taller que falla o no responde a
+        tiempo queda como None sin afectar a los demás.
+        """
+        ids = list(dict.fromkeys(workshop_ids))
+        semaphore = asyncio.Semaphore(self.settings.WORKSHOP_ENRICHMENT_CONCURRENCY)
+        deadline = self.settings.WORKSHOP_ENRICHMENT_TIMEOUT_SECONDS
+        
+        async def fetch(workshop_id: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self.get_workshop(workshop_id, auth_token),
+                        timeout=deadline
+                    )
+                except Exception as e:
+                    logger.warning(f"Error obteniendo taller {workshop_id}: {e!r}")
+                    return None
+        
+        results = await asyncio.gather(*(fetch(workshop_id) for workshop_id in ids))
+        
+        return dict(zip(ids, results))
+    
     async def search_nearby_workshops(
         self,
         latitude: float,
@@ -66,13 +126,12 @@ class WorkshopServiceClient:
             params["minRating"] = min_rating
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                
-                if response.status_code != 200:
-                    return []
-                
-                return response.json()
+            response = await self.http.get(url, params=params)
+            
+            if response.status_code != 200:
+                return []
+            
+            return response.json()
                 
         except httpx.HTTPError:
             return []
@@ -100,29 +159,28 @@ class WorkshopServiceClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                
-                if response.status_code != 200:
-                    return []
-                
-                workshops = response.json().get("workshops", [])
+            response = await self.http.get(url, params=params)
+            
+            if response.status_code != 200:
+                return []
+            
+            workshops = response.json().get("workshops", [])
+            
+            filtered = []
+            for workshop in workshops:
+                specialties = workshop.get("specialties", [])
+                has_specialty = any(
+                    s.get("specialtyType") == specialty 
+                    for s in specialties
+                )
                 
-                filtered = []
-                for workshop in workshops:
-                    specialties = workshop.get("specialties", [])
-                    has_specialty = any(
-                        s.get("specialtyType") == specialty 
-                        for s in specialties
-                    )
-                    
-                    if has_specialty:
-                        filtered.append(workshop)
-                    
-                    if len(filtered) >= limit:
-                        break
+                if has_specialty:
+                    filtered.append(workshop)
                 
-                return filtered
+                if len(filtered) >= limit:
+                    break
+            
+            return filtered
                 
         except httpx.HTTPError:
             return []
@@ -142,18 +200,17 @@ class WorkshopServiceClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                
-                if response.status_code != 200:
-                    return []
-                
-                data = response.json()
-                
-                if isinstance(data, dict):
-                    return data.get("reviews", [])
-                
-                return data
+            response = await self.http.get(url, params=params)
+            
+            if response.status_code != 200:
+                return []
+            
+            data = response.json()
+            
+            if isinstance(data, dict):
+                return data.get("reviews", [])
+            
+            return data
                 
         except httpx.HTTPError:
             return []
@@ -215,6 +272,28 @@ class WorkshopServiceClient:
         Returns:
             Dict con 'data' (lista de talleres) y 'total' (count total)
         """
+        try:
+            return await self.fetch_workshops_page(page, limit, min_rating, admin_token)
+        except (httpx.HTTPError, ValueError):
+            return {"data": [], "total": 0}
+    
+    async def fetch_workshops_page(
+        self,
+        page: int = 1,
+        limit: int = 100,
+        min_rating: Optional[float] = None,
+        admin_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Igual que get_workshops pero sin fallback: un error HTTP (incluido el
+        circuito abierto) o una respuesta con formato inesperado se propagan.
+        La usa la sincronización del catálogo, que no puede confundir una
+        página fallida con el final del listado.
+        
+        Raises:
+            httpx.HTTPError: Si la petición falla o no responde 200
+            ValueError: Si la respuesta no tiene el formato esperado
+        """
         # Usar el path completo que funciona en Postman
         url = f"{self.base_url}/api/workshops/workshops"
         
@@ -230,26 +309,19 @@ class WorkshopServiceClient:
         if admin_token:
             headers["Authorization"] = f"Bearer {admin_token}"
         
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params, headers=headers)
-                
-                if response.status_code != 200:
-                    return {"data": [], "total": 0}
-                
-                result = response.json()
-                
-                # Si la respuesta tiene formato de paginación
-                if isinstance(result, dict) and "data" in result:
-                    return result
-                # Si es un array directo
-                elif isinstance(result, list):
-                    return {"data": result, "total": len(result)}
-                else:
-                    return {"data": [], "total": 0}
-                    
-        except httpx.HTTPError:
-            return {"data": [], "total": 0}
+        response = await self.http.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        
+        result = response.json()
+        
+        # Si la respuesta tiene formato de paginación
+        if isinstance(result, dict) and "data" in result:
+            return result
+        # Si es un array directo
+        if isinstance(result, list):
+            return {"data": result, "total": len(result)}
+        
+        raise ValueError(f"Respuesta inesperada de {url}: {type(result).__name__}")
     
     async def get_review_statistics(
         self,
@@ -273,17 +345,16 @@ class WorkshopServiceClient:
             headers["Authorization"] = auth_token
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
+            response = await self.http.get(url, headers=headers)
 
-                if response.status_code != 200:
-                    return {
-                        "totalReviews": 0,
-                        "averageRating": 0.0,
-                        "ratingDistribution": {}
-                    }
+            if response.status_code != 200:
+                return {
+                    "totalReviews": 0,
+                    "averageRating": 0.0,
+                    "ratingDistribution": {}
+                }
 
-                return response.json()
+            return response.json()
 
         except httpx.HTTPError:
             return {
@@ -350,10 +421,11 @@ class WorkshopServiceClient:
             headers["Authorization"] = auth_token
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            response = await self.http.post(url, json=payload, headers=headers)
+            response.raise_for_status()
+            # La calificación del taller cambia con la nueva reseña
+            await self.invalidate_workshop(workshop_id)
+            return response.json()
 
         except httpx.HTTPError as e:
             print(f"Error creando reseña: {e}")
@@ -1,13 +1,19 @@
 
 
 from .settings import settings, Settings, get_settings
-from .database import get_prisma_client, initialize_database, close_database
+from .database import (
+    get_prisma_client,
+    get_read_prisma_client,
+    initialize_database,
+    close_database,
+)
 
 __all__ = [
     "settings",
     "Settings",
     "get_settings",
     "get_prisma_client",
+    "get_read_prisma_client",
     "initialize_database",
     "close_database",
 ]
\ No newline at end of file
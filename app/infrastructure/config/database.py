@@ -1,14 +1,109 @@
 
 from prisma import Prisma
 from typing import Optional
+from datetime import timedelta
+from contextvars import ContextVar
+import asyncio
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 import logging
 
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.metrics import get_query_metrics
+
 logger = logging.getLogger(__name__)
 
 
 
+class InstrumentedPrisma(Prisma):
+    """
+    Cliente Prisma que mide cada consulta (modelo y operación) y registra
+    las consultas lentas.
+    """
+    
+    async def _execute(self, **kwargs):
+        model = kwargs.get("model")
+        model_name = model.__name__ if model is not None else "raw"
+        operation = kwargs.get("method", "unknown")
+        
+        metrics = get_query_metrics()
+        started = metrics.start()
+        try:
+            result = await super()._execute(**kwargs)
+        except Exception:
+            metrics.finish(model_name, operation, started, error=True)
+            raise
+        
+        metrics.finish(model_name, operation, started)
+        return result
+
+
+class ReplicaPrisma(InstrumentedPrisma):
+    """
+    Cliente de la réplica de lectura. Si la réplica está marcada como caída
+    la consulta va directo al primario; si una consulta falla en la réplica,
+    se marca como caída y esa misma consulta se repite en el primario. El
+    monitor periódico la vuelve a habilitar cuando responde.
+    """
+    
+    async def _execute(self, **kwargs):
+        if _replica_probe.get():
+            return await super()._execute(**kwargs)
+        
+        if not _replica_healthy:
+            return await get_prisma_client()._execute(**kwargs)
+        
+        try:
+            return await super()._execute(**kwargs)
+        except Exception as e:
+            _mark_replica_unhealthy(e)
+            return await get_prisma_client()._execute(**kwargs)
+
+
+def build_datasource_url(
+    url: str,
+    connection_limit: Optional[int],
+    pool_timeout_seconds: Optional[int]
+) -> str:
+    """
+    Agrega connection_limit y pool_timeout a la URL de Postgres, sin pisar
+    valores que ya vengan en DATABASE_URL.
+    """
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    
+    if connection_limit is not None:
+        query.setdefault("connection_limit", str(connection_limit))
+    if pool_timeout_seconds is not None:
+        query.setdefault("pool_timeout", str(pool_timeout_seconds))
+    
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _create_client(url: str, client_class: type = InstrumentedPrisma) -> Prisma:
+
+    settings = get_settings()
+    
+    return client_class(
+        datasource={
+            "url": build_datasource_url(
+                url,
+                settings.DATABASE_CONNECTION_LIMIT,
+                settings.DATABASE_POOL_TIMEOUT_SECONDS
+            )
+        },
+        connect_timeout=timedelta(seconds=settings.DATABASE_CONNECT_TIMEOUT_SECONDS)
+    )
+
+
 _prisma_client: Optional[Prisma] = None
 
+# Réplica de solo lectura opcional (DATABASE_REPLICA_URL)
+_replica_client: Optional[Prisma] = None
+_replica_healthy: bool = False
+_replica_last_error: Optional[str] = None
+# Activo durante el chequeo de salud: la réplica no cae al primario
+_replica_probe: ContextVar[bool] = ContextVar("replica_probe", default=False)
+
 
 def get_prisma_client() -> Prisma:
 
@@ -30,7 +125,7 @@ async def initialize_database() -> None:
     try:
         logger.info("Iniciando Prisma client...")
         
-        _prisma_client = Prisma()
+        _prisma_client = _create_client(get_settings().DATABASE_URL)
         
         await _prisma_client.connect()
         
@@ -41,9 +136,88 @@ async def initialize_database() -> None:
         raise
 
 
+def get_read_prisma_client() -> Prisma:
+    """
+    Cliente para consultas de solo lectura de analytics. Usa la réplica si
+    está configurada y sana; si no, el primario. Las consultas que fallan en
+    la réplica se repiten en el primario (ReplicaPrisma).
+    """
+    if _replica_client is not None and _replica_healthy:
+        return _replica_client
+    
+    return get_prisma_client()
+
+
+async def initialize_read_replica() -> bool:
+
+    global _replica_client
+    
+    replica_url = get_settings().DATABASE_REPLICA_URL
+    if not replica_url:
+        return False
+    
+    _replica_client = _create_client(replica_url, ReplicaPrisma)
+    await _check_replica()
+    
+    return True
+
+
+async def _check_replica() -> bool:
+
+    global _replica_healthy, _replica_last_error
+    
+    probe = _replica_probe.set(True)
+    try:
+        if not _replica_client.is_connected():
+            await _replica_client.connect()
+        
+        await _replica_client.execute_raw("SELECT 1")
+        
+        if not _replica_healthy:
+            logger.info("Réplica de lectura disponible")
+        _replica_healthy = True
+        _replica_last_error = None
+        
+    except Exception as e:
+        if _replica_healthy or _replica_last_error is None:
+            logger.error(f"Réplica de lectura no disponible, se usa el primario: {str(e)}")
+        _replica_healthy = False
+        _replica_last_error = str(e)
+    finally:
+        _replica_probe.reset(probe)
+    
+    return _replica_healthy
+
+
+def _mark_replica_unhealthy(error: Exception) -> None:
+
+    global _replica_healthy, _replica_last_error
+    
+    if _replica_healthy:
+        logger.error(f"Consulta fallida en la réplica de lectura, se usa el primario: {str(error)}")
+    _replica_healthy = False
+    _replica_last_error = str(error)
+
+
+async def monitor_read_replica(interval_seconds: float) -> None:
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await _check_replica()
+
+
 async def close_database() -> None:
 
-    global _prisma_client
+    global _prisma_client, _replica_client, _replica_healthy
+    
+    if _replica_client is not None:
+        try:
+            if _replica_client.is_connected():
+                await _replica_client.disconnect()
+        except Exception as e:
+            logger.error(f"Error al cerrar la réplica de lectura: {str(e)}")
+        _replica_client = None
+        _replica_healthy = False
     
     if _prisma_client is not None:
         try:
@@ -57,6 +231,19 @@ async def close_database() -> None:
 
 
 
+def get_replica_health() -> dict:
+
+    if _replica_client is None:
+        return {"status": "disabled"}
+    
+    health = {"status": "healthy" if _replica_healthy else "unhealthy"}
+    if _replica_last_error:
+        health["error"] = _replica_last_error
+        health["fallback"] = "primary"
+    
+    return health
+
+
 async def check_database_health() -> dict:
 
     try:
@@ -79,6 +266,32 @@ async def check_database_health() -> dict:
 
 
 
+async def get_pool_metrics() -> dict:
+    """
+    Estado del pool del query engine (requiere previewFeatures = ["metrics"])
+    junto con la configuración del pool.
+    """
+    settings = get_settings()
+    
+    pool = {
+        "connectionLimit": settings.DATABASE_CONNECTION_LIMIT,
+        "poolTimeoutSeconds": settings.DATABASE_POOL_TIMEOUT_SECONDS,
+    }
+    
+    try:
+        prisma = get_prisma_client()
+        engine_metrics = await prisma.get_metrics()
+        
+        pool["gauges"] = {g.key: g.value for g in engine_metrics.gauges}
+        pool["counters"] = {c.key: c.value for c in engine_metrics.counters}
+    except Exception as e:
+        pool["error"] = str(e)
+    
+    return pool
+
+
+
+
 async def execute_in_transaction(callback):
 
     prisma = get_prisma_client()
@@ -11,19 +11,81 @@ class Settings(BaseSettings):
     
     DATABASE_URL: str
     
+    # Pool de conexiones del query engine de Prisma. Sin connection_limit se
+    # usa el default de Prisma (num_cpus * 2 + 1) en cada worker de uvicorn.
+    DATABASE_CONNECTION_LIMIT: Optional[int] = None
+    DATABASE_POOL_TIMEOUT_SECONDS: int = 10
+    DATABASE_CONNECT_TIMEOUT_SECONDS: int = 10
+    DATABASE_SLOW_QUERY_MS: int = 500
+    
+    # Réplica de solo lectura opcional para analytics y listados
+    DATABASE_REPLICA_URL: Optional[str] = None
+    DATABASE_REPLICA_HEALTH_INTERVAL_SECONDS: float = 10.0
+    
     REDIS_URL: str
     
+    # Cache de sesiones y clasificaciones en Redis
+    CACHE_ENABLED: bool = True
+    CACHE_SESSION_TTL_SECONDS: int = 300
+    CACHE_CLASSIFICATION_TTL_SECONDS: int = 900
+    CACHE_MESSAGE_WINDOW: int = 50
+    
     # AI Service - Claude (Anthropic)
     ANTHROPIC_API_KEY: str
     
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     
+    # Pool de conexiones HTTP compartido por los clientes de servicios
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP_CLIENT_HTTP2: bool = False
+    
+    # Circuit breaker por servicio (ventana deslizante de errores y lentitud)
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5
+    CIRCUIT_BREAKER_SLOW_CALL_SECONDS: float = 3.0
+    CIRCUIT_BREAKER_SLOW_CALL_RATE: float = 0.8
+    CIRCUIT_BREAKER_WINDOW_SECONDS: float = 30.0
+    CIRCUIT_BREAKER_MIN_CALLS: int = 10
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 30.0
+    
+    # Enriquecimiento de recomendaciones con datos de workshop-service
+    WORKSHOP_ENRICHMENT_CONCURRENCY: int = 8
+    WORKSHOP_ENRICHMENT_TIMEOUT_SECONDS: float = 3.0
+    
+    # Consultas concurrentes a workshop-service en /analytics/workshops/performance
+    ANALYTICS_WORKSHOP_CONCURRENCY: int = 10
+    
+    # Cache en memoria (y Redis) de detalles de taller
+    WORKSHOP_CACHE_TTL_SECONDS: int = 600
+    WORKSHOP_CACHE_STALE_SECONDS: int = 3600
+    WORKSHOP_CACHE_MAX_ENTRIES: int = 1000
+    
+    # Catálogo local de talleres para recomendaciones
+    WORKSHOP_CATALOG_ENABLED: bool = True
+    WORKSHOP_CATALOG_REFRESH_SECONDS: float = 300.0
+    WORKSHOP_CATALOG_CELL_DEGREES: float = 0.1
+    WORKSHOP_CATALOG_PAGE_SIZE: int = 100
+    
+    # Cache de candidatos de recomendación por celda geohash (5 ≈ 4.9 x 4.9 km)
+    RECOMMENDATION_CELL_PRECISION: int = 5
+    RECOMMENDATION_CELL_CACHE_MAX_ENTRIES: int = 5000
+    
+    # Cache en memoria de dueño y ubicación de vehículos
+    VEHICLE_CACHE_TTL_SECONDS: int = 60
+    VEHICLE_CACHE_NEGATIVE_TTL_SECONDS: int = 15
+    VEHICLE_CACHE_MAX_ENTRIES: int = 5000
+    
     VEHICLE_SERVICE_URL: Optional[str] = "https://vehicle-service-autodiag.onrender.com"
     WORKSHOP_SERVICE_URL: Optional[str] = "https://workshop-service-autodiag.onrender.com"
     
     ALLOWED_ORIGINS: str = "http://localhost:8080,http://localhost:3000"
     
+    # Tablas de palabras clave, síntomas y costos (recarga en caliente)
+    DIAGNOSIS_TABLES_PATH: Optional[str] = None
+    DIAGNOSIS_TABLES_RELOAD_SECONDS: float = 5.0
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
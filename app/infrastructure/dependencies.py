@@ -5,12 +5,16 @@ from fastapi import Depends, HTTPException, status, Header
 from jose import JWTError, jwt
 
 from app.infrastructure.config.settings import get_settings
-from app.infrastructure.config.database import get_prisma_client
+from app.infrastructure.config.database import get_prisma_client, get_read_prisma_client
+from app.infrastructure.cache import get_cache
 
 from app.infrastructure.repositories import (
     PrismaDiagnosisSessionRepository,
     PrismaProblemClassificationRepository,
-    PrismaSentimentAnalysisRepository
+    PrismaSentimentAnalysisRepository,
+    PrismaWorkshopRecommendationRepository,
+    CachedDiagnosisSessionRepository,
+    CachedProblemClassificationRepository
 )
 
 from app.infrastructure.services import (
@@ -122,19 +126,37 @@ async def get_current_vehicle_owner(
 def get_diagnosis_session_repository() -> PrismaDiagnosisSessionRepository:
 
     prisma = get_prisma_client()
-    return PrismaDiagnosisSessionRepository(prisma)
+    repository = PrismaDiagnosisSessionRepository(prisma, read_db=get_read_prisma_client())
+    
+    cache = get_cache()
+    if cache is not None:
+        return CachedDiagnosisSessionRepository(repository, cache)
+    
+    return repository
 
 
 def get_problem_classification_repository() -> PrismaProblemClassificationRepository:
 
     prisma = get_prisma_client()
-    return PrismaProblemClassificationRepository(prisma)
+    repository = PrismaProblemClassificationRepository(prisma, read_db=get_read_prisma_client())
+    
+    cache = get_cache()
+    if cache is not None:
+        return CachedProblemClassificationRepository(repository, cache)
+    
+    return repository
 
 
 def get_sentiment_analysis_repository() -> PrismaSentimentAnalysisRepository:
 
     prisma = get_prisma_client()
-    return PrismaSentimentAnalysisRepository(prisma)
+    return PrismaSentimentAnalysisRepository(prisma, read_db=get_read_prisma_client())
+
+
+def get_workshop_recommendation_repository() -> PrismaWorkshopRecommendationRepository:
+
+    prisma = get_prisma_client()
+    return PrismaWorkshopRecommendationRepository(prisma, read_db=get_read_prisma_client())
 
 
 
@@ -0,0 +1,101 @@
+import logging
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Límites superiores (ms) de los buckets del histograma de latencia
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self.counts: List[int] = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float, error: bool = False) -> None:
+        self.counts[bisect_left(self.buckets_ms, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if error:
+            self.errors += 1
+
+    def snapshot(self) -> dict:
+        labels = [f"le_{int(b)}" for b in self.buckets_ms] + ["le_inf"]
+
+        cumulative = 0
+        buckets = {}
+        for label, bucket_count in zip(labels, self.counts):
+            cumulative += bucket_count
+            buckets[label] = cumulative
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avgMs": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "maxMs": round(self.max_ms, 2),
+            "buckets": buckets,
+        }
+
+
+class QueryMetrics:
+    """
+    Latencia de consultas a la base de datos por modelo y operación, más
+    el número de consultas en vuelo en este proceso.
+    """
+
+    def __init__(self, slow_query_ms: float = 500.0):
+        self.slow_query_ms = slow_query_ms
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    def start(self) -> float:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return time.perf_counter()
+
+    def finish(self, model: str, operation: str, started: float, error: bool = False) -> None:
+        self.in_flight -= 1
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        histogram = self._histograms.get((model, operation))
+        if histogram is None:
+            histogram = self._histograms[(model, operation)] = LatencyHistogram()
+        histogram.observe(elapsed_ms, error)
+
+        if elapsed_ms >= self.slow_query_ms:
+            logger.warning(f"Consulta lenta: {model}.{operation} tardó {elapsed_ms:.0f} ms")
+
+    def snapshot(self) -> dict:
+        return {
+            "inFlight": self.in_flight,
+            "maxInFlight": self.max_in_flight,
+            "slowQueryMs": self.slow_query_ms,
+            "operations": {
+                f"{model}.{operation}": histogram.snapshot()
+                for (model, operation), histogram in sorted(self._histograms.items())
+            },
+        }
+
+
+_query_metrics: Optional[QueryMetrics] = None
+
+
+def get_query_metrics() -> QueryMetrics:
+
+    global _query_metrics
+
+    if _query_metrics is None:
+        from app.infrastructure.config.settings import get_settings
+        _query_metrics = QueryMetrics(slow_query_ms=get_settings().DATABASE_SLOW_QUERY_MS)
+
+    return _query_metrics
@@ -3,9 +3,15 @@
 from .prisma_diagnosis_session_repository import PrismaDiagnosisSessionRepository
 from .prisma_problem_classification_repository import PrismaProblemClassificationRepository
 from .prisma_sentiment_analysis_repository import PrismaSentimentAnalysisRepository
+from .prisma_workshop_recommendation_repository import PrismaWorkshopRecommendationRepository
+from .cached_diagnosis_session_repository import CachedDiagnosisSessionRepository
+from .cached_problem_classification_repository import CachedProblemClassificationRepository
 
 __all__ = [
     "PrismaDiagnosisSessionRepository",
     "PrismaProblemClassificationRepository",
     "PrismaSentimentAnalysisRepository",
+    "PrismaWorkshopRecommendationRepository",
+    "CachedDiagnosisSessionRepository",
+    "CachedProblemClassificationRepository",
 ]
\ No newline at end of file
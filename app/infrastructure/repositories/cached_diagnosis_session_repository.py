@@ -0,0 +1,270 @@
+from typing import Any, Dict, Optional, List, Tuple
+from datetime import datetime, timezone
+from uuid import UUID
+from weakref import WeakKeyDictionary
+
+from app.domain.entities.diagnosis_session import DiagnosisSession
+from app.domain.entities.diagnosis_session_summary import DiagnosisSessionSummary
+from app.domain.entities.diagnosis_message import DiagnosisMessage
+from app.domain.value_objects import SessionId, SessionStatus
+from app.infrastructure.cache import RedisCache
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.repositories.prisma_diagnosis_session_repository import (
+    PrismaDiagnosisSessionRepository,
+    encode_message_cursor,
+)
+
+
+def _as_utc(timestamp: datetime) -> datetime:
+    # Prisma devuelve timestamps con zona; DiagnosisMessage.create usa utcnow() sin zona
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc)
+
+
+class CachedDiagnosisSessionRepository:
+    """
+    Read-through cache sobre PrismaDiagnosisSessionRepository.
+
+    Guarda en Redis la sesión completa, su cabecera (con el conteo de
+    mensajes) y la ventana de mensajes más recientes, junto con una versión
+    por sesión. create/update escriben las tres claves después del commit
+    (write-through), así el siguiente turno del chat no vuelve a Postgres.
+
+    La versión evita escribir un estado viejo: cada sesión en memoria
+    recuerda la versión con la que se cargó y la escritura solo se aplica si
+    nadie escribió desde entonces; si no, se invalida. Las lecturas leen la
+    versión antes de ir a Postgres y solo repueblan el cache si no cambió.
+    Los métodos no cacheados se delegan tal cual al repositorio interno.
+    """
+
+    def __init__(self, inner: PrismaDiagnosisSessionRepository, cache: RedisCache):
+        settings = get_settings()
+        self.inner = inner
+        self.cache = cache
+        self.ttl_seconds = settings.CACHE_SESSION_TTL_SECONDS
+        self.message_window = settings.CACHE_MESSAGE_WINDOW
+        # Versión de cache con la que se cargó cada sesión en memoria
+        self._loaded_versions: "WeakKeyDictionary[DiagnosisSession, int]" = WeakKeyDictionary()
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    @staticmethod
+    def _session_key(session_id) -> str:
+        return f"session:{session_id}"
+
+    @staticmethod
+    def _header_key(session_id) -> str:
+        return f"session:{session_id}:header"
+
+    @staticmethod
+    def _window_key(session_id) -> str:
+        return f"session:{session_id}:messages"
+
+    @staticmethod
+    def _version_key(session_id) -> str:
+        return f"session:{session_id}:version"
+
+    async def create(self, session: DiagnosisSession) -> DiagnosisSession:
+        await self.inner.create(session)
+        # Sesión nueva: todavía no hay versión en Redis
+        await self._write_through(session, expected_version=0)
+        return session
+
+    async def update(self, session: DiagnosisSession) -> DiagnosisSession:
+        try:
+            await self.inner.update(session)
+        except Exception:
+            # No se sabe si el commit llegó a aplicarse
+            await self.invalidate(session.id)
+            raise
+
+        await self._write_through(session, self._loaded_versions.get(session))
+        return session
+
+    async def delete(self, session_id: UUID) -> None:
+        await self.inner.delete(session_id)
+        await self.invalidate(session_id)
+
+    async def invalidate(self, session_id) -> None:
+        await self.cache.invalidate_versioned(
+            self._version_key(session_id),
+            self._session_key(session_id),
+            self._header_key(session_id),
+            self._window_key(session_id),
+            ttl_seconds=self.ttl_seconds
+        )
+
+    async def find_by_id(self, session_id: UUID) -> Optional[DiagnosisSession]:
+        cached = await self.cache.get_json(self._session_key(session_id), "session")
+        if cached is not None:
+            session = self._deserialize_session(cached)
+            if cached.get("cache_version") is not None:
+                self._loaded_versions[session] = cached["cache_version"]
+            return session
+
+        version = await self.cache.get_version(self._version_key(session_id))
+        session = await self.inner.find_by_id(session_id)
+        if session and version is not None:
+            self._loaded_versions[session] = version
+            await self.cache.set_json_versioned(
+                self._version_key(session_id),
+                version,
+                self._session_values(session, version),
+                self.ttl_seconds,
+                "session"
+            )
+
+        return session
+
+    async def find_header_by_id(
+        self,
+        session_id: UUID,
+        with_messages_count: bool = False
+    ) -> Optional[DiagnosisSessionSummary]:
+        cached = await self.cache.get_json(self._header_key(session_id), "session_header")
+        if cached is not None:
+            return self._deserialize_header(cached)
+
+        # Siempre se cachea con el conteo para servir ambos modos
+        version = await self.cache.get_version(self._version_key(session_id))
+        header = await self.inner.find_header_by_id(session_id, with_messages_count=True)
+        if header and version is not None:
+            await self.cache.set_json_versioned(
+                self._version_key(session_id),
+                version,
+                {self._header_key(session_id): self._serialize_header(header)},
+                self.ttl_seconds,
+                "session_header"
+            )
+
+        return header
+
+    async def find_messages_page(
+        self,
+        session_id: UUID,
+        limit: int,
+        before: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> Tuple[List[DiagnosisMessage], Optional[str], Optional[str]]:
+        # Solo la primera página (la más reciente) se sirve desde el cache
+        if before or after or limit > self.message_window:
+            return await self.inner.find_messages_page(session_id, limit, before, after)
+
+        cached = await self.cache.get_json(self._window_key(session_id), "session_messages")
+        if cached is None:
+            version = await self.cache.get_version(self._version_key(session_id))
+            messages, _, _ = await self.inner.find_messages_page(session_id, self.message_window + 1)
+            cached = [msg.to_dict() for msg in messages]
+            if version is not None:
+                await self.cache.set_json_versioned(
+                    self._version_key(session_id),
+                    version,
+                    {self._window_key(session_id): cached},
+                    self.ttl_seconds,
+                    "session_messages"
+                )
+
+        window = [self._deserialize_message(data) for data in cached]
+        page = window[-limit:]
+        older_cursor = encode_message_cursor(page[0]) if page and len(window) > limit else None
+
+        return page, older_cursor, None
+
+    async def _write_through(self, session: DiagnosisSession, expected_version: Optional[int]) -> None:
+
+        if expected_version is None:
+            # Cargada sin versión (cache caído o entrada antigua): no se
+            # puede saber si está al día, así que solo se invalida
+            await self.invalidate(session.id)
+            return
+
+        version = await self.cache.set_json_versioned(
+            self._version_key(session.id),
+            expected_version,
+            self._session_values(session, expected_version + 1),
+            self.ttl_seconds,
+            "session",
+            bump=True
+        )
+
+        if version is None:
+            self._loaded_versions.pop(session, None)
+        else:
+            self._loaded_versions[session] = version
+
+    def _session_values(self, session: DiagnosisSession, version: int) -> Dict[str, Any]:
+        messages = sorted(session.messages, key=lambda m: (_as_utc(m.timestamp), str(m.id.value)))
+
+        header = DiagnosisSessionSummary(
+            session_id=session.id,
+            user_id=session.user_id,
+            vehicle_id=session.vehicle_id,
+            status=session.status,
+            messages_count=len(messages),
+            summary=session.summary,
+            started_at=session.started_at,
+            completed_at=session.completed_at
+        )
+
+        data = self._serialize_session(session)
+        data["cache_version"] = version
+
+        return {
+            self._session_key(session.id): data,
+            self._header_key(session.id): self._serialize_header(header),
+            self._window_key(session.id): [msg.to_dict() for msg in messages[-(self.message_window + 1):]],
+        }
+
+    def _serialize_session(self, session: DiagnosisSession) -> dict:
+        data = session.to_dict()
+        data["messages"] = [msg.to_dict() for msg in session.messages]
+        return data
+
+    def _deserialize_session(self, data: dict) -> DiagnosisSession:
+        return DiagnosisSession.from_primitives(
+            session_id=data["id"],
+            user_id=data["user_id"],
+            vehicle_id=data["vehicle_id"],
+            status=data["status"],
+            messages=[self._deserialize_message(msg) for msg in data["messages"]],
+            summary=data["summary"],
+            started_at=datetime.fromisoformat(data["started_at"]),
+            completed_at=datetime.fromisoformat(data["completed_at"]) if data["completed_at"] else None,
+            detected_symptoms=data.get("detected_symptoms", [])
+        )
+
+    def _serialize_header(self, header: DiagnosisSessionSummary) -> dict:
+        return {
+            "id": str(header.id),
+            "user_id": str(header.user_id),
+            "vehicle_id": str(header.vehicle_id),
+            "status": header.status.value,
+            "messages_count": header.messages_count,
+            "summary": header.summary,
+            "started_at": header.started_at.isoformat() if header.started_at else None,
+            "completed_at": header.completed_at.isoformat() if header.completed_at else None,
+        }
+
+    def _deserialize_header(self, data: dict) -> DiagnosisSessionSummary:
+        return DiagnosisSessionSummary(
+            session_id=SessionId(UUID(data["id"])),
+            user_id=UUID(data["user_id"]),
+            vehicle_id=UUID(data["vehicle_id"]),
+            status=SessionStatus(data["status"]),
+            messages_count=data["messages_count"],
+            summary=data["summary"],
+            started_at=datetime.fromisoformat(data["started_at"]) if data["started_at"] else None,
+            completed_at=datetime.fromisoformat(data["completed_at"]) if data["completed_at"] else None
+        )
+
+    def _deserialize_message(self, data: dict) -> DiagnosisMessage:
+        return DiagnosisMessage.from_primitives(
+            message_id=data["id"],
+            session_id=data["session_id"],
+            role=data["role"],
+            content=data["content"],
+            attachments=data["attachments"],
+            timestamp=datetime.fromisoformat(data["timestamp"])
+        )
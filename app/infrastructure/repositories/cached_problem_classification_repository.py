@@ -0,0 +1,73 @@
+from typing import Optional, List, Dict
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.entities.problem_classification import ProblemClassification
+from app.infrastructure.cache import RedisCache
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.repositories.prisma_problem_classification_repository import (
+    PrismaProblemClassificationRepository,
+)
+
+
+class CachedProblemClassificationRepository:
+    """
+    Read-through cache por sesión sobre PrismaProblemClassificationRepository.
+    Toda escritura invalida las entradas de las sesiones afectadas.
+    """
+
+    def __init__(self, inner: PrismaProblemClassificationRepository, cache: RedisCache):
+        self.inner = inner
+        self.cache = cache
+        self.ttl_seconds = get_settings().CACHE_CLASSIFICATION_TTL_SECONDS
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    @staticmethod
+    def _session_key(session_id) -> str:
+        return f"classification:session:{session_id}"
+
+    async def save(self, classification: ProblemClassification) -> ProblemClassification:
+        await self.inner.save(classification)
+        await self.cache.delete(self._session_key(classification.session_id))
+        return classification
+
+    async def save_many(self, classifications: List[ProblemClassification]) -> int:
+        written = await self.inner.save_many(classifications)
+        await self.cache.delete(*(self._session_key(c.session_id) for c in classifications))
+        return written
+
+    async def delete(self, classification_id: UUID) -> None:
+        classification = await self.inner.find_by_id(classification_id)
+        await self.inner.delete(classification_id)
+        if classification:
+            await self.cache.delete(self._session_key(classification.session_id))
+
+    async def find_by_session_id(self, session_id: UUID) -> Optional[ProblemClassification]:
+        cached = await self.cache.get_json(self._session_key(session_id), "classification")
+        if cached is not None:
+            return self._deserialize(cached)
+
+        classification = await self.inner.find_by_session_id(session_id)
+        if classification:
+            await self.cache.set_json(
+                self._session_key(session_id),
+                classification.to_dict(),
+                self.ttl_seconds,
+                "classification"
+            )
+
+        return classification
+
+    def _deserialize(self, data: dict) -> ProblemClassification:
+        return ProblemClassification.from_primitives(
+            classification_id=data["id"],
+            session_id=data["session_id"],
+            category=data["category"],
+            subcategory=data["subcategory"],
+            confidence_score=data["confidence_score"],
+            symptoms=data["symptoms"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            tables_version=data.get("tables_version")
+        )
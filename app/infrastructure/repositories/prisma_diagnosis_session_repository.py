@@ -1,4 +1,5 @@
-from typing import Optional, List
+import base64
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 from uuid import UUID
 
@@ -8,20 +9,49 @@ from prisma.models import DiagnosisMessage as PrismaMessage
 
 from app.domain.entities.diagnosis_session import DiagnosisSession
 from app.domain.entities.diagnosis_message import DiagnosisMessage
+from app.domain.entities.diagnosis_session_summary import DiagnosisSessionSummary
 from app.domain.value_objects.session_status import SessionStatus
 from app.domain.value_objects.message_role import MessageRole
 from app.domain.value_objects import MessageId, MessageContent 
 from app.domain.repository.diagnosis_session_repository import DiagnosisSessionRepository
 
 
+def encode_message_cursor(msg: DiagnosisMessage) -> str:
+    raw = f"{msg.timestamp.isoformat()}|{msg.id.value}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_message_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Devuelve (timestamp, id) del cursor; ValueError si es inválido"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        timestamp, message_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), str(UUID(message_id))
+    except Exception as e:
+        raise ValueError(f"Cursor inválido: {cursor}") from e
+
+
 class PrismaDiagnosisSessionRepository(DiagnosisSessionRepository):
     
-    def __init__(self, db: Prisma):
+    def __init__(self, db: Prisma, read_db: Optional[Prisma] = None):
         self.db = db
+        # Réplica de solo lectura para analytics; sin réplica es el primario.
+        # Lo que ve el usuario (chat, validaciones, su listado de sesiones)
+        # va al primario para leer sus propias escrituras.
+        self.read_db = read_db or db
     
     async def create(self, session: DiagnosisSession) -> DiagnosisSession:
-
-        prisma_session = await self.db.diagnosissession.create(
+        """
+        Crea la sesión con sus mensajes en una sola escritura anidada: un
+        viaje a la base de datos y atómica (o se guarda todo o nada).
+        """
+        messages_data = []
+        for msg in session.messages:
+            data = self._message_data(session, msg)
+            data.pop("sessionId")
+            messages_data.append(data)
+        
+        await self.db.diagnosissession.create(
             data={
                 "id": str(session.id),
                 "userId": str(session.user_id),
@@ -30,59 +60,55 @@ class PrismaDiagnosisSessionRepository(DiagnosisSessionRepository):
                 "summary": session.summary,
                 "startedAt": session.started_at,
                 "completedAt": session.completed_at,
+                "detectedSymptoms": session.detected_symptoms,
+                "messages": {"create": messages_data},
             }
         )
         
-        for msg in session.messages:
-            attachments_data = [att.to_dict() for att in msg.attachments] if msg.attachments else []
-            
-            await self.db.diagnosismessage.create(
-                data={
-                    "id": str(msg.id.value), 
-                    "sessionId": str(session.id),
-                    "role": msg.role.value,
-                    "content": msg.content.value,
-                    "attachments": Json(attachments_data),
-                    "timestamp": msg.timestamp,
-                }
-            )
+        session.mark_messages_persisted()
         
         return session
     
     async def update(self, session: DiagnosisSession) -> DiagnosisSession:
-
-        await self.db.diagnosissession.update(
-            where={"id": str(session.id)},
-            data={
-                "status": session.status.value,
-                "summary": session.summary,
-                "completedAt": session.completed_at,
-                "updatedAt": datetime.utcnow(),
-            }
-        )
+        """
+        Actualiza la sesión e inserta solo los mensajes pendientes, ambos
+        en la misma transacción.
+        """
+        pending_messages = session.pending_messages
         
-        existing_messages = await self.db.diagnosismessage.find_many(
-            where={"sessionId": str(session.id)}
-        )
-        existing_ids = {msg.id for msg in existing_messages}
-        
-        for msg in session.messages:
-            if str(msg.id.value) not in existing_ids: 
-                attachments_data = [att.to_dict() for att in msg.attachments] if msg.attachments else []
-
-                await self.db.diagnosismessage.create(
-                    data={
-                        "id": str(msg.id.value),
-                        "sessionId": str(session.id),
-                        "role": msg.role.value,
-                        "content": msg.content.value,
-                        "attachments": Json(attachments_data),
-                        "timestamp": msg.timestamp,
-                    }
+        async with self.db.tx() as transaction:
+            await transaction.diagnosissession.update(
+                where={"id": str(session.id)},
+                data={
+                    "status": session.status.value,
+                    "summary": session.summary,
+                    "completedAt": session.completed_at,
+                    "detectedSymptoms": session.detected_symptoms,
+                    "updatedAt": datetime.utcnow(),
+                }
+            )
+            
+            if pending_messages:
+                await transaction.diagnosismessage.create_many(
+                    data=[self._message_data(session, msg) for msg in pending_messages]
                 )
         
+        session.mark_messages_persisted()
+        
         return session
     
+    def _message_data(self, session: DiagnosisSession, msg: DiagnosisMessage) -> dict:
+        attachments_data = [att.to_dict() for att in msg.attachments] if msg.attachments else []
+        
+        return {
+            "id": str(msg.id.value),
+            "sessionId": str(session.id),
+            "role": msg.role.value,
+            "content": msg.content.value,
+            "attachments": Json(attachments_data),
+            "timestamp": msg.timestamp,
+        }
+    
     async def find_by_id(self, session_id: UUID) -> Optional[DiagnosisSession]:
         prisma_session = await self.db.diagnosissession.find_unique(
             where={"id": str(session_id)},
@@ -94,6 +120,97 @@ class PrismaDiagnosisSessionRepository(DiagnosisSessionRepository):
         
         return self._to_domain(prisma_session)
     
+    async def find_header_by_id(
+        self,
+        session_id: UUID,
+        with_messages_count: bool = False
+    ) -> Optional[DiagnosisSessionSummary]:
+        """
+        Solo la fila de la sesión (sin mensajes), para validaciones de
+        pertenencia y estado. El conteo de mensajes es opcional.
+        """
+        prisma_session = await self.db.diagnosissession.find_unique(
+            where={"id": str(session_id)}
+        )
+        
+        if not prisma_session:
+            return None
+        
+        messages_count = None
+        if with_messages_count:
+            messages_count = await self.db.diagnosismessage.count(
+                where={"sessionId": prisma_session.id}
+            )
+        
+        return self._to_summary(prisma_session, messages_count)
+    
+    async def find_messages_by_session_id(self, session_id: UUID) -> List[DiagnosisMessage]:
+        prisma_messages = await self.db.diagnosismessage.find_many(
+            where={"sessionId": str(session_id)},
+            order=[{"timestamp": "asc"}, {"id": "asc"}]
+        )
+        
+        return [self._message_to_domain(msg) for msg in prisma_messages]
+    
+    async def find_messages_page(
+        self,
+        session_id: UUID,
+        limit: int,
+        before: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> Tuple[List[DiagnosisMessage], Optional[str], Optional[str]]:
+        """
+        Página de mensajes por keyset sobre (timestamp, id), en orden
+        cronológico. Sin cursor devuelve los más recientes.
+        
+        Retorna (mensajes, cursor_anteriores, cursor_siguientes); el primero
+        se pasa como `before` para cargar mensajes más viejos y el segundo
+        como `after` para los más nuevos. Son None si no hay más.
+        """
+        where_clause = {"sessionId": str(session_id)}
+        
+        if after:
+            timestamp, message_id = decode_message_cursor(after)
+            where_clause["OR"] = [
+                {"timestamp": {"gt": timestamp}},
+                {"timestamp": timestamp, "id": {"gt": message_id}},
+            ]
+            direction = "asc"
+        else:
+            if before:
+                timestamp, message_id = decode_message_cursor(before)
+                where_clause["OR"] = [
+                    {"timestamp": {"lt": timestamp}},
+                    {"timestamp": timestamp, "id": {"lt": message_id}},
+                ]
+            direction = "desc"
+        
+        prisma_messages = await self.db.diagnosismessage.find_many(
+            where=where_clause,
+            order=[{"timestamp": direction}, {"id": direction}],
+            take=limit + 1
+        )
+        
+        has_more = len(prisma_messages) > limit
+        prisma_messages = prisma_messages[:limit]
+        
+        if direction == "desc":
+            prisma_messages.reverse()
+        
+        messages = [self._message_to_domain(msg) for msg in prisma_messages]
+        
+        if not messages:
+            return messages, None, None
+        
+        if after:
+            older_cursor = encode_message_cursor(messages[0])
+            newer_cursor = encode_message_cursor(messages[-1]) if has_more else None
+        else:
+            older_cursor = encode_message_cursor(messages[0]) if has_more else None
+            newer_cursor = encode_message_cursor(messages[-1]) if before else None
+        
+        return messages, older_cursor, newer_cursor
+    
     async def find_by_user_id(
         self,
         user_id: str,
@@ -114,46 +231,132 @@ class PrismaDiagnosisSessionRepository(DiagnosisSessionRepository):
         
         return [self._to_domain(s) for s in prisma_sessions]
     
+    async def find_summaries_by_user_id(
+        self,
+        user_id: str,
+        vehicle_id: Optional[str] = None,
+        limit: int = 10
+    ) -> List[DiagnosisSessionSummary]:
+        """
+        Listado ligero: solo cabeceras de sesión y el conteo de mensajes
+        calculado en la base de datos, sin traer el contenido de los mensajes.
+        """
+        where_clause = {"userId": user_id}
+        
+        if vehicle_id:
+            where_clause["vehicleId"] = vehicle_id
+        
+        # Primario: una sesión recién creada debe aparecer en el listado
+        prisma_sessions = await self.db.diagnosissession.find_many(
+            where=where_clause,
+            order={"startedAt": "desc"},
+            take=limit
+        )
+        
+        counts = await self.count_messages_by_session_ids([s.id for s in prisma_sessions])
+        
+        return [
+            self._to_summary(s, counts.get(s.id, 0))
+            for s in prisma_sessions
+        ]
+    
+    async def count_messages_by_session_ids(self, session_ids: List[str]) -> Dict[str, int]:
+        if not session_ids:
+            return {}
+        
+        rows = await self.db.diagnosismessage.group_by(
+            by=["sessionId"],
+            where={"sessionId": {"in": session_ids}},
+            count=True
+        )
+        
+        return {row["sessionId"]: row["_count"]["_all"] for row in rows}
+    
+    async def count_unique_users(
+        self,
+        from_date: datetime,
+        to_date: datetime
+    ) -> int:
+        # COUNT(DISTINCT) en la base: una sola fila sin importar cuántos usuarios haya
+        rows = await self.read_db.query_raw(
+            'SELECT COUNT(DISTINCT "userId")::int AS n FROM "diagnosis_sessions" '
+            'WHERE "startedAt" BETWEEN $1 AND $2',
+            from_date,
+            to_date
+        )
+        
+        return rows[0]["n"] if rows else 0
+    
+    async def find_batch_after(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> List[DiagnosisSession]:
+        """
+        Keyset pagination sobre el id para recorrer todas las sesiones
+        en bloques acotados. El cursor es el id de la última sesión leída.
+        """
+        where_clause = {"id": {"gt": cursor}} if cursor else {}
+
+        prisma_sessions = await self.db.diagnosissession.find_many(
+            where=where_clause,
+            include={"messages": {"order_by": {"timestamp": "asc"}}},
+            order={"id": "asc"},
+            take=limit
+        )
+
+        return [self._to_domain(s) for s in prisma_sessions]
+
     async def delete(self, session_id: UUID) -> None:
         await self.db.diagnosissession.delete(
             where={"id": str(session_id)}
         )
     
-    def _to_domain(self, prisma_session: PrismaSession) -> DiagnosisSession:
-        messages = []
-        for msg in (prisma_session.messages or []):
-            try:
-                attachments_list = msg.attachments if msg.attachments else []
-                
-                messages.append(
-                    DiagnosisMessage.from_primitives(
-                        message_id=msg.id,
-                        session_id=msg.sessionId,
-                        role=msg.role,
-                        content=msg.content,
-                        attachments=attachments_list,
-                        timestamp=msg.timestamp
-                    )
-                )
-            except Exception as e:
-                from app.domain.entities.diagnosis_message import Attachment
-                
-                att_objs = []
-                if msg.attachments:
-                    for att in msg.attachments:
-                        att_objs.append(Attachment.from_dict(att))
-
-                messages.append(
-                    DiagnosisMessage(
-                        message_id=MessageId(UUID(msg.id)), 
-                        session_id=UUID(msg.sessionId),
-                        role=MessageRole(msg.role),
-                        content=MessageContent(msg.content),
-                        attachments=att_objs,
-                        timestamp=msg.timestamp
-                    )
-                )
+    def _to_summary(self, prisma_session: PrismaSession, messages_count: Optional[int]) -> DiagnosisSessionSummary:
+        from app.domain.value_objects import SessionId
+        
+        return DiagnosisSessionSummary(
+            session_id=SessionId(UUID(prisma_session.id)),
+            user_id=UUID(prisma_session.userId),
+            vehicle_id=UUID(prisma_session.vehicleId),
+            status=SessionStatus(prisma_session.status),
+            messages_count=messages_count,
+            summary=prisma_session.summary,
+            started_at=prisma_session.startedAt,
+            completed_at=prisma_session.completedAt
+        )
+    
+    def _message_to_domain(self, msg: PrismaMessage) -> DiagnosisMessage:
+        try:
+            attachments_list = msg.attachments if msg.attachments else []
+            
+            return DiagnosisMessage.from_primitives(
+                message_id=msg.id,
+                session_id=msg.sessionId,
+                role=msg.role,
+                content=msg.content,
+                attachments=attachments_list,
+                timestamp=msg.timestamp
+            )
+        except Exception as e:
+            from app.domain.entities.diagnosis_message import Attachment
+            
+            att_objs = []
+            if msg.attachments:
+                for att in msg.attachments:
+                    att_objs.append(Attachment.from_dict(att))
 
+            return DiagnosisMessage(
+                message_id=MessageId(UUID(msg.id)), 
+                session_id=UUID(msg.sessionId),
+                role=MessageRole(msg.role),
+                content=MessageContent(msg.content),
+                attachments=att_objs,
+                timestamp=msg.timestamp
+            )
+    
+    def _to_domain(self, prisma_session: PrismaSession) -> DiagnosisSession:
+        messages = [self._message_to_domain(msg) for msg in (prisma_session.messages or [])]
         
         from app.domain.value_objects import SessionId 
         
@@ -165,5 +368,6 @@ class PrismaDiagnosisSessionRepository(DiagnosisSessionRepository):
             messages=messages,
             summary=prisma_session.summary,
             started_at=prisma_session.startedAt,
-            completed_at=prisma_session.completedAt
+            completed_at=prisma_session.completedAt,
+            detected_symptoms=prisma_session.detectedSymptoms or []
         )
\ No newline at end of file
@@ -1,6 +1,6 @@
 
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 from uuid import UUID
 
@@ -13,8 +13,10 @@ from app.domain.value_objects.problem_category import ProblemCategory
 
 class PrismaProblemClassificationRepository:
     
-    def __init__(self, db: Prisma):
+    def __init__(self, db: Prisma, read_db: Optional[Prisma] = None):
         self.db = db
+        # Réplica de solo lectura para analytics; sin réplica es el primario
+        self.read_db = read_db or db
     
     async def save(self, classification: ProblemClassification) -> ProblemClassification:
         class_dict = classification.to_dict()
@@ -31,6 +33,7 @@ class PrismaProblemClassificationRepository:
                     "subcategory": class_dict.get("subcategory"),
                     "confidenceScore": class_dict["confidence_score"],
                     "symptoms": class_dict.get("symptoms", []),
+                    "tablesVersion": class_dict.get("tables_version"),
                 }
             )
         else:
@@ -42,6 +45,7 @@ class PrismaProblemClassificationRepository:
                     "subcategory": class_dict.get("subcategory"),
                     "confidenceScore": class_dict["confidence_score"],
                     "symptoms": class_dict.get("symptoms", []),
+                    "tablesVersion": class_dict.get("tables_version"),
                 }
             )
         
@@ -67,6 +71,67 @@ class PrismaProblemClassificationRepository:
         
         return self._to_domain(prisma_class)
     
+    async def find_by_session_ids(
+        self,
+        session_ids: List[str]
+    ) -> Dict[str, ProblemClassification]:
+        if not session_ids:
+            return {}
+
+        prisma_classes = await self.db.problemclassification.find_many(
+            where={"sessionId": {"in": session_ids}}
+        )
+
+        return {c.sessionId: self._to_domain(c) for c in prisma_classes}
+
+    async def save_many(self, classifications: List[ProblemClassification]) -> int:
+        """
+        Upsert en bloque por sessionId en una sola transacción: un batch de
+        updates para las filas existentes y un create_many para las nuevas.
+        """
+        if not classifications:
+            return 0
+
+        session_ids = [str(c.session_id) for c in classifications]
+
+        async with self.db.tx() as transaction:
+            existing = await transaction.problemclassification.find_many(
+                where={"sessionId": {"in": session_ids}}
+            )
+            existing_session_ids = {c.sessionId for c in existing}
+
+            to_create = []
+            async with transaction.batch_() as batcher:
+                for classification in classifications:
+                    class_dict = classification.to_dict()
+                    data = {
+                        "category": class_dict["category"],
+                        "subcategory": class_dict.get("subcategory"),
+                        "confidenceScore": class_dict["confidence_score"],
+                        "symptoms": class_dict.get("symptoms", []),
+                        "tablesVersion": class_dict.get("tables_version"),
+                    }
+
+                    if str(classification.session_id) in existing_session_ids:
+                        batcher.problemclassification.update(
+                            where={"sessionId": str(classification.session_id)},
+                            data=data
+                        )
+                    else:
+                        to_create.append({
+                            "id": str(classification.id),
+                            "sessionId": str(classification.session_id),
+                            **data,
+                        })
+
+            if to_create:
+                await transaction.problemclassification.create_many(
+                    data=to_create,
+                    skip_duplicates=True
+                )
+
+        return len(classifications)
+
     async def delete(self, classification_id: UUID) -> None:
         await self.db.problemclassification.delete(
             where={"id": str(classification_id)}
@@ -86,7 +151,7 @@ class PrismaProblemClassificationRepository:
         if to_date:
             where_clause.setdefault("createdAt", {})["lte"] = to_date
         
-        return await self.db.problemclassification.count(where=where_clause)
+        return await self.read_db.problemclassification.count(where=where_clause)
     
     async def get_category_distribution(
         self,
@@ -100,17 +165,13 @@ class PrismaProblemClassificationRepository:
         if to_date:
             where_clause.setdefault("createdAt", {})["lte"] = to_date
         
-        classifications = await self.db.problemclassification.find_many(
+        rows = await self.read_db.problemclassification.group_by(
+            by=["category"],
             where=where_clause,
-            select={"category": True}
+            count=True
         )
         
-        distribution = {}
-        for c in classifications:
-            category = c.category
-            distribution[category] = distribution.get(category, 0) + 1
-        
-        return distribution
+        return {row["category"]: row["_count"]["_all"] for row in rows}
     
     async def get_top_categories(
         self,
@@ -132,16 +193,42 @@ class PrismaProblemClassificationRepository:
         self,
         category: ProblemCategory
     ) -> float:
-        classifications = await self.db.problemclassification.find_many(
+        rows = await self.read_db.problemclassification.group_by(
+            by=["category"],
             where={"category": category.value},
-            select={"confidenceScore": True}
+            avg={"confidenceScore": True}
         )
         
-        if not classifications:
+        if not rows or rows[0]["_avg"]["confidenceScore"] is None:
             return 0.0
         
-        total = sum(c.confidenceScore for c in classifications)
-        return total / len(classifications)
+        return rows[0]["_avg"]["confidenceScore"]
+    
+    async def get_confidence_summary(self, high_threshold: float = 0.7) -> Tuple[int, float, int]:
+        """
+        (total, confianza promedio, clasificaciones con confianza >= umbral),
+        agregado en la base de datos.
+        """
+        rows = await self.read_db.problemclassification.group_by(
+            by=["category"],
+            count=True,
+            avg={"confidenceScore": True}
+        )
+        
+        total = sum(row["_count"]["_all"] for row in rows)
+        if not total:
+            return 0, 0.0, 0
+        
+        weighted = sum(
+            (row["_avg"]["confidenceScore"] or 0.0) * row["_count"]["_all"]
+            for row in rows
+        )
+        
+        high_confidence = await self.read_db.problemclassification.count(
+            where={"confidenceScore": {"gte": high_threshold}}
+        )
+        
+        return total, weighted / total, high_confidence
     
     def _to_domain(
         self,
@@ -154,5 +241,6 @@ class PrismaProblemClassificationRepository:
             subcategory=prisma_class.subcategory,
             confidence_score=prisma_class.confidenceScore,
             symptoms=prisma_class.symptoms if prisma_class.symptoms else [],
-            created_at=prisma_class.createdAt
+            created_at=prisma_class.createdAt,
+            tables_version=prisma_class.tablesVersion
         )
\ No newline at end of file
@@ -1,6 +1,7 @@
 
 
-from typing import Optional, Dict
+import json
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 from uuid import UUID
 
@@ -15,8 +16,10 @@ from app.domain.value_objects import SentimentLabel
 class PrismaSentimentAnalysisRepository(SentimentAnalysisRepository):
 
     
-    def __init__(self, db: Prisma):
+    def __init__(self, db: Prisma, read_db: Optional[Prisma] = None):
         self.db = db
+        # Réplica de solo lectura para analytics; sin réplica es el primario
+        self.read_db = read_db or db
     
     async def save(self, sentiment_analysis: SentimentAnalysis) -> None:
 
@@ -71,19 +74,18 @@ class PrismaSentimentAnalysisRepository(SentimentAnalysisRepository):
     ) -> Optional[SentimentAnalysis]:
 
 
-        all_sentiments = await self.db.sentimentanalysis.find_many(
-            where={
-                "context": {
-                    "path": [context_key],
-                    "equals": context_value
-                }
-            }
+        # Contención JSONB (@>) para que la consulta use el índice GIN
+        # jsonb_path_ops de sentiment_analyses.context
+        prisma_sentiment = await self.db.query_first(
+            'SELECT * FROM sentiment_analyses WHERE context @> $1::jsonb LIMIT 1',
+            json.dumps({context_key: context_value}),
+            model=PrismaSentimentAnalysis
         )
         
-        if not all_sentiments:
+        if not prisma_sentiment:
             return None
         
-        return self._to_domain(all_sentiments[0])
+        return self._to_domain(prisma_sentiment)
     
     async def delete(self, analysis_id: UUID) -> None:
 
@@ -106,7 +108,7 @@ class PrismaSentimentAnalysisRepository(SentimentAnalysisRepository):
         if to_date:
             where_clause["analyzedAt"] = {**where_clause.get("analyzedAt", {}), "lte": to_date}
 
-        return await self.db.sentimentanalysis.count(where=where_clause)
+        return await self.read_db.sentimentanalysis.count(where=where_clause)
     
     async def get_sentiment_distribution(
         self,
@@ -121,17 +123,7 @@ class PrismaSentimentAnalysisRepository(SentimentAnalysisRepository):
         if to_date:
             where_clause["analyzedAt"] = {**where_clause.get("analyzedAt", {}), "lte": to_date}
 
-        sentiments = await self.db.sentimentanalysis.find_many(
-            where=where_clause,
-            select={"label": True}
-        )
-
-        distribution = {}
-        for s in sentiments:
-            label = s.label
-            distribution[label] = distribution.get(label, 0) + 1
-
-        return distribution
+        return await self._count_by_label(where_clause)
     
     async def get_average_sentiment_score(
         self,
@@ -147,22 +139,11 @@ class PrismaSentimentAnalysisRepository(SentimentAnalysisRepository):
                 "equals": context_value
             }
 
-        sentiments = await self.db.sentimentanalysis.find_many(
-            where=where_clause,
-            select={"label": True}
-        )
-
-        if not sentiments:
-            return 0.0
-
-        score_map = {"POSITIVE": 1.0, "NEUTRAL": 0.0, "NEGATIVE": -1.0}
-        scores = [score_map.get(s.label, 0.0) for s in sentiments]
-
-        return sum(scores) / len(scores)
+        return self._average_score(await self._count_by_label(where_clause))
     
     async def count_total(self) -> int:
 
-        return await self.db.sentimentanalysis.count()
+        return await self.read_db.sentimentanalysis.count()
 
     async def get_sentiment_score_by_workshop(self, workshop_id: str) -> float:
         """
@@ -174,18 +155,68 @@ class PrismaSentimentAnalysisRepository(SentimentAnalysisRepository):
         Returns:
             float: Score promedio (-1.0 a 1.0)
         """
-        sentiments = await self.db.sentimentanalysis.find_many(
-            where={"workshopId": workshop_id}
+        return self._average_score(
+            await self._count_by_label({"workshopId": workshop_id})
+        )
+
+    async def get_sentiment_scores_by_workshops(self, workshop_ids: List[str]) -> Dict[str, float]:
+        """
+        Score de sentimiento promedio de varios talleres en una sola consulta
+        agrupada por (workshopId, label). Los talleres sin análisis quedan en 0.0.
+        """
+        if not workshop_ids:
+            return {}
+
+        rows = await self.read_db.sentimentanalysis.group_by(
+            by=["workshopId", "label"],
+            where={"workshopId": {"in": list(workshop_ids)}},
+            count=True
+        )
+
+        counts_by_workshop: Dict[str, Dict[str, int]] = {workshop_id: {} for workshop_id in workshop_ids}
+        for row in rows:
+            counts_by_workshop.setdefault(row["workshopId"], {})[row["label"]] = row["_count"]["_all"]
+
+        return {
+            workshop_id: self._average_score(counts)
+            for workshop_id, counts in counts_by_workshop.items()
+        }
+
+    async def get_score_summary(self) -> Tuple[int, float]:
+        """(total de análisis, score promedio del modelo), agregado en la base de datos"""
+        rows = await self.read_db.sentimentanalysis.group_by(
+            by=["label"],
+            count=True,
+            avg={"score": True}
         )
 
-        if not sentiments:
+        total = sum(row["_count"]["_all"] for row in rows)
+        if not total:
+            return 0, 0.0
+
+        weighted = sum((row["_avg"]["score"] or 0.0) * row["_count"]["_all"] for row in rows)
+
+        return total, weighted / total
+
+    async def _count_by_label(self, where_clause: dict) -> Dict[str, int]:
+        """Conteo por etiqueta agregado en la base de datos"""
+        rows = await self.read_db.sentimentanalysis.group_by(
+            by=["label"],
+            where=where_clause,
+            count=True
+        )
+
+        return {row["label"]: row["_count"]["_all"] for row in rows}
+
+    @staticmethod
+    def _average_score(counts: Dict[str, int]) -> float:
+        """Promedio de POSITIVE=1, NEUTRAL=0, NEGATIVE=-1 a partir de los conteos"""
+        total = sum(counts.values())
+        if not total:
             return 0.0
 
-        # Mapear labels a scores numéricos
         score_map = {"POSITIVE": 1.0, "NEUTRAL": 0.0, "NEGATIVE": -1.0}
-        scores = [score_map.get(s.label, 0.0) for s in sentiments]
-
-        return sum(scores) / len(scores)
+        return sum(score_map.get(label, 0.0) * n for label, n in counts.items()) / total
 
 
     async def create(self, sentiment_analysis: SentimentAnalysis) -> SentimentAnalysis:
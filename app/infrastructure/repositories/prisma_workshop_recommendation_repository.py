@@ -0,0 +1,135 @@
+
+
+from typing import Optional, List, Dict, Any
+from uuid import UUID
+
+from prisma import Prisma
+from prisma.models import WorkshopRecommendation as PrismaWorkshopRecommendation
+
+from app.domain.entities.problem_classification import ProblemClassification
+from app.infrastructure.services.geohash import geohash_encode
+
+
+class PrismaWorkshopRecommendationRepository:
+    """
+    Listado rankeado de talleres por sesión. Se guarda completo (hasta
+    MAX_RECOMMENDATIONS) una vez por clasificación, versión del catálogo y
+    celda de ubicación del vehículo; los endpoints recortan al límite pedido.
+    """
+
+    MAX_RECOMMENDATIONS = 10
+
+    # Celda geohash de ~150 m: moverse dentro de ella no recalcula el ranking
+    LOCATION_PRECISION = 7
+
+    def __init__(self, db: Prisma, read_db: Optional[Prisma] = None):
+        self.db = db
+        # Réplica de solo lectura para analytics; sin réplica es el primario
+        self.read_db = read_db or db
+
+    @staticmethod
+    def classification_key(classification: ProblemClassification) -> str:
+        """
+        Identifica el resultado de la clasificación, no solo la fila: la
+        reclasificación actualiza categoría y tablas sobre el mismo id.
+        """
+        return ":".join([
+            str(classification.id),
+            classification.category.value,
+            classification.subcategory or "",
+            classification.tables_version or "",
+        ])
+
+    @classmethod
+    def location_key(cls, user_location: Dict[str, float]) -> str:
+        return geohash_encode(
+            user_location["latitude"],
+            user_location["longitude"],
+            cls.LOCATION_PRECISION
+        )
+
+    async def find_for_classification(
+        self,
+        session_id: UUID,
+        classification: ProblemClassification,
+        catalog_version: str,
+        user_location: Dict[str, float]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Recomendaciones guardadas para esta clasificación, catálogo y
+        ubicación, en el orden del ranking. None si no hay o si se calcularon
+        con otra clasificación, otro catálogo u otra celda de ubicación.
+        """
+        # Primario: las filas se escriben justo antes de la primera lectura
+        prisma_recs = await self.db.workshoprecommendation.find_many(
+            where={
+                "sessionId": str(session_id),
+                "classificationKey": self.classification_key(classification),
+                "catalogVersion": catalog_version,
+                "locationKey": self.location_key(user_location),
+            },
+            order={"rank": "asc"}
+        )
+
+        if not prisma_recs:
+            return None
+
+        return [self._to_dict(rec) for rec in prisma_recs]
+
+    async def replace_for_classification(
+        self,
+        session_id: UUID,
+        classification: ProblemClassification,
+        catalog_version: str,
+        user_location: Dict[str, float],
+        recommendations: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Reemplaza el listado de la sesión en una transacción: un delete_many
+        y un create_many con todas las filas.
+        """
+        classification_key = self.classification_key(classification)
+        location_key = self.location_key(user_location)
+
+        data = [
+            {
+                "sessionId": str(session_id),
+                "workshopId": rec["workshop_id"],
+                "workshopName": rec.get("workshop_name", "Taller"),
+                "matchScore": rec["match_score"],
+                "reasons": rec.get("reasons", []),
+                "distanceKm": rec.get("distance_km"),
+                "rating": rec.get("rating"),
+                "rank": rank,
+                "classificationKey": classification_key,
+                "catalogVersion": catalog_version,
+                "locationKey": location_key,
+            }
+            for rank, rec in enumerate(recommendations[:self.MAX_RECOMMENDATIONS])
+        ]
+
+        async with self.db.tx() as transaction:
+            await transaction.workshoprecommendation.delete_many(
+                where={"sessionId": str(session_id)}
+            )
+
+            if data:
+                await transaction.workshoprecommendation.create_many(data=data)
+
+        return len(data)
+
+    async def delete_by_session(self, session_id: UUID) -> None:
+        await self.db.workshoprecommendation.delete_many(
+            where={"sessionId": str(session_id)}
+        )
+
+    def _to_dict(self, prisma_rec: PrismaWorkshopRecommendation) -> Dict[str, Any]:
+        # Mismo formato que WorkshopRecommenderService.recommend_workshops
+        return {
+            "workshop_id": prisma_rec.workshopId,
+            "workshop_name": prisma_rec.workshopName,
+            "match_score": prisma_rec.matchScore,
+            "reasons": prisma_rec.reasons or [],
+            "distance_km": prisma_rec.distanceKm,
+            "rating": prisma_rec.rating if prisma_rec.rating is not None else 0.0,
+        }
@@ -5,9 +5,30 @@ import re
 
 from app.infrastructure.config import settings
 from app.domain.entities import DiagnosisSession
+from app.domain.value_objects import normalize_text
+from app.infrastructure.services.keyword_matcher import KeywordAutomaton
 
 class ClaudeService:
     
+    SYMPTOM_KEYWORDS = {
+        "Ruido anormal": ["ruido", "chirrido", "golpeteo", "zumbido", "rechinido", "trac"],
+        "Vibración": ["vibración", "vibra", "tiembla", "sacude"],
+        "Fuga de líquidos": ["fuga", "gotea", "mancha", "líquido", "charco"],
+        "Luz de alerta": ["luz", "alerta", "tablero", "check engine", "testigo", "foco"],
+        "Humo": ["humo", "humea", "vapor"],
+        "Olor anormal": ["olor", "huele", "quemado", "gasolina"],
+        "Dificultad al arrancar": ["arranca", "arranque", "enciende", "prende", "marcha"],
+        "Pérdida de potencia": ["potencia", "acelera", "fuerza", "lento", "burro"],
+        "Sobrecalentamiento": ["temperatura", "calor", "sobrecalienta", "caliente", "aguja"],
+        "Consumo excesivo": ["consume", "gasta", "combustible", "gasolina"],
+    }
+    
+    # Automata compilado una sola vez al importar el módulo
+    _SYMPTOM_MATCHER = KeywordAutomaton({
+        symptom: [normalize_text(keyword) for keyword in keywords]
+        for symptom, keywords in SYMPTOM_KEYWORDS.items()
+    })
+    
     def __init__(self):
         """Inicializa el cliente de Claude (Anthropic)"""
         self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
@@ -86,13 +107,19 @@ TONO: Profesional, amigable y tranquilizador.
             assistant_response
         )
         
-        full_text_context = session.get_conversation_text() + " " + user_message
-        symptoms = self._extract_symptoms(full_text_context)
+        # Sesiones creadas antes de detectedSymptoms empiezan vacías
+        if not session.detected_symptoms:
+            self._backfill_symptoms(session)
+        
+        # Solo se analiza el mensaje nuevo; los turnos anteriores ya están
+        # acumulados en la sesión
+        symptoms = self._extract_symptoms(normalize_text(user_message))
+        session.add_detected_symptoms(symptoms)
         
         return {
             "response": assistant_response,
             "suggested_questions": suggested_questions,
-            "symptoms_detected": symptoms
+            "symptoms_detected": session.detected_symptoms
         }
     
     async def _generate_suggested_questions(
@@ -138,30 +165,20 @@ Responde ÚNICAMENTE con un JSON array de 3 strings. Ejemplo:
             print(f"Error generando preguntas sugeridas: {e}")
             return self._get_default_questions()
     
-    def _extract_symptoms(self, conversation_text: str) -> List[str]:
-        """Extrae síntomas del texto de la conversación"""
-        symptom_keywords = {
-            "Ruido anormal": ["ruido", "chirrido", "golpeteo", "zumbido", "rechinido", "trac"],
-            "Vibración": ["vibración", "vibra", "tiembla", "sacude"],
-            "Fuga de líquidos": ["fuga", "gotea", "mancha", "líquido", "charco"],
-            "Luz de alerta": ["luz", "alerta", "tablero", "check engine", "testigo", "foco"],
-            "Humo": ["humo", "humea", "vapor"],
-            "Olor anormal": ["olor", "huele", "quemado", "gasolina"],
-            "Dificultad al arrancar": ["arranca", "arranque", "enciende", "prende", "marcha"],
-            "Pérdida de potencia": ["potencia", "acelera", "fuerza", "lento", "burro"],
-            "Sobrecalentamiento": ["temperatura", "calor", "sobrecalienta", "caliente", "aguja"],
-            "Consumo excesivo": ["consume", "gasta", "combustible", "gasolina"],
-        }
-        
-        detected_symptoms = []
-        conversation_lower = conversation_text.lower()
-        
-        for symptom, keywords in symptom_keywords.items():
-            if any(keyword in conversation_lower for keyword in keywords):
-                if symptom not in detected_symptoms:
-                    detected_symptoms.append(symptom)
-        
-        return detected_symptoms
+    def _extract_symptoms(self, normalized_text: str) -> List[str]:
+        """Extrae síntomas de un texto ya normalizado"""
+        return self._SYMPTOM_MATCHER.find_labels(normalized_text)
+    
+    def _backfill_symptoms(self, session: DiagnosisSession) -> None:
+        """
+        Analiza los mensajes de usuario anteriores de una sesión sin síntomas
+        acumulados. En cuanto se detecta alguno deja de ejecutarse.
+        """
+        for message in session.messages:
+            if message.is_user_message():
+                session.add_detected_symptoms(
+                    self._extract_symptoms(message.normalized_content.value)
+                )
     
     def _build_conversation_history(self, session: DiagnosisSession) -> List[Dict]:
         """Construye historial de conversación para Claude"""
@@ -1,134 +1,147 @@
-from typing import Tuple, Dict
+from functools import lru_cache
+from typing import Tuple, Dict, Optional
+from weakref import WeakKeyDictionary
 from app.domain.entities import ProblemClassification
 from app.domain.value_objects.problem_category import ProblemCategoryEnum
 from app.domain.value_objects.urgency_level import UrgencyLevelEnum, UrgencyLevel
 from app.domain.value_objects import ProblemCategory, CostEstimate, Currency
+from app.infrastructure.services.diagnosis_tables import (
+    DiagnosisTables,
+    DiagnosisTablesProvider,
+    get_diagnosis_tables_provider,
+)
+
+
+CostEstimateEntry = Tuple[float, float, Dict[str, Dict[str, float]], str]
+
+# Tabla precalculada (categoría, urgencia) -> estimación por cada versión de
+# las tablas; al recargarse las tablas la entrada vieja se libera sola.
+_estimate_tables: "WeakKeyDictionary[DiagnosisTables, Dict[tuple, CostEstimateEntry]]" = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=None)
+def _build_disclaimer(category_enum: ProblemCategoryEnum, u_enum: UrgencyLevelEnum) -> str:
+    base_disclaimer = (
+        "Esta es una estimación aproximada. "
+        "El costo final puede variar según el taller y la inspección detallada."
+    )
+
+    if category_enum in [ProblemCategoryEnum.ENGINE, ProblemCategoryEnum.TRANSMISSION]:
+        base_disclaimer += (
+            "\n\nNOTA: Problemas de motor o transmisión pueden tener "
+            "costos muy variables. Una inspección presencial es fundamental "
+            "para un presupuesto preciso."
+        )
+
+    if u_enum == UrgencyLevelEnum.CRITICAL:
+        base_disclaimer += (
+            "\n\nURGENTE: Los servicios de emergencia pueden tener "
+            "cargos adicionales por atención inmediata."
+        )
+
+    return base_disclaimer
 
 
 class CostEstimatorService:
-    
-    def __init__(self):
-        self.cost_ranges = self._build_cost_ranges()
-        
-        self.urgency_multipliers = {
-            UrgencyLevelEnum.CRITICAL: 1.15,  
-            UrgencyLevelEnum.HIGH: 1.10,      
-            UrgencyLevelEnum.MEDIUM: 1.0,     
-            UrgencyLevelEnum.LOW: 0.95,       
-        }
-    
-    def _build_cost_ranges(self) -> Dict[ProblemCategoryEnum, Tuple[float, float, float, float]]:
-        return {
-            ProblemCategoryEnum.ENGINE: (1500, 5000, 2000, 15000),
-            ProblemCategoryEnum.TRANSMISSION: (1200, 4000, 3000, 20000),
-            ProblemCategoryEnum.BRAKES: (400, 800, 800, 1500),
-            ProblemCategoryEnum.ELECTRICAL: (500, 1500, 300, 3000),
-            ProblemCategoryEnum.AIR_CONDITIONING: (600, 1200, 1000, 4000),
-            ProblemCategoryEnum.SUSPENSION: (500, 1000, 1200, 3500),
-            ProblemCategoryEnum.EXHAUST: (300, 600, 800, 3000),
-            ProblemCategoryEnum.FUEL_SYSTEM: (700, 1500, 1000, 5000),
-            ProblemCategoryEnum.COOLING_SYSTEM: (500, 1000, 800, 2500),
-            ProblemCategoryEnum.TIRES: (150, 300, 1200, 3000),
-            ProblemCategoryEnum.BATTERY: (100, 200, 1500, 3500),
-            ProblemCategoryEnum.LIGHTS: (150, 300, 200, 1000),
-            ProblemCategoryEnum.OTHER: (300, 1000, 500, 3000),
-        }
-    
+
+    def __init__(self, tables_provider: Optional[DiagnosisTablesProvider] = None):
+        self.tables_provider = tables_provider or get_diagnosis_tables_provider()
+
     def estimate_cost(
         self,
         classification: ProblemClassification,
-        urgency_level: UrgencyLevel 
-    ) -> Tuple[float, float, Dict[str, Dict[str, float]], str]: 
-
-        category_enum = classification.category.value
-        
-        if category_enum not in self.cost_ranges:
-            category_enum = ProblemCategoryEnum.OTHER
-        
-        labor_min, labor_max, parts_min, parts_max = self.cost_ranges[category_enum]
-        
-        if hasattr(urgency_level, 'level'):
-            u_enum = urgency_level.level
-        else:
-            u_enum = urgency_level
+        urgency_level: UrgencyLevel
+    ) -> Tuple[float, float, Dict[str, Dict[str, float]], str]:
+
+        total_min, total_max, breakdown, disclaimer = self._lookup_estimate(
+            classification.category.value,
+            urgency_level
+        )
+
+        return total_min, total_max, self._copy_breakdown(breakdown), disclaimer
+
+    def get_cost_breakdown(
+        self,
+        classification: ProblemClassification,
+        urgency_level: UrgencyLevel
+    ) -> Dict[str, Dict[str, float]]:
+        _, _, breakdown, _ = self._lookup_estimate(
+            classification.category.value,
+            urgency_level
+        )
+
+        return self._copy_breakdown(breakdown)
+
+    def generate_disclaimer(
+        self,
+        category: ProblemCategory,
+        urgency_level: UrgencyLevel
+    ) -> str:
+        return _build_disclaimer(category.value, self._urgency_enum(urgency_level))
+
+    def _lookup_estimate(
+        self,
+        category_enum: ProblemCategoryEnum,
+        urgency_level: UrgencyLevel
+    ) -> CostEstimateEntry:
+        tables = self.tables_provider.tables
+
+        estimates = _estimate_tables.get(tables)
+        if estimates is None:
+            estimates = self._build_estimates(tables)
+            _estimate_tables[tables] = estimates
+
+        u_enum = self._urgency_enum(urgency_level)
+
+        estimate = estimates.get((category_enum, u_enum))
+        if estimate is None:
+            estimate = self._compute_estimate(tables, category_enum, u_enum)
+
+        return estimate
+
+    def _build_estimates(self, tables: DiagnosisTables) -> Dict[tuple, CostEstimateEntry]:
+        return {
+            (category_enum, u_enum): self._compute_estimate(tables, category_enum, u_enum)
+            for category_enum in ProblemCategoryEnum
+            for u_enum in UrgencyLevelEnum
+        }
+
+    def _compute_estimate(
+        self,
+        tables: DiagnosisTables,
+        category_enum: ProblemCategoryEnum,
+        u_enum: UrgencyLevelEnum
+    ) -> CostEstimateEntry:
+        cost_category = category_enum if category_enum in tables.cost_ranges else ProblemCategoryEnum.OTHER
+
+        labor_min, labor_max, parts_min, parts_max = tables.cost_ranges[cost_category]
+
+        urgency_multiplier = tables.urgency_multipliers.get(u_enum, 1.0)
 
-        urgency_multiplier = self.urgency_multipliers.get(u_enum, 1.0)
-        
         labor_min_adj = labor_min * urgency_multiplier
         labor_max_adj = labor_max * urgency_multiplier
         parts_min_adj = parts_min * urgency_multiplier
         parts_max_adj = parts_max * urgency_multiplier
-        
+
         total_min = labor_min_adj + parts_min_adj
         total_max = labor_max_adj + parts_max_adj
-        
+
         breakdown = {
             "labor": {"min": labor_min_adj, "max": labor_max_adj},
             "parts": {"min": parts_min_adj, "max": parts_max_adj}
         }
-        
-        disclaimer = self.generate_disclaimer(classification.category, urgency_level)
 
-        
-        return total_min, total_max, breakdown, disclaimer
-    
-    def get_cost_breakdown(
-        self,
-        classification: ProblemClassification,
-        urgency_level: UrgencyLevel
-    ) -> Dict[str, Dict[str, float]]:
-        category_enum = classification.category.value
-        if category_enum not in self.cost_ranges:
-            category_enum = ProblemCategoryEnum.OTHER
-        
-        labor_min, labor_max, parts_min, parts_max = self.cost_ranges[category_enum]
-        
+        return total_min, total_max, breakdown, _build_disclaimer(category_enum, u_enum)
+
+    @staticmethod
+    def _urgency_enum(urgency_level: UrgencyLevel) -> UrgencyLevelEnum:
         if hasattr(urgency_level, 'level'):
-            u_enum = urgency_level.level
-        else:
-            u_enum = urgency_level
+            return urgency_level.level
+        return urgency_level
 
-        urgency_multiplier = self.urgency_multipliers.get(u_enum, 1.0)
-        
+    @staticmethod
+    def _copy_breakdown(breakdown: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
         return {
-            "labor": {
-                "min": labor_min * urgency_multiplier,
-                "max": labor_max * urgency_multiplier
-            },
-            "parts": {
-                "min": parts_min * urgency_multiplier,
-                "max": parts_max * urgency_multiplier
-            }
+            "labor": dict(breakdown["labor"]),
+            "parts": dict(breakdown["parts"])
         }
-    
-    def generate_disclaimer(
-        self,
-        category: ProblemCategory,
-        urgency_level: UrgencyLevel
-    ) -> str:
-        base_disclaimer = (
-            "Esta es una estimación aproximada. "
-            "El costo final puede variar según el taller y la inspección detallada."
-        )
-        
-        category_enum = category.value
-
-        if category_enum in [ProblemCategoryEnum.ENGINE, ProblemCategoryEnum.TRANSMISSION]:
-            base_disclaimer += (
-                "\n\nNOTA: Problemas de motor o transmisión pueden tener "
-                "costos muy variables. Una inspección presencial es fundamental "
-                "para un presupuesto preciso."
-            )
-        
-        if hasattr(urgency_level, 'level'):
-            u_enum = urgency_level.level
-        else:
-            u_enum = urgency_level
-
-        if u_enum == UrgencyLevelEnum.CRITICAL:
-            base_disclaimer += (
-                "\n\nURGENTE: Los servicios de emergencia pueden tener "
-                "cargos adicionales por atención inmediata."
-            )
-        
-        return base_disclaimer
\ No newline at end of file
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from app.domain.value_objects.normalized_text import normalize_text
+from app.domain.value_objects.problem_category import ProblemCategoryEnum
+from app.domain.value_objects.urgency_level import UrgencyLevelEnum
+from app.infrastructure.config.settings import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TABLES_PATH = Path(__file__).resolve().parent.parent / "data" / "diagnosis_tables.json"
+
+# Bits de la máscara de síntomas usada por la tabla de decisión de urgencia
+SYMPTOM_CRITICAL = 1
+SYMPTOM_HIGH_URGENCY = 2
+SYMPTOM_CATEGORY_CRITICAL = 4
+
+URGENCY_CRITICAL = "CRITICAL"
+URGENCY_HIGH = "HIGH"
+URGENCY_HIGH_MODERATE = "HIGH_MODERATE"
+URGENCY_MEDIUM = "MEDIUM"
+URGENCY_LOW = "LOW"
+
+MAX_MEMOIZED_SYMPTOMS = 10000
+
+
+class DiagnosisTables:
+    """
+    Tablas de palabras clave, síntomas y costos compiladas a partir de un
+    archivo de datos versionado. Las instancias son de solo lectura: una
+    recarga crea una instancia nueva y la reemplaza completa.
+    """
+
+    def __init__(self, data: Dict):
+        self.version = str(data["version"])
+
+        # Las palabras clave y patrones se guardan normalizados (sin acentos ni
+        # mayúsculas) para compararlos contra texto normalizado; keyword_labels
+        # conserva la forma original para mostrar los síntomas al usuario.
+        classifier = data["classifier"]
+        self.category_keywords: Dict[str, Tuple[Tuple[str, float], ...]] = {}
+        self.keyword_labels: Dict[str, str] = {}
+        for category, keywords in classifier["category_keywords"].items():
+            ProblemCategoryEnum(category)
+            compiled = {}
+            for keyword, weight in keywords.items():
+                normalized = normalize_text(keyword)
+                compiled[normalized] = max(float(weight), compiled.get(normalized, 0.0))
+                self.keyword_labels.setdefault(normalized, keyword)
+            self.category_keywords[category] = tuple(compiled.items())
+
+        urgency = data["urgency"]
+        self.critical_categories = self._categories(urgency["critical_categories"])
+        self.high_urgency_categories = self._categories(urgency["high_urgency_categories"])
+        self.medium_urgency_categories = self._categories(urgency["medium_urgency_categories"])
+        self.low_urgency_categories = self._categories(urgency["low_urgency_categories"])
+        self.critical_symptoms = self._patterns(urgency["critical_symptoms"])
+        self.high_urgency_symptoms = self._patterns(urgency["high_urgency_symptoms"])
+        self.category_critical_symptoms: Dict[ProblemCategoryEnum, Tuple[str, ...]] = {
+            ProblemCategoryEnum(category): self._patterns(symptoms)
+            for category, symptoms in urgency["category_critical_symptoms"].items()
+        }
+
+        cost = data["cost"]
+        self.cost_ranges: Dict[ProblemCategoryEnum, Tuple[float, float, float, float]] = {}
+        for category, values in cost["cost_ranges"].items():
+            labor_min, labor_max, parts_min, parts_max = (float(v) for v in values)
+            self.cost_ranges[ProblemCategoryEnum(category)] = (labor_min, labor_max, parts_min, parts_max)
+
+        if ProblemCategoryEnum.OTHER not in self.cost_ranges:
+            raise ValueError("cost_ranges debe incluir la categoría OTHER")
+
+        self.urgency_multipliers: Dict[UrgencyLevelEnum, float] = {
+            UrgencyLevelEnum(level): float(multiplier)
+            for level, multiplier in cost["urgency_multipliers"].items()
+        }
+
+        # Cada categoría con síntomas críticos propios usa un bit por encima
+        # de los tres bits de la máscara de decisión.
+        self._category_bits: Dict[ProblemCategoryEnum, int] = {
+            category: 1 << (3 + i)
+            for i, category in enumerate(self.category_critical_symptoms)
+        }
+        self._symptom_flags: Dict[str, int] = {}
+        for keywords in self.category_keywords.values():
+            for keyword, _ in keywords:
+                self.symptom_flags(keyword)
+
+        self.urgency_decisions = self._build_urgency_decisions()
+
+    @staticmethod
+    def _categories(values) -> FrozenSet[ProblemCategoryEnum]:
+        return frozenset(ProblemCategoryEnum(v) for v in values)
+
+    @staticmethod
+    def _patterns(values) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(normalize_text(v) for v in values))
+
+    def keyword_label(self, keyword: str) -> str:
+        return self.keyword_labels.get(keyword, keyword)
+
+    def symptom_flags(self, symptom: str) -> int:
+        """
+        Flags de un síntoma o de varios unidos por espacios, memoizados (el
+        vocabulario es prácticamente cerrado y las combinaciones se repiten).
+        """
+        key = normalize_text(symptom)
+        flags = self._symptom_flags.get(key)
+        if flags is not None:
+            return flags
+
+        flags = 0
+        if any(pattern in key for pattern in self.critical_symptoms):
+            flags |= SYMPTOM_CRITICAL
+        if any(pattern in key for pattern in self.high_urgency_symptoms):
+            flags |= SYMPTOM_HIGH_URGENCY
+        for category, patterns in self.category_critical_symptoms.items():
+            if any(pattern in key for pattern in patterns):
+                flags |= self._category_bits[category]
+
+        if len(self._symptom_flags) < MAX_MEMOIZED_SYMPTOMS:
+            self._symptom_flags[key] = flags
+
+        return flags
+
+    def symptoms_mask(self, category: ProblemCategoryEnum, symptoms: Iterable[str]) -> int:
+
+        # Sobre el texto unido, como la ramificación original: un patrón
+        # puede abarcar dos síntomas contiguos ("temperatura" + "alta")
+        flags = self.symptom_flags(" ".join(symptoms))
+
+        mask = flags & (SYMPTOM_CRITICAL | SYMPTOM_HIGH_URGENCY)
+        if flags & self._category_bits.get(category, 0):
+            mask |= SYMPTOM_CATEGORY_CRITICAL
+
+        return mask
+
+    def urgency_outcome(self, category: ProblemCategoryEnum, symptoms: Iterable[str]) -> str:
+
+        return self.urgency_decisions[(category, self.symptoms_mask(category, symptoms))]
+
+    def _build_urgency_decisions(self) -> Dict[Tuple[ProblemCategoryEnum, int], str]:
+
+        decisions = {}
+        for category in ProblemCategoryEnum:
+            for mask in range(8):
+                if category in self.critical_categories or mask & SYMPTOM_CRITICAL:
+                    outcome = URGENCY_CRITICAL
+                elif category in self.high_urgency_categories:
+                    if mask & SYMPTOM_CATEGORY_CRITICAL:
+                        outcome = URGENCY_CRITICAL
+                    elif mask & SYMPTOM_HIGH_URGENCY:
+                        outcome = URGENCY_HIGH
+                    else:
+                        outcome = URGENCY_HIGH_MODERATE
+                elif category in self.medium_urgency_categories:
+                    outcome = URGENCY_MEDIUM
+                else:
+                    outcome = URGENCY_LOW
+                decisions[(category, mask)] = outcome
+        return decisions
+
+
+def load_diagnosis_tables(path: Path) -> DiagnosisTables:
+
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    return DiagnosisTables(data)
+
+
+class DiagnosisTablesProvider:
+    """
+    Mantiene las tablas vigentes y las recarga cuando cambia el archivo.
+
+    La recarga parsea y compila fuera del event loop y luego reemplaza la
+    referencia en una sola asignación, así que las peticiones en curso
+    siguen usando la versión que ya tenían.
+    """
+
+    def __init__(self, path: Path = DEFAULT_TABLES_PATH):
+        self._path = Path(path)
+        self._mtime = self._read_mtime()
+        self._tables = load_diagnosis_tables(self._path)
+        logger.info(f"Tablas de diagnóstico cargadas (versión {self._tables.version})")
+
+    @property
+    def tables(self) -> DiagnosisTables:
+        return self._tables
+
+    def _read_mtime(self) -> Optional[float]:
+        try:
+            return self._path.stat().st_mtime
+        except OSError:
+            return None
+
+    def reload_if_changed(self) -> bool:
+
+        mtime = self._read_mtime()
+        if mtime is None or mtime == self._mtime:
+            return False
+
+        try:
+            tables = load_diagnosis_tables(self._path)
+        except Exception as e:
+            logger.error(f"Error recargando tablas de diagnóstico, se mantiene la versión {self._tables.version}: {e}")
+            self._mtime = mtime
+            return False
+
+        self._mtime = mtime
+        self._tables = tables
+        logger.info(f"Tablas de diagnóstico recargadas (versión {tables.version})")
+        return True
+
+    async def watch(self, interval_seconds: float) -> None:
+
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await asyncio.to_thread(self.reload_if_changed)
+
+
+_provider_instance: Optional[DiagnosisTablesProvider] = None
+
+
+def get_diagnosis_tables_provider() -> DiagnosisTablesProvider:
+
+    global _provider_instance
+
+    if _provider_instance is None:
+        settings = get_settings()
+        path = Path(settings.DIAGNOSIS_TABLES_PATH) if settings.DIAGNOSIS_TABLES_PATH else DEFAULT_TABLES_PATH
+        _provider_instance = DiagnosisTablesProvider(path)
+
+    return _provider_instance
+
+
+def get_diagnosis_tables() -> DiagnosisTables:
+
+    return get_diagnosis_tables_provider().tables
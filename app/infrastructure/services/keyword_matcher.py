@@ -0,0 +1,74 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+class KeywordAutomaton:
+    """
+    Automata Aho-Corasick sobre texto normalizado.
+
+    Se compila una sola vez a partir de {etiqueta: [palabras clave]} y
+    encuentra todas las etiquetas presentes en una sola pasada por el texto,
+    sin importar cuántas palabras clave haya.
+    """
+
+    def __init__(self, keywords_by_label: Dict[str, Iterable[str]]):
+        self._labels: List[str] = list(keywords_by_label.keys())
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[int]] = [set()]
+
+        for label_index, label in enumerate(self._labels):
+            for keyword in keywords_by_label[label]:
+                if keyword:
+                    self._add_keyword(keyword, label_index)
+
+        self._build_failure_links()
+
+    def _add_keyword(self, keyword: str, label_index: int) -> None:
+
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = next_state
+
+        self._output[state].add(label_index)
+
+    def _build_failure_links(self) -> None:
+
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def find_labels(self, text: str) -> List[str]:
+        """Etiquetas encontradas en el texto, en el orden en que se declararon."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        found: Set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                found |= output[state]
+                if len(found) == len(self._labels):
+                    break
+
+        return [self._labels[i] for i in sorted(found)]
@@ -0,0 +1,124 @@
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.services.geohash import geohash_bounds, geohash_encode
+from app.infrastructure.services.workshop_catalog import WorkshopCatalog
+from app.infrastructure.services.workshop_scoring import haversine_km
+
+
+class RecommendationCellCache:
+    """
+    Candidatos de recomendación por celda geohash, especialidad y radio.
+
+    Para cada celda se guardan los talleres a menos de radio + semidiagonal
+    de la celda desde su centro: es un superconjunto de los que están dentro
+    del radio desde cualquier punto de la celda. Cada petición solo recalcula
+    distancias, puntaje y razones sobre esos candidatos desde su punto exacto,
+    así que el resultado es el mismo que sin cache.
+
+    Las entradas pertenecen a una versión del catálogo; cuando el catálogo se
+    sincroniza (versión nueva) el cache se vacía.
+    """
+
+    def __init__(self, precision: int = 5, max_entries: int = 5000):
+        self.precision = precision
+        self.max_entries = max_entries
+        self._catalog_version: Optional[int] = None
+        self._entries: "OrderedDict[Tuple[str, str, float], np.ndarray]" = OrderedDict()
+        self._stats: Counter = Counter()
+
+    def candidates(
+        self,
+        catalog: WorkshopCatalog,
+        latitude: float,
+        longitude: float,
+        specialty: str,
+        radius_km: float
+    ) -> np.ndarray:
+        """Índices candidatos (en orden de carga) para el punto, sin filtrar la distancia exacta."""
+        if catalog.version != self._catalog_version:
+            self.invalidate()
+            self._catalog_version = catalog.version
+
+        cell = geohash_encode(latitude, longitude, self.precision)
+        key = (cell, specialty, radius_km)
+
+        indexes = self._entries.get(key)
+        if indexes is not None:
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return indexes
+
+        self._stats["misses"] += 1
+        indexes = self._cell_candidates(catalog, cell, specialty, radius_km)
+
+        self._entries[key] = indexes
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+        return indexes
+
+    def _cell_candidates(
+        self,
+        catalog: WorkshopCatalog,
+        cell: str,
+        specialty: str,
+        radius_km: float
+    ) -> np.ndarray:
+
+        target_bit = catalog.specialty_bit(specialty)
+        if not target_bit:
+            return np.empty(0, dtype=np.intp)
+
+        lat_min, lat_max, lon_min, lon_max = geohash_bounds(cell)
+        center_lat = (lat_min + lat_max) / 2
+        center_lon = (lon_min + lon_max) / 2
+
+        half_diagonal_km = float(np.max(haversine_km(
+            center_lat,
+            center_lon,
+            np.array([lat_min, lat_min, lat_max, lat_max]),
+            np.array([lon_min, lon_max, lon_min, lon_max])
+        )))
+
+        indexes, _ = catalog.nearby(center_lat, center_lon, radius_km + half_diagonal_km, target_bit)
+        return indexes
+
+    def invalidate(self) -> None:
+        if self._entries:
+            self._stats["invalidations"] += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"]
+
+        return {
+            "entries": len(self._entries),
+            "catalogVersion": self._catalog_version,
+            "hits": self._stats["hits"],
+            "misses": self._stats["misses"],
+            "evictions": self._stats["evictions"],
+            "invalidations": self._stats["invalidations"],
+            "hitRatio": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+_cache_instance: Optional[RecommendationCellCache] = None
+
+
+def get_recommendation_cell_cache() -> RecommendationCellCache:
+
+    global _cache_instance
+
+    if _cache_instance is None:
+        settings = get_settings()
+        _cache_instance = RecommendationCellCache(
+            precision=settings.RECOMMENDATION_CELL_PRECISION,
+            max_entries=settings.RECOMMENDATION_CELL_CACHE_MAX_ENTRIES
+        )
+
+    return _cache_instance
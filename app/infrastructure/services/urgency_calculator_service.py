@@ -1,154 +1,81 @@
-from typing import List, Tuple
+from typing import List, Tuple, Optional, Union
 from app.domain.entities import ProblemClassification
 from app.domain.value_objects.urgency_level import UrgencyLevelEnum
 from app.domain.value_objects.problem_category import ProblemCategoryEnum
+from app.infrastructure.services.diagnosis_tables import (
+    DiagnosisTablesProvider,
+    get_diagnosis_tables_provider,
+    URGENCY_CRITICAL,
+    URGENCY_HIGH,
+    URGENCY_HIGH_MODERATE,
+    URGENCY_MEDIUM,
+    URGENCY_LOW,
+)
 
 
 class UrgencyCalculatorService:
-    
-    def __init__(self):
-        self.critical_categories = [
-            ProblemCategoryEnum.BRAKES,         
-            ProblemCategoryEnum.SUSPENSION, 
-        ]
-        
-        self.high_urgency_categories = [
-            ProblemCategoryEnum.ENGINE,         
-            ProblemCategoryEnum.TRANSMISSION,   
-            ProblemCategoryEnum.COOLING_SYSTEM, 
-            ProblemCategoryEnum.FUEL_SYSTEM,    
-        ]
-        
-        self.medium_urgency_categories = [
-            ProblemCategoryEnum.EXHAUST,
-            ProblemCategoryEnum.ELECTRICAL,
-            ProblemCategoryEnum.AIR_CONDITIONING,
-            ProblemCategoryEnum.BATTERY,
-        ]
-        
-        self.low_urgency_categories = [
-            ProblemCategoryEnum.LIGHTS,
-            ProblemCategoryEnum.TIRES,
-            ProblemCategoryEnum.OTHER,
-        ]
-        
-        self.critical_symptoms = [
-            "freno", "frenos", "pedal", "no frena", "se hunde",
-            "vibra al frenar", "chirrido al frenar", "humo", "fuego",
-            "sobrecalienta", "temperatura alta", "pierde dirección",
-            "volante duro", "no gira", "rueda bloqueada",
-        ]
-        
-        self.high_urgency_symptoms = [
-            "fuga", "gotea", "mancha", "olor a quemado", "humea",
-            "vibración fuerte", "ruido metálico", "no arranca",
-            "se apaga", "pierde potencia",
-        ]
-    
-    def calculate_urgency(
-        self,
-        classification: ProblemClassification
-    ) -> Tuple[UrgencyLevelEnum, str, bool, int]: 
-        
-        category_enum = classification.category.value 
-        
-        symptoms = classification.symptoms
-        
-        if category_enum in self.critical_categories:
-            return self._create_critical_urgency()
-        
-        if self._has_critical_symptoms(symptoms):
-            return self._create_critical_urgency()
-        
-        if category_enum in self.high_urgency_categories:
-            if self._has_critical_symptoms_for_category(category_enum, symptoms):
-                return self._create_critical_urgency()
-            
-            if self._has_high_urgency_symptoms(symptoms):
-                return self._create_high_urgency()
-            
-            return self._create_high_urgency_moderate()
-        
-        if category_enum in self.medium_urgency_categories:
-            return self._create_medium_urgency()
-        
-        return self._create_low_urgency()
-    
-    def _has_critical_symptoms(self, symptoms: List[str]) -> bool:
-        symptoms_text = " ".join(symptoms).lower()
-        return any(
-            critical_symptom in symptoms_text
-            for critical_symptom in self.critical_symptoms
-        )
-    
-    def _has_critical_symptoms_for_category(
-        self,
-        category: ProblemCategoryEnum, 
-        symptoms: List[str]
-    ) -> bool:
-        symptoms_text = " ".join(symptoms).lower()
-        
-        if category == ProblemCategoryEnum.ENGINE:
-            if any(s in symptoms_text for s in ["sobrecalienta", "temperatura alta", "humo"]):
-                return True
-        
-        if category == ProblemCategoryEnum.TRANSMISSION:
-            if any(s in symptoms_text for s in ["no entra", "patina", "se atora"]):
-                return True
-        
-        if category == ProblemCategoryEnum.FUEL_SYSTEM:
-            if any(s in symptoms_text for s in ["fuga", "gotea", "olor a gasolina"]):
-                return True
-        
-        if category == ProblemCategoryEnum.COOLING_SYSTEM:
-            if any(s in symptoms_text for s in ["temperatura alta", "sobrecalienta"]):
-                return True
-        
-        return False
-    
-    def _has_high_urgency_symptoms(self, symptoms: List[str]) -> bool:
-        symptoms_text = " ".join(symptoms).lower()
-        return any(
-            symptom in symptoms_text
-            for symptom in self.high_urgency_symptoms
-        )
-    
-    def _create_critical_urgency(self) -> Tuple[UrgencyLevelEnum, str, bool, int]:
-        return (
+
+    URGENCY_OUTCOMES = {
+        URGENCY_CRITICAL: (
             UrgencyLevelEnum.CRITICAL,
             "URGENTE: Problema crítico de seguridad. NO conduzca el vehículo. Contacte un servicio de grúa inmediatamente.",
-            False,  
-            0       
-        )
-    
-    def _create_high_urgency(self) -> Tuple[UrgencyLevelEnum, str, bool, int]:
-        return (
+            False,
+            0
+        ),
+        URGENCY_HIGH: (
             UrgencyLevelEnum.HIGH,
             "ATENCIÓN URGENTE: Problema serio. Evite conducir distancias largas. Taller 24-48h.",
-            True,   
-            50      
-        )
-    
-    def _create_high_urgency_moderate(self) -> Tuple[UrgencyLevelEnum, str, bool, int]:
-        return (
+            True,
+            50
+        ),
+        URGENCY_HIGH_MODERATE: (
             UrgencyLevelEnum.HIGH,
             "ALTA PRIORIDAD: Requiere atención pronto. Conduzca con precaución. Taller 1-3 días.",
-            True,   
-            200     
-        )
-    
-    def _create_medium_urgency(self) -> Tuple[UrgencyLevelEnum, str, bool, int]:
-        return (
+            True,
+            200
+        ),
+        URGENCY_MEDIUM: (
             UrgencyLevelEnum.MEDIUM,
             "PROGRAMAR SERVICIO: Atender en 1-2 semanas.",
-            True,   
-            1000    
-        )
-    
-    def _create_low_urgency(self) -> Tuple[UrgencyLevelEnum, str, bool, int]:
-        return (
+            True,
+            1000
+        ),
+        URGENCY_LOW: (
             UrgencyLevelEnum.LOW,
             "MANTENIMIENTO PREVENTIVO: Puede esperar al próximo servicio.",
-            True,   
-            5000    
-        )
\ No newline at end of file
+            True,
+            5000
+        ),
+    }
+
+    def __init__(self, tables_provider: Optional[DiagnosisTablesProvider] = None):
+        self.tables_provider = tables_provider or get_diagnosis_tables_provider()
+
+    def calculate_urgency(
+        self,
+        classification: ProblemClassification
+    ) -> Tuple[UrgencyLevelEnum, str, bool, int]:
+
+        return self.calculate_urgency_from_primitives(
+            classification.category.value,
+            classification.symptoms
+        )
+
+    def calculate_urgency_from_primitives(
+        self,
+        category: Union[ProblemCategoryEnum, str],
+        symptoms: List[str]
+    ) -> Tuple[UrgencyLevelEnum, str, bool, int]:
+        """
+        Urgencia a partir de la categoría y los síntomas en crudo (p. ej. filas
+        de Prisma en analytics). Es una búsqueda O(1) en la tabla de decisión
+        precalculada por categoría y máscara de síntomas.
+        """
+        try:
+            category_enum = ProblemCategoryEnum(category)
+        except ValueError:
+            category_enum = ProblemCategoryEnum.OTHER
+
+        outcome = self.tables_provider.tables.urgency_outcome(category_enum, symptoms)
+
+        return self.URGENCY_OUTCOMES[outcome]
@@ -0,0 +1,297 @@
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.services.workshop_scoring import haversine_km
+
+
+logger = logging.getLogger(__name__)
+
+KM_PER_DEGREE = 111.32
+
+# Orden fijo de bits para las especialidades conocidas; las desconocidas se
+# agregan al cargar cada catálogo (máximo 64 en total).
+KNOWN_SPECIALTIES = (
+    "MOTOR",
+    "TRANSMISION",
+    "FRENOS",
+    "ELECTRICO",
+    "AIRE_ACONDICIONADO",
+    "SUSPENSION",
+    "ESCAPE",
+    "SISTEMA_COMBUSTIBLE",
+    "SISTEMA_ENFRIAMIENTO",
+    "NEUMATICOS",
+    "BATERIA",
+    "LUCES",
+    "GENERAL",
+)
+
+MAX_SPECIALTIES = 64
+
+
+class WorkshopCatalog:
+    """
+    Copia local e inmutable de los talleres en columnas NumPy con un índice
+    espacial de celdas lat/lon y una máscara de bits de especialidades.
+
+    nearby() solo revisa las celdas que cubren el radio pedido, así que la
+    consulta no depende del tamaño total del catálogo.
+    """
+
+    def __init__(self, workshops: Iterable[Dict[str, Any]], version: int, cell_degrees: float = 0.1):
+        self.version = version
+        self.cell_degrees = cell_degrees
+        self.loaded_at = time.time()
+
+        self.specialty_bits: Dict[str, int] = {
+            specialty: 1 << bit for bit, specialty in enumerate(KNOWN_SPECIALTIES)
+        }
+
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.latitudes = array("d")
+        self.longitudes = array("d")
+        self.ratings = array("d")
+        self.specialty_masks = array("Q")
+        self._cells: Dict[Tuple[int, int], array] = {}
+
+        for workshop in workshops:
+            self._add(workshop)
+
+        self._freeze()
+
+    def _freeze(self) -> None:
+        """Pasa las columnas y las celdas a arreglos NumPy (sin copia)."""
+        self.latitudes = self._as_numpy(self.latitudes, np.float64)
+        self.longitudes = self._as_numpy(self.longitudes, np.float64)
+        self.ratings = self._as_numpy(self.ratings, np.float64)
+        self.specialty_masks = self._as_numpy(self.specialty_masks, np.uint64)
+        self._cells = {cell: self._as_numpy(bucket, np.uint32) for cell, bucket in self._cells.items()}
+        self.fingerprint = self._fingerprint()
+
+    def _fingerprint(self) -> str:
+        """
+        Huella del contenido del catálogo. A diferencia de version (contador
+        local del proceso) es la misma en todos los workers y tras reiniciar
+        mientras los talleres no cambien.
+        """
+        digest = hashlib.blake2b(digest_size=12)
+        digest.update("\x1f".join(self.ids).encode())
+        digest.update("\x1f".join(self.names).encode())
+        digest.update("\x1f".join(self.specialty_bits).encode())
+        for column in (self.latitudes, self.longitudes, self.ratings, self.specialty_masks):
+            digest.update(column.tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _as_numpy(values: array, dtype) -> np.ndarray:
+        if not len(values):
+            return np.empty(0, dtype=dtype)
+        return np.frombuffer(values, dtype=dtype)
+
+    def _add(self, workshop: Dict[str, Any]) -> None:
+
+        workshop_id = workshop.get("id")
+        latitude = workshop.get("latitude")
+        longitude = workshop.get("longitude")
+
+        if not workshop_id or latitude is None or longitude is None:
+            return
+
+        index = len(self.ids)
+        self.ids.append(workshop_id)
+        self.names.append(workshop.get("businessName", "Taller"))
+        self.latitudes.append(float(latitude))
+        self.longitudes.append(float(longitude))
+        self.ratings.append(float(workshop.get("overallRating") or 0.0))
+        self.specialty_masks.append(self._mask_for(
+            s.get("specialtyType") for s in workshop.get("specialties", [])
+        ))
+
+        cell = self._cell(float(latitude), float(longitude))
+        self._cells.setdefault(cell, array("I")).append(index)
+
+    def _mask_for(self, specialty_types: Iterable[Optional[str]]) -> int:
+
+        mask = 0
+        for specialty in specialty_types:
+            if not specialty:
+                continue
+            bit = self.specialty_bits.get(specialty)
+            if bit is None:
+                if len(self.specialty_bits) >= MAX_SPECIALTIES:
+                    continue
+                bit = 1 << len(self.specialty_bits)
+                self.specialty_bits[specialty] = bit
+            mask |= bit
+
+        return mask
+
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return (
+            math.floor(latitude / self.cell_degrees),
+            math.floor(longitude / self.cell_degrees)
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def specialty_bit(self, specialty: str) -> int:
+        """Bit de la especialidad, o 0 si ningún taller del catálogo la tiene."""
+        return self.specialty_bits.get(specialty, 0)
+
+    def specialty_types(self, index: int) -> List[str]:
+        mask = int(self.specialty_masks[index])
+        return [specialty for specialty, bit in self.specialty_bits.items() if mask & bit]
+
+    def candidate_indexes(self, latitude: float, longitude: float, radius_km: float) -> np.ndarray:
+        """Índices de los talleres en las celdas que cubren el radio (sin filtrar distancia)."""
+        dlat = radius_km / KM_PER_DEGREE
+        dlon = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01))
+
+        min_lat, min_lon = self._cell(latitude - dlat, longitude - dlon)
+        max_lat, max_lon = self._cell(latitude + dlat, longitude + dlon)
+
+        buckets = []
+        for cell_lat in range(min_lat, max_lat + 1):
+            for cell_lon in range(min_lon, max_lon + 1):
+                bucket = self._cells.get((cell_lat, cell_lon))
+                if bucket is not None:
+                    buckets.append(bucket)
+
+        if not buckets:
+            return np.empty(0, dtype=np.intp)
+
+        return np.sort(np.concatenate(buckets)).astype(np.intp)
+
+    def nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        required_mask: int = 0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (índices, distancias en km) de los talleres dentro del radio, en orden
+        de carga. Con required_mask solo se incluyen los que tienen alguna de
+        esas especialidades.
+        """
+        indexes = self.candidate_indexes(latitude, longitude, radius_km)
+
+        if required_mask:
+            indexes = indexes[(self.specialty_masks[indexes] & np.uint64(required_mask)) != 0]
+
+        distances = haversine_km(latitude, longitude, self.latitudes[indexes], self.longitudes[indexes])
+        within = distances <= radius_km
+
+        return indexes[within], distances[within]
+
+
+class IncompleteCatalogError(Exception):
+    """La descarga terminó antes de recibir los talleres que anunció workshop-service."""
+
+
+class WorkshopCatalogProvider:
+    """
+    Mantiene el catálogo vigente y lo sincroniza periódicamente desde
+    workshop-service. El catálogo nuevo se construye fuera del event loop y
+    reemplaza la referencia en una sola asignación; si falla cualquier página,
+    faltan talleres o la descarga viene vacía se conserva el anterior.
+    """
+
+    def __init__(self, workshop_client=None, cell_degrees: float = 0.1, page_size: int = 100):
+        self._workshop_client = workshop_client
+        self.cell_degrees = cell_degrees
+        self.page_size = page_size
+        self._catalog: Optional[WorkshopCatalog] = None
+        self._version = 0
+
+    @property
+    def catalog(self) -> Optional[WorkshopCatalog]:
+        return self._catalog
+
+    @property
+    def workshop_client(self):
+        if self._workshop_client is None:
+            from app.infrastructure.clients import get_workshop_service_client
+            self._workshop_client = get_workshop_service_client()
+        return self._workshop_client
+
+    async def _fetch_all(self) -> List[Dict[str, Any]]:
+        """
+        Descarga todas las páginas. Cualquier página fallida aborta la
+        descarga completa: un catálogo truncado no debe reemplazar al vigente.
+        """
+        workshops: List[Dict[str, Any]] = []
+        page = 1
+
+        while True:
+            response = await self.workshop_client.fetch_workshops_page(page=page, limit=self.page_size)
+            data = response.get("data", [])
+            workshops.extend(data)
+
+            total = response.get("total") or 0
+            if total and len(workshops) >= total:
+                return workshops
+
+            if len(data) < self.page_size:
+                if total:
+                    raise IncompleteCatalogError(
+                        f"página {page} con {len(data)} talleres; "
+                        f"se esperaban {total} y se recibieron {len(workshops)}"
+                    )
+                return workshops
+
+            page += 1
+
+    async def refresh(self) -> bool:
+
+        try:
+            workshops = await self._fetch_all()
+        except Exception as e:
+            logger.error(f"Error sincronizando catálogo de talleres: {e}")
+            return False
+
+        if not workshops:
+            logger.warning("workshop-service no devolvió talleres; se mantiene el catálogo actual")
+            return False
+
+        catalog = await asyncio.to_thread(
+            WorkshopCatalog, workshops, self._version + 1, self.cell_degrees
+        )
+
+        self._version = catalog.version
+        self._catalog = catalog
+        logger.info(f"Catálogo de talleres sincronizado (versión {catalog.version}, {len(catalog)} talleres)")
+        return True
+
+    async def watch(self, interval_seconds: float) -> None:
+
+        while True:
+            await self.refresh()
+            await asyncio.sleep(interval_seconds)
+
+
+_provider_instance: Optional[WorkshopCatalogProvider] = None
+
+
+def get_workshop_catalog_provider() -> WorkshopCatalogProvider:
+
+    global _provider_instance
+
+    if _provider_instance is None:
+        settings = get_settings()
+        _provider_instance = WorkshopCatalogProvider(
+            cell_degrees=settings.WORKSHOP_CATALOG_CELL_DEGREES,
+            page_size=settings.WORKSHOP_CATALOG_PAGE_SIZE
+        )
+
+    return _provider_instance
@@ -1,7 +1,23 @@
 
-import math
 from typing import List, Dict, Any, Optional
+
+import numpy as np
+
 from app.domain.value_objects import ProblemCategory
+from app.infrastructure.services.workshop_catalog import (
+    WorkshopCatalog,
+    WorkshopCatalogProvider,
+    get_workshop_catalog_provider,
+)
+from app.infrastructure.services.workshop_scoring import (
+    haversine_km,
+    match_scores,
+    top_k,
+)
+from app.infrastructure.services.recommendation_cell_cache import (
+    RecommendationCellCache,
+    get_recommendation_cell_cache,
+)
 
 
 class WorkshopRecommenderService:
@@ -28,9 +44,24 @@ class WorkshopRecommenderService:
     
     DEFAULT_SEARCH_RADIUS_KM = 50.0
     
-    def __init__(self, workshop_client=None):
+    def __init__(
+        self,
+        workshop_client=None,
+        catalog_provider: Optional[WorkshopCatalogProvider] = None,
+        cell_cache: Optional[RecommendationCellCache] = None
+    ):
 
         self.workshop_client = workshop_client
+        self.catalog_provider = catalog_provider or get_workshop_catalog_provider()
+        self.cell_cache = cell_cache or get_recommendation_cell_cache()
+    
+    @property
+    def catalog_version(self) -> Optional[str]:
+        """Huella del catálogo local vigente, o None si se usa workshop-service."""
+        catalog = self.catalog_provider.catalog
+        if catalog is None or not len(catalog):
+            return None
+        return catalog.fingerprint
     
     async def recommend_workshops(
         self,
@@ -40,9 +71,6 @@ class WorkshopRecommenderService:
         max_radius_km: float = None
     ) -> List[Dict[str, Any]]:
 
-        if not self.workshop_client:
-            return []
-        
         if not user_location or "latitude" not in user_location or "longitude" not in user_location:
             return []
         
@@ -53,6 +81,16 @@ class WorkshopRecommenderService:
         
         radius_km = max_radius_km or self.DEFAULT_SEARCH_RADIUS_KM
         
+        # Catálogo local sincronizado: sin llamada de red
+        catalog = self.catalog_provider.catalog
+        if catalog is not None and len(catalog):
+            return self._recommend_from_catalog(
+                catalog, specialty_type, user_lat, user_lon, radius_km, limit
+            )
+        
+        if not self.workshop_client:
+            return []
+        
         try:
             nearby_workshops = await self.workshop_client.search_nearby_workshops(
                 latitude=user_lat,
@@ -68,170 +106,83 @@ class WorkshopRecommenderService:
         if not nearby_workshops:
             return []
         
-        recommendations = []
-        
-        for workshop in nearby_workshops:
-            workshop_id = workshop.get("id")
-            workshop_lat = workshop.get("latitude")
-            workshop_lon = workshop.get("longitude")
-            workshop_rating = workshop.get("overallRating", 0.0)
-            workshop_name = workshop.get("businessName", "Taller")
-            specialties = workshop.get("specialties", [])
-            
-            if not workshop_id or workshop_lat is None or workshop_lon is None:
-                continue
-            
-            distance_km = self._haversine_distance(
-                user_lat, user_lon,
-                workshop_lat, workshop_lon
-            )
-            
-            match_score = self._calculate_match_score(
-                specialties=specialties,
-                target_specialty=specialty_type,
-                distance_km=distance_km,
-                rating=workshop_rating,
-                max_radius_km=radius_km
-            )
-            
-            reasons = self._generate_reasons(
-                specialties=specialties,
-                target_specialty=specialty_type,
-                distance_km=distance_km,
-                rating=workshop_rating
-            )
-            
-            recommendations.append({
-                "workshop_id": workshop_id,
-                "workshop_name": workshop_name,
-                "match_score": match_score,
-                "distance_km": round(distance_km, 2),
-                "rating": workshop_rating,
-                "reasons": reasons
-            })
-        
-        recommendations.sort(key=lambda x: x["match_score"], reverse=True)
-        
-        return recommendations[:limit]
-    
-    def _haversine_distance(
-        self,
-        lat1: float,
-        lon1: float,
-        lat2: float,
-        lon2: float
-    ) -> float:
-
-        R = 6371.0
-        
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
-        
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-        
-        a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
-        distance = R * c
-        
-        return distance
-    
-    def _calculate_match_score(
-        self,
-        specialties: List[Dict[str, Any]],
-        target_specialty: str,
-        distance_km: float,
-        rating: float,
-        max_radius_km: float
-    ) -> float:
-
-        # 1. Specialization Score (40%)
-        specialization_score = self._calculate_specialization_score(
-            specialties, target_specialty
-        )
-        
-        # 2. Proximity Score (35%)
-        proximity_score = self._calculate_proximity_score(
-            distance_km, max_radius_km
-        )
-        
-        # 3. Rating Score (25%)
-        rating_score = self._calculate_rating_score(rating)
+        # Los resultados remotos ya vienen filtrados por especialidad y radio
+        # del lado del servicio: se puntúan todos, sin volver a filtrar.
+        candidates = WorkshopCatalog(nearby_workshops, version=0)
+        indexes = np.arange(len(candidates))
+        distances = haversine_km(user_lat, user_lon, candidates.latitudes, candidates.longitudes)
         
-        match_score = (
-            self.WEIGHT_SPECIALIZATION * specialization_score +
-            self.WEIGHT_PROXIMITY * proximity_score +
-            self.WEIGHT_RATING * rating_score
-        )
-        
-        return round(match_score, 3)
+        return self._rank(candidates, indexes, distances, specialty_type, radius_km, limit)
     
-    def _calculate_specialization_score(
+    def _recommend_from_catalog(
         self,
-        specialties: List[Dict[str, Any]],
-        target_specialty: str
-    ) -> float:
+        catalog: WorkshopCatalog,
+        specialty_type: str,
+        user_lat: float,
+        user_lon: float,
+        radius_km: float,
+        limit: int
+    ) -> List[Dict[str, Any]]:
         """
-        Calcula el score de especialización.
-        
-        Returns:
-            1.0 si tiene la especialidad exacta
-            0.5 si tiene especialidades relacionadas
-            0.0 si no tiene especialidades relevantes
+        Mismo puntaje que la búsqueda remota, calculado sobre el catálogo local.
+        Igual que /search/nearby, solo entran talleres con la especialidad.
+        Los candidatos salen del cache por celda; distancias, puntaje y
+        razones se calculan desde el punto exacto del usuario.
         """
-        if not specialties:
-            return 0.0
-        
-        specialty_types = [s.get("specialtyType") for s in specialties if s.get("specialtyType")]
-        
-        if target_specialty in specialty_types:
-            return 1.0
+        candidates = self.cell_cache.candidates(catalog, user_lat, user_lon, specialty_type, radius_km)
         
-        if "GENERAL" in specialty_types:
-            return 0.5
+        distances = haversine_km(
+            user_lat, user_lon, catalog.latitudes[candidates], catalog.longitudes[candidates]
+        )
+        within = distances <= radius_km
         
-        return 0.0
+        return self._rank(catalog, candidates[within], distances[within], specialty_type, radius_km, limit)
     
-    def _calculate_proximity_score(
+    def _rank(
         self,
-        distance_km: float,
-        max_radius_km: float
-    ) -> float:
-        """
-        Calcula el score de proximidad (más cerca = mejor).
-        
-        Returns:
-            1.0 si está muy cerca (< 5 km)
-            Decae linealmente hasta 0.0 en max_radius_km
+        catalog: WorkshopCatalog,
+        indexes: np.ndarray,
+        distances: np.ndarray,
+        specialty_type: str,
+        radius_km: float,
+        limit: int
+    ) -> List[Dict[str, Any]]:
         """
-        if distance_km <= 5.0:
-            return 1.0
-        
-        if distance_km >= max_radius_km:
-            return 0.0
-        
-        score = 1.0 - ((distance_km - 5.0) / (max_radius_km - 5.0))
-        
-        return max(0.0, min(1.0, score))
-    
-    def _calculate_rating_score(self, rating: float) -> float:
+        Puntaje vectorizado de los candidatos, top-k con argpartition y
+        razones solo para los ganadores.
         """
-        Calcula el score de rating.
+        scores = match_scores(
+            distances,
+            catalog.ratings[indexes],
+            catalog.specialty_masks[indexes],
+            catalog.specialty_bit(specialty_type),
+            catalog.specialty_bit("GENERAL"),
+            radius_km,
+            (self.WEIGHT_SPECIALIZATION, self.WEIGHT_PROXIMITY, self.WEIGHT_RATING)
+        )
         
-        Args:
-            rating: Rating de 0.0 a 5.0
+        recommendations = []
+        for position in top_k(scores, limit):
+            index = int(indexes[position])
+            distance_km = float(distances[position])
+            rating = float(catalog.ratings[index])
+            specialties = [{"specialtyType": s} for s in catalog.specialty_types(index)]
             
-        Returns:
-            Score normalizado de 0.0 a 1.0
-        """
-        if rating <= 0:
-            return 0.0
+            recommendations.append({
+                "workshop_id": catalog.ids[index],
+                "workshop_name": catalog.names[index],
+                "match_score": float(scores[position]),
+                "distance_km": round(distance_km, 2),
+                "rating": rating,
+                "reasons": self._generate_reasons(
+                    specialties=specialties,
+                    target_specialty=specialty_type,
+                    distance_km=distance_km,
+                    rating=rating
+                )
+            })
         
-        # Normalizar de 0-5 a 0-1
-        return min(rating / 5.0, 1.0)
+        return recommendations
     
     def _map_category_to_specialty(self, category: str) -> str:
 
@@ -279,6 +230,7 @@ class WorkshopRecommenderService:
         
         return reasons
     
+    def _get_specialty_display_name(self, specialty_type: str) -> str:
 
         display_names = {
             "MOTOR": "problemas de motor",
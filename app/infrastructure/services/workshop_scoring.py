@@ -0,0 +1,96 @@
+"""
+Puntaje vectorizado de talleres sobre columnas NumPy.
+
+Fórmulas del recomendador aplicadas a todos los candidatos a la vez. La
+referencia escalar (un taller a la vez) vive en cli/benchmark_recommender.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+EARTH_RADIUS_KM = 6371.0
+NEAR_DISTANCE_KM = 5.0
+
+
+def haversine_km(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray
+) -> np.ndarray:
+
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(latitudes)
+    dlat = lat2 - lat1
+    dlon = np.radians(longitudes - longitude)
+
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+def proximity_scores(distances: np.ndarray, max_radius_km: float) -> np.ndarray:
+    """1.0 hasta 5 km, decae linealmente hasta 0.0 en max_radius_km"""
+    span = max(max_radius_km - NEAR_DISTANCE_KM, 1e-9)
+    linear = np.clip(1.0 - (distances - NEAR_DISTANCE_KM) / span, 0.0, 1.0)
+
+    return np.select(
+        [distances <= NEAR_DISTANCE_KM, distances >= max_radius_km],
+        [1.0, 0.0],
+        default=linear
+    )
+
+
+def rating_scores(ratings: np.ndarray) -> np.ndarray:
+    return np.where(ratings <= 0, 0.0, np.minimum(ratings / 5.0, 1.0))
+
+
+def specialization_scores(masks: np.ndarray, target_bit: int, general_bit: int) -> np.ndarray:
+    """1.0 con la especialidad exacta, 0.5 si es taller general, 0.0 si no"""
+    has_target = (masks & np.uint64(target_bit)) != 0
+    has_general = (masks & np.uint64(general_bit)) != 0
+
+    return np.where(has_target, 1.0, np.where(has_general, 0.5, 0.0))
+
+
+def match_scores(
+    distances: np.ndarray,
+    ratings: np.ndarray,
+    masks: np.ndarray,
+    target_bit: int,
+    general_bit: int,
+    max_radius_km: float,
+    weights: Tuple[float, float, float]
+) -> np.ndarray:
+    """Puntaje redondeado a 3 decimales; weights = (especialización, proximidad, rating)"""
+    weight_specialization, weight_proximity, weight_rating = weights
+
+    scores = (
+        weight_specialization * specialization_scores(masks, target_bit, general_bit) +
+        weight_proximity * proximity_scores(distances, max_radius_km) +
+        weight_rating * rating_scores(ratings)
+    )
+
+    return np.round(scores, 3)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Posiciones de los k mejores puntajes, de mayor a menor. argpartition
+    evita ordenar todos los candidatos; los empates se resuelven por
+    posición, igual que el sort estable de la implementación escalar.
+    """
+    n = len(scores)
+    if n == 0 or k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    if k < n:
+        kth = np.argpartition(-scores, k - 1)[k - 1]
+        # Todos los empatados con el k-ésimo entran para desempatar por posición
+        selected = np.flatnonzero(scores >= scores[kth])
+    else:
+        selected = np.arange(n)
+
+    order = np.lexsort((selected, -scores[selected]))
+    return selected[order][:k]
@@ -3,12 +3,22 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
+import asyncio
 import logging
 
 from app.infrastructure.config.settings import get_settings
-from app.infrastructure.config.database import initialize_database, close_database
+from app.infrastructure.config.database import (
+    initialize_database,
+    close_database,
+    initialize_read_replica,
+    monitor_read_replica
+)
+from app.infrastructure.cache import initialize_cache, close_cache
+from app.infrastructure.clients import initialize_http_clients, close_http_clients
+from app.infrastructure.services.diagnosis_tables import get_diagnosis_tables_provider
+from app.infrastructure.services.workshop_catalog import get_workshop_catalog_provider
 from app.infrastructure.middleware import (
     setup_error_handlers,
     request_logging_middleware
@@ -45,13 +55,48 @@ async def lifespan(app: FastAPI):
         logger.error(f" DB failed: {str(e)}")
         raise
     
-    logger.info(f" Redis: Connected to {settings.REDIS_URL.split('@')[1] if '@' in settings.REDIS_URL else 'Redis'}")
+    replica_monitor = None
+    if await initialize_read_replica():
+        replica_monitor = asyncio.create_task(
+            monitor_read_replica(settings.DATABASE_REPLICA_HEALTH_INTERVAL_SECONDS)
+        )
+        logger.info(" DB read replica configured")
+    
+    if await initialize_cache():
+        logger.info(f" Redis: Connected to {settings.REDIS_URL.split('@')[1] if '@' in settings.REDIS_URL else 'Redis'}")
+    
+    initialize_http_clients()
+    logger.info(" HTTP clients: connection pools ready")
+    
+    tables_provider = get_diagnosis_tables_provider()
+    tables_watcher = asyncio.create_task(
+        tables_provider.watch(settings.DIAGNOSIS_TABLES_RELOAD_SECONDS)
+    )
+    logger.info(f" Diagnosis tables: version {tables_provider.tables.version}")
+    
+    # La primera sincronización corre dentro del task: no bloquea el arranque
+    catalog_watcher = None
+    if settings.WORKSHOP_CATALOG_ENABLED:
+        catalog_watcher = asyncio.create_task(
+            get_workshop_catalog_provider().watch(settings.WORKSHOP_CATALOG_REFRESH_SECONDS)
+        )
+    
     logger.info(" SERVICE READY")
     
     yield
     
     logger.info("SHUTTING DOWN SERVICE")
     
+    for task in (tables_watcher, replica_monitor, catalog_watcher):
+        if task is None:
+            continue
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    
+    await close_http_clients()
+    await close_cache()
+    
     try:
         await close_database()
         logger.info("DB Disconnected")
@@ -107,15 +152,43 @@ setup_error_handlers(app)
     response_description="Estado del servicio"
 )
 async def health_check():
-    from app.infrastructure.config.database import check_database_health
+    from app.infrastructure.config.database import check_database_health, get_replica_health
+    from app.infrastructure.cache import check_cache_health
+    from app.infrastructure.clients import get_circuit_breaker_states
     
     db_health = await check_database_health()
+    db_health["readReplica"] = get_replica_health()
+    cache_health = await check_cache_health()
     
     return {
         "status": "healthy" if db_health["status"] == "healthy" else "degraded",
         "service": "diagnosis-service",
         "version": "1.0.0",
-        "database": db_health
+        "database": db_health,
+        "cache": cache_health,
+        "upstreams": get_circuit_breaker_states()
+    }
+
+
+@app.get(
+    "/metrics",
+    tags=["Health"],
+    summary="Métricas de base de datos",
+    description="Latencia de consultas por modelo y operación, saturación del pool de conexiones y aciertos de los caches en memoria"
+)
+async def metrics():
+    from app.infrastructure.config.database import get_pool_metrics
+    from app.infrastructure.metrics import get_query_metrics
+    from app.infrastructure.cache import ttl_cache_stats
+    from app.infrastructure.services.recommendation_cell_cache import get_recommendation_cell_cache
+    
+    return {
+        "queries": get_query_metrics().snapshot(),
+        "pool": await get_pool_metrics(),
+        "caches": {
+            **ttl_cache_stats(),
+            "recommendation_cells": get_recommendation_cell_cache().stats()
+        }
     }
 
 
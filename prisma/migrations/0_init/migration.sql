@@ -0,0 +1,172 @@
+-- CreateEnum
+CREATE TYPE "SessionStatus" AS ENUM ('ACTIVE', 'COMPLETED', 'ABANDONED');
+
+-- CreateEnum
+CREATE TYPE "MessageRole" AS ENUM ('USER', 'ASSISTANT');
+
+-- CreateEnum
+CREATE TYPE "ProblemCategory" AS ENUM ('ENGINE', 'TRANSMISSION', 'BRAKES', 'ELECTRICAL', 'AIR_CONDITIONING', 'SUSPENSION', 'EXHAUST', 'FUEL_SYSTEM', 'COOLING_SYSTEM', 'TIRES', 'BATTERY', 'LIGHTS', 'OTHER');
+
+-- CreateEnum
+CREATE TYPE "SentimentLabel" AS ENUM ('POSITIVE', 'NEUTRAL', 'NEGATIVE');
+
+-- CreateTable
+CREATE TABLE "diagnosis_sessions" (
+    "id" TEXT NOT NULL,
+    "userId" TEXT NOT NULL,
+    "vehicleId" TEXT NOT NULL,
+    "status" "SessionStatus" NOT NULL DEFAULT 'ACTIVE',
+    "summary" TEXT,
+    "startedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "completedAt" TIMESTAMP(3),
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "diagnosis_sessions_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "diagnosis_messages" (
+    "id" TEXT NOT NULL,
+    "sessionId" TEXT NOT NULL,
+    "role" "MessageRole" NOT NULL,
+    "content" TEXT NOT NULL,
+    "attachments" JSONB,
+    "timestamp" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "diagnosis_messages_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "problem_classifications" (
+    "id" TEXT NOT NULL,
+    "sessionId" TEXT NOT NULL,
+    "category" "ProblemCategory" NOT NULL,
+    "subcategory" TEXT,
+    "confidenceScore" DOUBLE PRECISION NOT NULL,
+    "symptoms" TEXT[],
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "problem_classifications_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "workshop_recommendations" (
+    "id" TEXT NOT NULL,
+    "sessionId" TEXT NOT NULL,
+    "workshopId" TEXT NOT NULL,
+    "matchScore" DOUBLE PRECISION NOT NULL,
+    "reasons" TEXT[],
+    "workshopName" TEXT NOT NULL,
+    "distanceKm" DOUBLE PRECISION,
+    "rating" DOUBLE PRECISION,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "workshop_recommendations_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "sentiment_analyses" (
+    "id" TEXT NOT NULL,
+    "text" TEXT NOT NULL,
+    "context" JSONB,
+    "workshopId" TEXT,
+    "label" "SentimentLabel" NOT NULL,
+    "score" DOUBLE PRECISION NOT NULL,
+    "scores" JSONB NOT NULL,
+    "analyzedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "sentiment_analyses_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "analytics_metrics" (
+    "id" TEXT NOT NULL,
+    "metricType" TEXT NOT NULL,
+    "value" JSONB NOT NULL,
+    "period" TEXT,
+    "periodDate" TIMESTAMP(3),
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "analytics_metrics_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "ml_model_metrics" (
+    "id" TEXT NOT NULL,
+    "modelName" TEXT NOT NULL,
+    "modelVersion" TEXT NOT NULL,
+    "metrics" JSONB NOT NULL,
+    "sampleSize" INTEGER,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "ml_model_metrics_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "diagnosis_sessions_userId_idx" ON "diagnosis_sessions"("userId");
+
+-- CreateIndex
+CREATE INDEX "diagnosis_sessions_vehicleId_idx" ON "diagnosis_sessions"("vehicleId");
+
+-- CreateIndex
+CREATE INDEX "diagnosis_sessions_status_idx" ON "diagnosis_sessions"("status");
+
+-- CreateIndex
+CREATE INDEX "diagnosis_sessions_startedAt_idx" ON "diagnosis_sessions"("startedAt");
+
+-- CreateIndex
+CREATE INDEX "diagnosis_messages_sessionId_idx" ON "diagnosis_messages"("sessionId");
+
+-- CreateIndex
+CREATE INDEX "diagnosis_messages_timestamp_idx" ON "diagnosis_messages"("timestamp");
+
+-- CreateIndex
+CREATE UNIQUE INDEX "problem_classifications_sessionId_key" ON "problem_classifications"("sessionId");
+
+-- CreateIndex
+CREATE INDEX "problem_classifications_sessionId_idx" ON "problem_classifications"("sessionId");
+
+-- CreateIndex
+CREATE INDEX "problem_classifications_category_idx" ON "problem_classifications"("category");
+
+-- CreateIndex
+CREATE INDEX "problem_classifications_createdAt_idx" ON "problem_classifications"("createdAt");
+
+-- CreateIndex
+CREATE INDEX "workshop_recommendations_sessionId_idx" ON "workshop_recommendations"("sessionId");
+
+-- CreateIndex
+CREATE INDEX "workshop_recommendations_workshopId_idx" ON "workshop_recommendations"("workshopId");
+
+-- CreateIndex
+CREATE INDEX "workshop_recommendations_matchScore_idx" ON "workshop_recommendations"("matchScore");
+
+-- CreateIndex
+CREATE INDEX "sentiment_analyses_label_idx" ON "sentiment_analyses"("label");
+
+-- CreateIndex
+CREATE INDEX "sentiment_analyses_analyzedAt_idx" ON "sentiment_analyses"("analyzedAt");
+
+-- CreateIndex
+CREATE INDEX "sentiment_analyses_workshopId_idx" ON "sentiment_analyses"("workshopId");
+
+-- CreateIndex
+CREATE INDEX "analytics_metrics_metricType_idx" ON "analytics_metrics"("metricType");
+
+-- CreateIndex
+CREATE INDEX "analytics_metrics_periodDate_idx" ON "analytics_metrics"("periodDate");
+
+-- CreateIndex
+CREATE INDEX "ml_model_metrics_modelName_idx" ON "ml_model_metrics"("modelName");
+
+-- CreateIndex
+CREATE INDEX "ml_model_metrics_createdAt_idx" ON "ml_model_metrics"("createdAt");
+
+-- AddForeignKey
+ALTER TABLE "diagnosis_messages" ADD CONSTRAINT "diagnosis_messages_sessionId_fkey" FOREIGN KEY ("sessionId") REFERENCES "diagnosis_sessions"("id") ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- AddForeignKey
+ALTER TABLE "problem_classifications" ADD CONSTRAINT "problem_classifications_sessionId_fkey" FOREIGN KEY ("sessionId") REFERENCES "diagnosis_sessions"("id") ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- AddForeignKey
+ALTER TABLE "workshop_recommendations" ADD CONSTRAINT "workshop_recommendations_sessionId_fkey" FOREIGN KEY ("sessionId") REFERENCES "diagnosis_sessions"("id") ON DELETE CASCADE ON UPDATE CASCADE;
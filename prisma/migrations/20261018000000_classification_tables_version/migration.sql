@@ -0,0 +1,3 @@
+
+-- Versión de las tablas de palabras clave/urgencia/costos usada al clasificar
+ALTER TABLE "problem_classifications" ADD COLUMN IF NOT EXISTS "tablesVersion" TEXT;
@@ -0,0 +1,5 @@
+
+-- Síntomas detectados de forma incremental, un mensaje de usuario a la vez.
+-- Las sesiones existentes quedan en '{}' y ClaudeService analiza sus mensajes
+-- anteriores la primera vez que reciben uno nuevo.
+ALTER TABLE "diagnosis_sessions" ADD COLUMN IF NOT EXISTS "detectedSymptoms" TEXT[] DEFAULT ARRAY[]::TEXT[];
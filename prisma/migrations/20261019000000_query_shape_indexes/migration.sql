@@ -0,0 +1,18 @@
+-- Índices alineados con las consultas reales del servicio.
+-- Verificación: python -m app.infrastructure.cli.check_query_plans
+
+-- Listado de sesiones: WHERE "userId" = ? [AND "vehicleId" = ?] ORDER BY "startedAt" DESC
+DROP INDEX IF EXISTS "diagnosis_sessions_userId_idx";
+CREATE INDEX IF NOT EXISTS "diagnosis_sessions_userId_startedAt_idx"
+    ON "diagnosis_sessions" ("userId", "startedAt" DESC);
+CREATE INDEX IF NOT EXISTS "diagnosis_sessions_userId_vehicleId_startedAt_idx"
+    ON "diagnosis_sessions" ("userId", "vehicleId", "startedAt" DESC);
+
+-- Mensajes de una sesión con paginación keyset sobre (timestamp, id)
+DROP INDEX IF EXISTS "diagnosis_messages_sessionId_idx";
+CREATE INDEX IF NOT EXISTS "diagnosis_messages_sessionId_timestamp_id_idx"
+    ON "diagnosis_messages" ("sessionId", "timestamp", "id");
+
+-- find_by_context: context @> '{"clave": "valor"}'
+CREATE INDEX IF NOT EXISTS "sentiment_analyses_context_idx"
+    ON "sentiment_analyses" USING GIN ("context" jsonb_path_ops);
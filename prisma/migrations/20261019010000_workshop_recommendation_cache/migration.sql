@@ -0,0 +1,12 @@
+
+-- Recomendaciones persistidas por sesión: el listado rankeado se guarda una
+-- vez por clasificación, versión del catálogo de talleres y celda de ubicación.
+ALTER TABLE "workshop_recommendations" ADD COLUMN IF NOT EXISTS "rank" INTEGER;
+ALTER TABLE "workshop_recommendations" ADD COLUMN IF NOT EXISTS "classificationKey" TEXT;
+ALTER TABLE "workshop_recommendations" ADD COLUMN IF NOT EXISTS "catalogVersion" TEXT;
+ALTER TABLE "workshop_recommendations" ADD COLUMN IF NOT EXISTS "locationKey" TEXT;
+
+-- Lectura: WHERE "sessionId" = ? ORDER BY "rank"
+DROP INDEX IF EXISTS "workshop_recommendations_sessionId_idx";
+CREATE INDEX IF NOT EXISTS "workshop_recommendations_sessionId_rank_idx"
+    ON "workshop_recommendations" ("sessionId", "rank");
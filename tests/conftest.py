@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "db: necesita una base PostgreSQL migrada; solo corre con RUN_DB_TESTS=1"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # DATABASE_URL no basta: todos los tests la necesitan para importar app.*
+    if os.environ.get("RUN_DB_TESTS") == "1":
+        return
+
+    skip_db = pytest.mark.skip(reason="test de base de datos; activar con RUN_DB_TESTS=1")
+    for item in items:
+        if "db" in item.keywords:
+            item.add_marker(skip_db)
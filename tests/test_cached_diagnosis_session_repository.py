@@ -0,0 +1,222 @@
+import asyncio
+import copy
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.domain.entities.diagnosis_message import DiagnosisMessage
+from app.domain.entities.diagnosis_session import DiagnosisSession
+from app.domain.value_objects import MessageRole
+from app.infrastructure.repositories.cached_diagnosis_session_repository import (
+    CachedDiagnosisSessionRepository,
+)
+
+
+class FakeVersionedCache:
+    """Mismo contrato que RedisCache.set_json_versioned y su script Lua."""
+
+    def __init__(self):
+        self.data = {}
+        self.versions = {}
+        self.conflicts = 0
+
+    async def get_json(self, key, namespace):
+        value = self.data.get(key)
+        return copy.deepcopy(value) if value is not None else None
+
+    async def get_version(self, key):
+        return self.versions.get(key, 0)
+
+    async def set_json_versioned(self, version_key, expected_version, values, ttl_seconds, namespace, bump=False):
+        current = self.versions.get(version_key, 0)
+
+        if current != expected_version:
+            self.conflicts += 1
+            if bump:
+                self.versions[version_key] = current + 1
+                for key in values:
+                    self.data.pop(key, None)
+            return None
+
+        version = current + 1 if bump else current
+        self.versions[version_key] = version
+        self.data.update(copy.deepcopy(values))
+        return version
+
+    async def invalidate_versioned(self, version_key, *keys, ttl_seconds):
+        self.versions[version_key] = self.versions.get(version_key, 0) + 1
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FakeSessionRepository:
+    """Postgres en memoria: cada lectura devuelve una copia independiente."""
+
+    def __init__(self):
+        self.rows = {}
+        self.messages = {}
+        self.reads = 0
+        self.on_read = None
+
+    def _copy(self, session, messages):
+        return DiagnosisSession.from_primitives(
+            session_id=str(session.id.value),
+            user_id=str(session.user_id),
+            vehicle_id=str(session.vehicle_id),
+            status=session.status.value,
+            messages=list(messages),
+            summary=session.summary,
+            started_at=session.started_at,
+            completed_at=session.completed_at,
+            detected_symptoms=session.detected_symptoms
+        )
+
+    async def create(self, session):
+        self.rows[session.id.value] = session
+        self.messages[session.id.value] = list(session.messages)
+        return session
+
+    async def update(self, session):
+        # Como el repositorio real: solo agrega los mensajes pendientes
+        self.messages[session.id.value].extend(session.pending_messages)
+        session.mark_messages_persisted()
+        return session
+
+    async def find_by_id(self, session_id):
+        self.reads += 1
+        row = self.rows.get(session_id.value)
+        snapshot = self._copy(row, self.messages[session_id.value]) if row else None
+        if self.on_read is not None:
+            hook, self.on_read = self.on_read, None
+            await hook()
+        return snapshot
+
+
+def _repositories():
+    inner = FakeSessionRepository()
+    cache = FakeVersionedCache()
+    return inner, cache, CachedDiagnosisSessionRepository(inner, cache)
+
+
+def _reply(session, content):
+    session.add_message(DiagnosisMessage.create(
+        session_id=session.id.value,
+        role=MessageRole.assistant(),
+        content=content
+    ))
+
+
+def _contents(session):
+    return [message.content.value for message in session.messages]
+
+
+def test_write_through_serves_the_next_turn_from_cache():
+    inner, cache, repository = _repositories()
+
+    async def run():
+        session = DiagnosisSession.create(uuid4(), uuid4(), "frenos rechinan")
+        await repository.create(session)
+
+        loaded = await repository.find_by_id(session.id)
+        _reply(loaded, "¿desde cuándo?")
+        await repository.update(loaded)
+
+        return session, await repository.find_by_id(session.id)
+
+    session, cached = asyncio.run(run())
+
+    assert inner.reads == 0
+    assert _contents(cached) == ["frenos rechinan", "¿desde cuándo?"]
+    assert cache.versions[f"session:{session.id}:version"] == 2
+
+
+def test_reader_does_not_overwrite_a_newer_write():
+    inner, cache, repository = _repositories()
+    writer = CachedDiagnosisSessionRepository(inner, cache)
+
+    async def run():
+        session = DiagnosisSession.create(uuid4(), uuid4(), "humo del motor")
+        await inner.create(session)
+
+        async def concurrent_write():
+            # Otra petición escribe entre la lectura en Postgres y el SET del lector
+            fresh = await writer.find_by_id(session.id)
+            _reply(fresh, "detenga el vehículo")
+            await writer.update(fresh)
+
+        inner.on_read = concurrent_write
+        stale = await repository.find_by_id(session.id)
+        return session, stale, await repository.find_by_id(session.id)
+
+    session, stale, cached = asyncio.run(run())
+
+    assert _contents(stale) == ["humo del motor"]
+    assert _contents(cached) == ["humo del motor", "detenga el vehículo"]
+    assert cache.conflicts == 1
+
+
+def test_concurrent_writers_invalidate_instead_of_losing_a_message():
+    inner, cache, repository = _repositories()
+
+    async def run():
+        session = DiagnosisSession.create(uuid4(), uuid4(), "fuga de aceite")
+        await repository.create(session)
+
+        first = await repository.find_by_id(session.id)
+        second = await repository.find_by_id(session.id)
+
+        _reply(first, "respuesta A")
+        await repository.update(first)
+        _reply(second, "respuesta B")
+        await repository.update(second)
+
+        reads_before = inner.reads
+        reloaded = await repository.find_by_id(session.id)
+        return reads_before, reloaded
+
+    reads_before, reloaded = asyncio.run(run())
+
+    # La segunda escritura partía de una versión vieja: se invalida y se relee
+    assert inner.reads == reads_before + 1
+    assert _contents(reloaded) == ["fuga de aceite", "respuesta A", "respuesta B"]
+
+
+def test_write_after_failed_update_invalidates():
+    inner, cache, repository = _repositories()
+
+    async def failing_update(session):
+        raise RuntimeError("timeout en commit")
+
+    async def run():
+        session = DiagnosisSession.create(uuid4(), uuid4(), "batería muerta")
+        await repository.create(session)
+        loaded = await repository.find_by_id(session.id)
+
+        inner.update = failing_update
+        try:
+            await repository.update(loaded)
+        except RuntimeError:
+            pass
+
+        return session
+
+    session = asyncio.run(run())
+
+    assert f"session:{session.id}" not in cache.data
+    assert cache.versions[f"session:{session.id}:version"] == 2
+
+
+def test_window_sorts_naive_and_aware_timestamps():
+    inner, cache, repository = _repositories()
+
+    async def run():
+        session = DiagnosisSession.create(uuid4(), uuid4(), "mensaje inicial")
+        # Un mensaje leído de Postgres trae zona; los nuevos usan utcnow()
+        session.messages[0]._timestamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        _reply(session, "respuesta")
+        await repository.create(session)
+        return session
+
+    session = asyncio.run(run())
+
+    window = cache.data[f"session:{session.id}:messages"]
+    assert [message["content"] for message in window] == ["mensaje inicial", "respuesta"]
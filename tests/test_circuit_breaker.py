@@ -0,0 +1,144 @@
+import pytest
+
+from app.infrastructure.clients import circuit_breaker as circuit_breaker_module
+from app.infrastructure.clients.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker_module, "time", fake)
+    return fake
+
+
+def _breaker(**overrides):
+    options = dict(
+        failure_rate_threshold=0.5,
+        slow_call_seconds=2.0,
+        slow_call_rate_threshold=0.8,
+        window_seconds=30.0,
+        min_calls=4,
+        open_seconds=10.0,
+    )
+    options.update(overrides)
+    return CircuitBreaker("test-service", **options)
+
+
+def _call(breaker, failed=False, duration=0.1):
+    breaker.before_call()
+    breaker.record(failed, duration)
+
+
+def test_stays_closed_below_min_calls(clock):
+    breaker = _breaker()
+
+    for _ in range(3):
+        _call(breaker, failed=True)
+
+    assert breaker.state == CLOSED
+
+
+def test_opens_on_failure_rate_and_rejects_calls(clock):
+    breaker = _breaker()
+
+    _call(breaker)
+    _call(breaker)
+    _call(breaker, failed=True)
+    assert breaker.state == CLOSED
+
+    _call(breaker, failed=True)
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert error.value.upstream == "test-service"
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_opens_on_slow_call_rate(clock):
+    breaker = _breaker()
+
+    for _ in range(4):
+        _call(breaker, duration=2.5)
+
+    assert breaker.state == OPEN
+
+
+def test_old_calls_leave_the_window(clock):
+    breaker = _breaker()
+
+    for _ in range(3):
+        _call(breaker, failed=True)
+
+    clock.advance(31)
+    _call(breaker)
+
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["calls"] == 1
+
+
+def test_half_open_allows_a_single_probe_that_closes(clock):
+    breaker = _breaker()
+    for _ in range(4):
+        _call(breaker, failed=True)
+
+    clock.advance(10)
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+    # Mientras la prueba está en curso se rechaza todo lo demás
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record(False, 0.1)
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["calls"] == 0
+
+
+def test_failed_probe_reopens(clock):
+    breaker = _breaker()
+    for _ in range(4):
+        _call(breaker, failed=True)
+
+    clock.advance(10)
+    breaker.before_call()
+    breaker.record(True, 0.1)
+
+    assert breaker.state == OPEN
+    assert breaker.snapshot()["retryInSeconds"] == 10.0
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_slow_probe_reopens(clock):
+    breaker = _breaker()
+    for _ in range(4):
+        _call(breaker, failed=True)
+
+    clock.advance(10)
+    breaker.before_call()
+    breaker.record(False, 2.5)
+
+    assert breaker.state == OPEN
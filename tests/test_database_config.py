@@ -0,0 +1,51 @@
+from urllib.parse import parse_qsl, urlsplit
+
+from app.infrastructure.config.database import build_datasource_url
+from app.infrastructure.metrics import LatencyHistogram, QueryMetrics
+
+
+def _query(url):
+    return dict(parse_qsl(urlsplit(url).query))
+
+
+def test_pool_settings_are_added_to_the_url():
+    url = build_datasource_url("postgresql://u:p@db:5432/diag?schema=public", 20, 10)
+
+    assert urlsplit(url).netloc == "u:p@db:5432"
+    assert _query(url) == {"schema": "public", "connection_limit": "20", "pool_timeout": "10"}
+
+
+def test_values_in_the_url_win():
+    url = build_datasource_url("postgresql://db/diag?connection_limit=5", 20, None)
+
+    assert _query(url) == {"connection_limit": "5"}
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = LatencyHistogram(buckets_ms=(10, 100))
+    for elapsed_ms in (1, 10, 50, 500):
+        histogram.observe(elapsed_ms)
+    histogram.observe(5, error=True)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["buckets"] == {"le_10": 3, "le_100": 4, "le_inf": 5}
+    assert snapshot["count"] == 5
+    assert snapshot["errors"] == 1
+    assert snapshot["maxMs"] == 500
+
+
+def test_query_metrics_track_in_flight_and_slow_queries(caplog):
+    metrics = QueryMetrics(slow_query_ms=0.0)
+
+    first = metrics.start()
+    second = metrics.start()
+    metrics.finish("DiagnosisSession", "find_many", first)
+    metrics.finish("DiagnosisSession", "find_many", second, error=True)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["inFlight"] == 0
+    assert snapshot["maxInFlight"] == 2
+    assert snapshot["operations"]["DiagnosisSession.find_many"]["errors"] == 1
+    assert "Consulta lenta" in caplog.text
@@ -0,0 +1,53 @@
+import json
+import os
+
+from app.infrastructure.services.diagnosis_tables import DEFAULT_TABLES_PATH, DiagnosisTablesProvider
+
+
+def _write(path, data, mtime):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def _tables_file(tmp_path, version):
+    data = json.loads(DEFAULT_TABLES_PATH.read_text(encoding="utf-8"))
+    data["version"] = version
+    path = tmp_path / "diagnosis_tables.json"
+    _write(path, data, 1_000_000)
+    return path, data
+
+
+def test_unchanged_file_is_not_reloaded(tmp_path):
+    path, _ = _tables_file(tmp_path, "v1")
+    provider = DiagnosisTablesProvider(path)
+
+    assert provider.reload_if_changed() is False
+    assert provider.tables.version == "v1"
+
+
+def test_changed_file_swaps_the_tables(tmp_path):
+    path, data = _tables_file(tmp_path, "v1")
+    provider = DiagnosisTablesProvider(path)
+    previous = provider.tables
+
+    data["version"] = "v2"
+    _write(path, data, 1_000_010)
+
+    assert provider.reload_if_changed() is True
+    assert provider.tables.version == "v2"
+    # Quien ya tenía la versión anterior la sigue usando intacta
+    assert previous.version == "v1"
+
+
+def test_invalid_file_keeps_the_current_tables(tmp_path):
+    path, data = _tables_file(tmp_path, "v1")
+    provider = DiagnosisTablesProvider(path)
+
+    del data["cost"]["cost_ranges"]["OTHER"]
+    _write(path, data, 1_000_010)
+
+    assert provider.reload_if_changed() is False
+    assert provider.tables.version == "v1"
+
+    # No reintenta el mismo archivo roto en cada ciclo
+    assert provider.reload_if_changed() is False
@@ -0,0 +1,114 @@
+import random
+
+import numpy as np
+
+from app.infrastructure.services.geohash import geohash_bounds, geohash_encode
+from app.infrastructure.services.recommendation_cell_cache import RecommendationCellCache
+from app.infrastructure.services.workshop_catalog import KNOWN_SPECIALTIES, WorkshopCatalog
+from app.infrastructure.services.workshop_scoring import haversine_km
+
+
+def test_encode_known_vectors():
+    assert geohash_encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert geohash_encode(42.6, -5.6, 5) == "ezs42"
+    assert geohash_encode(0.0, 0.0, 1) == "s"
+
+
+def test_encode_prefix_property():
+    assert geohash_encode(16.75, -93.10, 8).startswith(geohash_encode(16.75, -93.10, 5))
+
+
+def test_bounds_contain_the_encoded_point():
+    rng = random.Random(49)
+
+    for _ in range(500):
+        lat = rng.uniform(-89.9, 89.9)
+        lon = rng.uniform(-179.9, 179.9)
+        precision = rng.randint(1, 9)
+
+        lat_min, lat_max, lon_min, lon_max = geohash_bounds(geohash_encode(lat, lon, precision))
+
+        assert lat_min <= lat <= lat_max
+        assert lon_min <= lon <= lon_max
+
+
+def test_bounds_round_trip_through_cell_center():
+    cell = "9fx4c"
+    lat_min, lat_max, lon_min, lon_max = geohash_bounds(cell)
+
+    assert geohash_encode((lat_min + lat_max) / 2, (lon_min + lon_max) / 2, len(cell)) == cell
+
+
+def _catalog(count, seed, version=1):
+    rng = random.Random(seed)
+    workshops = [
+        {
+            "id": f"w{i}",
+            "businessName": f"Taller {i}",
+            "latitude": 16.75 + rng.uniform(-0.6, 0.6),
+            "longitude": -93.10 + rng.uniform(-0.6, 0.6),
+            "overallRating": rng.uniform(0, 5),
+            "specialties": [{"specialtyType": s} for s in rng.sample(KNOWN_SPECIALTIES, 2)],
+        }
+        for i in range(count)
+    ]
+    return WorkshopCatalog(workshops, version=version)
+
+
+def test_cell_candidates_are_a_superset_of_the_exact_radius():
+    catalog = _catalog(3000, seed=1)
+    cache = RecommendationCellCache(precision=5)
+    rng = random.Random(2)
+
+    for _ in range(300):
+        lat = 16.75 + rng.uniform(-0.4, 0.4)
+        lon = -93.10 + rng.uniform(-0.4, 0.4)
+        specialty = rng.choice(["FRENOS", "MOTOR", "LUCES"])
+        radius_km = rng.choice([5.0, 20.0, 50.0])
+
+        candidates = cache.candidates(catalog, lat, lon, specialty, radius_km)
+        distances = haversine_km(lat, lon, catalog.latitudes[candidates], catalog.longitudes[candidates])
+        from_cache = candidates[distances <= radius_km]
+
+        expected, _ = catalog.nearby(lat, lon, radius_km, catalog.specialty_bit(specialty))
+
+        assert np.array_equal(np.sort(from_cache), np.sort(expected))
+
+    assert cache.stats()["hits"] > 0
+
+
+def test_unknown_specialty_has_no_candidates():
+    catalog = _catalog(100, seed=3)
+    cache = RecommendationCellCache(precision=5)
+
+    assert len(cache.candidates(catalog, 16.75, -93.10, "NO_EXISTE", 50.0)) == 0
+
+
+def test_new_catalog_version_invalidates_entries():
+    cache = RecommendationCellCache(precision=5)
+    first = _catalog(200, seed=4, version=1)
+    second = _catalog(200, seed=5, version=2)
+
+    cache.candidates(first, 16.75, -93.10, "FRENOS", 20.0)
+    cache.candidates(first, 16.75, -93.10, "FRENOS", 20.0)
+    assert cache.stats()["hits"] == 1
+
+    candidates = cache.candidates(second, 16.75, -93.10, "FRENOS", 20.0)
+    expected, _ = second.nearby(16.75, -93.10, 20.0, second.specialty_bit("FRENOS"))
+
+    stats = cache.stats()
+    assert stats["invalidations"] == 1
+    assert stats["catalogVersion"] == 2
+    assert set(expected.tolist()) <= set(candidates.tolist())
+
+
+def test_lru_eviction():
+    catalog = _catalog(100, seed=6)
+    cache = RecommendationCellCache(precision=5, max_entries=2)
+
+    for specialty in ("FRENOS", "MOTOR", "LUCES"):
+        cache.candidates(catalog, 16.75, -93.10, specialty, 20.0)
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
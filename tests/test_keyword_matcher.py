@@ -0,0 +1,76 @@
+import random
+
+from app.infrastructure.services.keyword_matcher import KeywordAutomaton
+
+
+def _naive_labels(keywords_by_label, text):
+    return [
+        label for label, keywords in keywords_by_label.items()
+        if any(keyword and keyword in text for keyword in keywords)
+    ]
+
+
+def test_finds_labels_in_declaration_order():
+    automaton = KeywordAutomaton({
+        "Humo": ["humo", "vapor"],
+        "Ruido": ["ruido", "chirrido"],
+        "Fuga": ["fuga"],
+    })
+
+    assert automaton.find_labels("sale vapor y hace un chirrido") == ["Humo", "Ruido"]
+    assert automaton.find_labels("todo normal") == []
+
+
+def test_overlapping_keywords_share_prefixes_and_suffixes():
+    automaton = KeywordAutomaton({
+        "he": ["he"],
+        "she": ["she"],
+        "his": ["his"],
+        "hers": ["hers"],
+    })
+
+    # "ushers" contiene she, he y hers superpuestos
+    assert automaton.find_labels("ushers") == ["he", "she", "hers"]
+
+
+def test_keyword_inside_another_keyword_is_reported_through_failure_links():
+    automaton = KeywordAutomaton({
+        "Arranque": ["arranca"],
+        "Ruido": ["ranc"],
+    })
+
+    assert automaton.find_labels("no arranca") == ["Arranque", "Ruido"]
+
+
+def test_multi_word_keyword_and_repeated_keyword_across_labels():
+    automaton = KeywordAutomaton({
+        "Luz de alerta": ["check engine", "testigo"],
+        "Olor anormal": ["gasolina"],
+        "Consumo excesivo": ["gasolina"],
+    })
+
+    assert automaton.find_labels("se prendio el check engine y huele a gasolina") == [
+        "Luz de alerta", "Olor anormal", "Consumo excesivo",
+    ]
+    assert automaton.find_labels("check  engine") == []
+
+
+def test_empty_keywords_are_ignored():
+    automaton = KeywordAutomaton({"Vacio": [""], "Humo": ["humo"]})
+
+    assert automaton.find_labels("humo") == ["Humo"]
+    assert automaton.find_labels("") == []
+
+
+def test_matches_naive_substring_search():
+    rng = random.Random(7)
+    alphabet = "abc "
+    keywords_by_label = {
+        f"label-{i}": ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(3)]
+        for i in range(12)
+    }
+    automaton = KeywordAutomaton(keywords_by_label)
+
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert automaton.find_labels(text) == _naive_labels(keywords_by_label, text)
@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.diagnosis_message import DiagnosisMessage
+from app.domain.value_objects import MessageRole
+from app.infrastructure.repositories.prisma_diagnosis_session_repository import (
+    decode_message_cursor,
+    encode_message_cursor,
+)
+
+
+def _message(timestamp):
+    message = DiagnosisMessage.create(
+        session_id=uuid4(),
+        role=MessageRole.user(),
+        content="el auto no arranca"
+    )
+    message._timestamp = timestamp
+    return message
+
+
+@pytest.mark.parametrize("timestamp", [
+    datetime(2026, 10, 1, 12, 30, 15, 123456),
+    datetime(2026, 10, 1, 12, 30, 15, tzinfo=timezone.utc),
+])
+def test_cursor_round_trip(timestamp):
+    message = _message(timestamp)
+
+    assert decode_message_cursor(encode_message_cursor(message)) == (timestamp, str(message.id.value))
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_message_cursor(_message(datetime(2026, 10, 1, 12, 0)))
+
+    assert all(c.isalnum() or c in "-_=" for c in cursor)
+
+
+@pytest.mark.parametrize("cursor", ["", "no-es-base64!", "c2luLXNlcGFyYWRvcg==", "MjAyNi0xMC0wMXxuby11dWlk"])
+def test_invalid_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_message_cursor(cursor)
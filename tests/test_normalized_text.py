@@ -0,0 +1,36 @@
+from app.domain.value_objects.normalized_text import NormalizedText, normalize_text
+
+
+def test_removes_accents_and_case():
+    assert normalize_text("Bujía  TRANSMISIÓN") == "bujia transmision"
+    assert normalize_text("Vibración en el VOLANTE") == "vibracion en el volante"
+
+
+def test_keeps_enie_base_letter_and_removes_diaeresis():
+    assert normalize_text("Cigüeñal") == "ciguenal"
+
+
+def test_collapses_and_strips_whitespace():
+    assert normalize_text("  hace \t ruido\n\nal  frenar ") == "hace ruido al frenar"
+
+
+def test_casefold_handles_special_lowercase():
+    assert normalize_text("STRASSE") == normalize_text("straße")
+
+
+def test_is_idempotent():
+    text = "¿El motor SE CALIENTA demasiado?  Sí, mucho."
+    assert normalize_text(normalize_text(text)) == normalize_text(text)
+
+
+def test_empty_text():
+    assert normalize_text("") == ""
+    assert normalize_text("   ") == ""
+
+
+def test_normalized_text_value_object():
+    normalized = NormalizedText.from_raw("Frenos  RECHINAN")
+
+    assert normalized.value == "frenos rechinan"
+    assert str(normalized) == "frenos rechinan"
+    assert normalized == NormalizedText("frenos rechinan")
@@ -0,0 +1,107 @@
+"""
+Regresión de planes de consulta: siembra datos, corre ANALYZE y verifica con
+EXPLAIN (sin tocar enable_seqscan) que cada consulta caliente usa su índice.
+
+Solo corre con RUN_DB_TESTS=1 y una base PostgreSQL desechable con las
+migraciones aplicadas en DATABASE_URL; si no hay conexión se omite. Siembra
+~100k filas dentro de una transacción que se revierte al final.
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+
+pytestmark = pytest.mark.db
+
+
+SEED_SQL = [
+    # 20k sesiones de 2k usuarios; 'plan-check-user' tiene ~10
+    """
+    INSERT INTO "diagnosis_sessions" ("id", "userId", "vehicleId", "status", "startedAt", "updatedAt")
+    SELECT
+        CASE WHEN g = 1 THEN 'plan-check-session' ELSE 'plan-session-' || g END,
+        CASE WHEN g % 2000 = 0 THEN 'plan-check-user' ELSE 'plan-user-' || (g % 2000) END,
+        CASE WHEN g % 4000 = 0 THEN 'plan-check-vehicle' ELSE 'plan-vehicle-' || (g % 4000) END,
+        (CASE WHEN g % 7 = 0 THEN 'ACTIVE' ELSE 'COMPLETED' END)::"SessionStatus",
+        now() - g * interval '1 minute',
+        now()
+    FROM generate_series(1, 20000) AS g
+    """,
+    # 60k mensajes repartidos entre las sesiones; 24 en 'plan-check-session'
+    """
+    INSERT INTO "diagnosis_messages" ("id", "sessionId", "role", "content", "timestamp")
+    SELECT
+        'plan-message-' || g,
+        CASE WHEN g % 2500 = 0 THEN 'plan-check-session' ELSE 'plan-session-' || (g % 19999 + 2) END,
+        (CASE WHEN g % 2 = 0 THEN 'USER' ELSE 'ASSISTANT' END)::"MessageRole",
+        'mensaje de prueba ' || g,
+        now() - g * interval '1 second'
+    FROM generate_series(1, 60000) AS g
+    """,
+    # 20k análisis con contexto distinto; uno con appointmentId 'plan-check'
+    """
+    INSERT INTO "sentiment_analyses" ("id", "text", "context", "label", "score", "scores")
+    SELECT
+        'plan-sentiment-' || g,
+        'reseña de prueba ' || g,
+        jsonb_build_object(
+            'appointmentId', CASE WHEN g = 1 THEN 'plan-check' ELSE 'plan-appointment-' || g END,
+            'workshopId', 'plan-workshop-' || (g % 300)
+        ),
+        'NEUTRAL'::"SentimentLabel",
+        0.5,
+        '{"positive": 0.25, "neutral": 0.5, "negative": 0.25}'::jsonb
+    FROM generate_series(1, 20000) AS g
+    """,
+    'ANALYZE "diagnosis_sessions"',
+    'ANALYZE "diagnosis_messages"',
+    'ANALYZE "sentiment_analyses"',
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+async def _plans_by_query():
+
+    try:
+        from prisma import Prisma
+    except ImportError as e:
+        pytest.skip(f"cliente Prisma no disponible: {e}")
+
+    from app.infrastructure.cli.check_query_plans import QUERY_SHAPES, explain, index_names
+
+    db = Prisma()
+    try:
+        await db.connect()
+    except Exception as e:
+        pytest.skip(f"sin conexión a la base de datos: {e}")
+
+    used = {}
+    try:
+        async with db.tx(timeout=timedelta(seconds=120)) as tx:
+            for sql in SEED_SQL:
+                await tx.execute_raw(sql)
+
+            for name, sql, expected_index in QUERY_SHAPES:
+                plan = await explain(tx, sql)
+                used[name] = (expected_index, set(index_names(plan)))
+
+            raise _Rollback()
+    except _Rollback:
+        pass
+    finally:
+        await db.disconnect()
+
+    return used
+
+
+def test_hot_queries_use_their_indexes():
+    used = asyncio.run(_plans_by_query())
+
+    assert used
+    for name, (expected_index, indexes) in used.items():
+        assert expected_index in indexes, f"{name}: se esperaba {expected_index}, el plan usa {sorted(indexes)}"
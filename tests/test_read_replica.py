@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.config import database
+from app.infrastructure.config.database import InstrumentedPrisma, ReplicaPrisma
+
+
+class FakePrimary:
+
+    def __init__(self):
+        self.queries = []
+
+    async def _execute(self, **kwargs):
+        self.queries.append(kwargs["method"])
+        return {"source": "primary"}
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    primary = FakePrimary()
+    replica = ReplicaPrisma.__new__(ReplicaPrisma)
+    replica.failing = False
+    replica.queries = []
+
+    async def fake_execute(self, **kwargs):
+        self.queries.append(kwargs["method"])
+        if self.failing:
+            raise ConnectionError("réplica caída")
+        return {"source": "replica"}
+
+    monkeypatch.setattr(InstrumentedPrisma, "_execute", fake_execute)
+    monkeypatch.setattr(database, "get_prisma_client", lambda: primary)
+    monkeypatch.setattr(database, "_replica_client", replica)
+    monkeypatch.setattr(database, "_replica_healthy", True)
+    monkeypatch.setattr(database, "_replica_last_error", None)
+
+    return replica, primary
+
+
+def test_healthy_replica_serves_reads(replica):
+    replica, primary = replica
+
+    result = asyncio.run(replica._execute(method="find_many", arguments={}))
+
+    assert result == {"source": "replica"}
+    assert primary.queries == []
+
+
+def test_failed_query_is_retried_on_the_primary(replica):
+    replica, primary = replica
+    replica.failing = True
+
+    result = asyncio.run(replica._execute(method="find_many", arguments={}))
+
+    assert result == {"source": "primary"}
+    assert primary.queries == ["find_many"]
+    assert database.get_replica_health()["status"] == "unhealthy"
+
+    # Marcada como caída: las siguientes consultas van directo al primario
+    asyncio.run(replica._execute(method="count", arguments={}))
+    assert replica.queries == ["find_many"]
+    assert primary.queries == ["find_many", "count"]
+
+
+def test_health_check_does_not_fall_back(replica, monkeypatch):
+    replica, primary = replica
+    replica.failing = True
+    monkeypatch.setattr(replica, "is_connected", lambda: True, raising=False)
+
+    async def execute_raw(query):
+        return await replica._execute(method="execute_raw", arguments={"query": query})
+
+    monkeypatch.setattr(replica, "execute_raw", execute_raw, raising=False)
+
+    assert asyncio.run(database._check_replica()) is False
+    assert primary.queries == []
+
+    replica.failing = False
+    assert asyncio.run(database._check_replica()) is True
+    assert asyncio.run(replica._execute(method="find_many", arguments={})) == {"source": "replica"}
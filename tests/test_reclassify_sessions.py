@@ -0,0 +1,156 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.cli import reclassify_sessions as reclassify_module
+from app.infrastructure.cli.reclassify_sessions import UNCLASSIFIED, reclassify_sessions
+from app.infrastructure.repositories.prisma_problem_classification_repository import (
+    PrismaProblemClassificationRepository,
+)
+
+
+class FakeClassificationTable:
+
+    def __init__(self, rows, fail_create=False):
+        self.rows = rows
+        self.fail_create = fail_create
+
+    async def find_many(self, where):
+        return [SimpleNamespace(sessionId=sid) for sid in where["sessionId"]["in"] if sid in self.rows]
+
+    async def create_many(self, data, skip_duplicates=False):
+        if self.fail_create:
+            raise RuntimeError("conexión perdida")
+        for row in data:
+            self.rows.setdefault(row["sessionId"], row)
+
+
+class FakeBatch:
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.updates = []
+        self.problemclassification = self
+
+    def update(self, where, data):
+        self.updates.append((where["sessionId"], data))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            for session_id, data in self.updates:
+                self.rows[session_id] = {**self.rows[session_id], **data}
+        return False
+
+
+class FakeClient:
+    """Fuera de tx escribe directo; dentro, sobre una copia que se aplica al salir sin error."""
+
+    def __init__(self, rows, fail_create=False):
+        self.rows = rows
+        self.fail_create = fail_create
+        self.problemclassification = FakeClassificationTable(rows, fail_create)
+
+    def batch_(self):
+        return FakeBatch(self.rows)
+
+    def tx(self):
+        parent = self
+
+        class Tx:
+            async def __aenter__(self):
+                self.client = FakeClient(
+                    {k: dict(v) for k, v in parent.rows.items()},
+                    parent.fail_create
+                )
+                return self.client
+
+            async def __aexit__(self, exc_type, exc, tb):
+                if exc_type is None:
+                    parent.rows.clear()
+                    parent.rows.update(self.client.rows)
+                return False
+
+        return Tx()
+
+
+def _classification(session_id, category):
+    return SimpleNamespace(
+        id=f"c-{session_id}",
+        session_id=session_id,
+        to_dict=lambda: {"category": category, "confidence_score": 0.9, "symptoms": []}
+    )
+
+
+def test_save_many_is_all_or_nothing():
+    rows = {"s1": {"sessionId": "s1", "category": "MOTOR"}}
+    repository = PrismaProblemClassificationRepository(FakeClient(rows, fail_create=True))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(repository.save_many([
+            _classification("s1", "FRENOS"),
+            _classification("s2", "LUCES"),
+        ]))
+
+    # El update de s1 se revierte junto con el create_many fallido
+    assert rows == {"s1": {"sessionId": "s1", "category": "MOTOR"}}
+
+
+def test_save_many_updates_and_creates():
+    rows = {"s1": {"sessionId": "s1", "category": "MOTOR"}}
+    repository = PrismaProblemClassificationRepository(FakeClient(rows))
+
+    written = asyncio.run(repository.save_many([
+        _classification("s1", "FRENOS"),
+        _classification("s2", "LUCES"),
+    ]))
+
+    assert written == 2
+    assert rows["s1"]["category"] == "FRENOS"
+    assert rows["s2"]["category"] == "LUCES"
+
+
+def _category(name):
+    return SimpleNamespace(category=SimpleNamespace(value=SimpleNamespace(value=name)))
+
+
+def test_unclassifiable_sessions_keep_their_category(monkeypatch):
+    sessions = [SimpleNamespace(id=sid) for sid in ("s1", "s2", "s3", "s4")]
+    existing = {"s1": _category("MOTOR"), "s2": _category("FRENOS")}
+    # s1 cambia, s2 ya no clasifica, s3 es nueva, s4 sigue sin clasificar
+    results = {"s1": _category("LUCES"), "s2": None, "s3": _category("MOTOR"), "s4": None}
+    saved = []
+
+    class FakeSessions:
+        async def find_batch_after(self, cursor=None, limit=100):
+            return [] if cursor else sessions
+
+    class FakeClassifications:
+        async def find_by_session_ids(self, session_ids):
+            return existing
+
+        async def save_many(self, classifications):
+            saved.extend(classifications)
+            return len(classifications)
+
+    class FakeClassifier:
+        async def classify_batch(self, batch):
+            return [(session, results[session.id]) for session in batch]
+
+    monkeypatch.setattr(reclassify_module, "get_prisma_client", lambda: None)
+    monkeypatch.setattr(reclassify_module, "get_cache", lambda: None)
+    monkeypatch.setattr(reclassify_module, "PrismaDiagnosisSessionRepository", lambda db: FakeSessions())
+    monkeypatch.setattr(reclassify_module, "PrismaProblemClassificationRepository", lambda db: FakeClassifications())
+    monkeypatch.setattr(reclassify_module, "ProblemClassifierService", FakeClassifier)
+
+    report = asyncio.run(reclassify_sessions(batch_size=10))
+
+    assert report.scanned == 4
+    assert report.written == len(saved) == 2
+    assert report.transitions == {("MOTOR", "LUCES"): 1, (UNCLASSIFIED, "MOTOR"): 1}
+    assert report.unclassifiable == {"FRENOS": 1}
+    # Los totales "después" coinciden con lo que queda en la base
+    assert report.after == {"LUCES": 1, "FRENOS": 1, "MOTOR": 1, UNCLASSIFIED: 1}
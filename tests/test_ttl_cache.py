@@ -0,0 +1,167 @@
+import asyncio
+
+from app.infrastructure.cache import ttl_cache as ttl_cache_module
+from app.infrastructure.cache.ttl_cache import AsyncTTLCache
+
+
+class _Clock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _cache(monkeypatch, **options):
+    # Sin Redis: solo el nivel en memoria
+    monkeypatch.setattr(ttl_cache_module, "get_cache", lambda: None)
+    clock = _Clock()
+    monkeypatch.setattr(ttl_cache_module, "time", clock)
+    return AsyncTTLCache("test", **options), clock
+
+
+def test_concurrent_misses_share_one_load(monkeypatch):
+    cache, _ = _cache(monkeypatch, ttl_seconds=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": "w1"}
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_load("w1", loader) for _ in range(20)))
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(result == {"id": "w1"} for result in results)
+    stats = cache.stats()
+    assert stats["loads"] == 1
+    assert stats["coalesced"] == 19
+
+
+def test_hit_after_load_and_reload_after_expiry(monkeypatch):
+    cache, clock = _cache(monkeypatch, ttl_seconds=60)
+    values = iter(["v1", "v2"])
+
+    async def loader():
+        return next(values)
+
+    async def run():
+        first = await cache.get_or_load("k", loader)
+        second = await cache.get_or_load("k", loader)
+        clock.now += 61
+        third = await cache.get_or_load("k", loader)
+        return first, second, third
+
+    assert asyncio.run(run()) == ("v1", "v1", "v2")
+    assert cache.stats()["hits"] == 1
+
+
+def test_stale_value_is_served_while_refreshing(monkeypatch):
+    cache, clock = _cache(monkeypatch, ttl_seconds=60, stale_seconds=300)
+    values = iter(["v1", "v2"])
+
+    async def loader():
+        return next(values)
+
+    async def run():
+        await cache.get_or_load("k", loader)
+        clock.now += 120
+        stale = await cache.get_or_load("k", loader)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        fresh = await cache.get_or_load("k", loader)
+        return stale, fresh
+
+    assert asyncio.run(run()) == ("v1", "v2")
+    assert cache.stats()["staleHits"] == 1
+
+
+def test_invalidate_drops_entry_and_discards_inflight_result(monkeypatch):
+    cache, _ = _cache(monkeypatch, ttl_seconds=60)
+    started = release = None
+    values = iter(["old", "new"])
+
+    async def slow_loader():
+        started.set()
+        await release.wait()
+        return next(values)
+
+    async def loader():
+        return next(values)
+
+    async def run():
+        nonlocal started, release
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        pending = asyncio.ensure_future(cache.get_or_load("k", slow_loader))
+        await started.wait()
+
+        # Invalida mientras la carga anterior sigue en curso
+        await cache.invalidate("k")
+        release.set()
+        old = await pending
+
+        new = await cache.get_or_load("k", loader)
+        cached = await cache.get_or_load("k", loader)
+        return old, new, cached
+
+    assert asyncio.run(run()) == ("old", "new", "new")
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_none_is_cached_only_with_cache_none(monkeypatch):
+    cache, clock = _cache(monkeypatch, ttl_seconds=60, cache_none=True, negative_ttl_seconds=15)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return None
+
+    async def run():
+        await cache.get_or_load("missing", loader)
+        await cache.get_or_load("missing", loader)
+        clock.now += 16
+        await cache.get_or_load("missing", loader)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+    plain, _ = _cache(monkeypatch, ttl_seconds=60)
+    plain_calls = []
+
+    async def plain_loader():
+        plain_calls.append(1)
+        return None
+
+    async def run_plain():
+        await plain.get_or_load("missing", plain_loader)
+        await plain.get_or_load("missing", plain_loader)
+
+    asyncio.run(run_plain())
+    assert len(plain_calls) == 2
+
+
+def test_loader_errors_propagate_and_are_not_cached(monkeypatch):
+    cache, _ = _cache(monkeypatch, ttl_seconds=60)
+    attempts = []
+
+    async def loader():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("upstream caído")
+        return "ok"
+
+    async def run():
+        try:
+            await cache.get_or_load("k", loader)
+        except RuntimeError:
+            pass
+        return await cache.get_or_load("k", loader)
+
+    assert asyncio.run(run()) == "ok"
+    assert cache.stats()["loadErrors"] == 1
@@ -0,0 +1,106 @@
+import itertools
+import random
+
+import pytest
+
+from app.domain.value_objects.normalized_text import normalize_text
+from app.domain.value_objects.problem_category import ProblemCategoryEnum
+from app.infrastructure.services.diagnosis_tables import (
+    DEFAULT_TABLES_PATH,
+    DiagnosisTablesProvider,
+    URGENCY_CRITICAL,
+    URGENCY_HIGH,
+    URGENCY_HIGH_MODERATE,
+    URGENCY_MEDIUM,
+    URGENCY_LOW,
+)
+from app.infrastructure.services.urgency_calculator_service import UrgencyCalculatorService
+
+
+@pytest.fixture(scope="module")
+def provider():
+    return DiagnosisTablesProvider(DEFAULT_TABLES_PATH)
+
+
+def _legacy_urgency(tables, category, symptoms):
+    """Ramificación anterior a la tabla de decisión, con búsqueda de subcadenas."""
+    symptoms_text = " ".join(symptoms).lower()
+
+    def has_any(patterns):
+        return any(pattern in symptoms_text for pattern in patterns)
+
+    if category in tables.critical_categories:
+        return URGENCY_CRITICAL
+
+    if has_any(tables.critical_symptoms):
+        return URGENCY_CRITICAL
+
+    if category in tables.high_urgency_categories:
+        if has_any(tables.category_critical_symptoms.get(category, ())):
+            return URGENCY_CRITICAL
+        if has_any(tables.high_urgency_symptoms):
+            return URGENCY_HIGH
+        return URGENCY_HIGH_MODERATE
+
+    if category in tables.medium_urgency_categories:
+        return URGENCY_MEDIUM
+
+    return URGENCY_LOW
+
+
+def _vocabulary(tables):
+    words = set(tables.critical_symptoms) | set(tables.high_urgency_symptoms)
+    for patterns in tables.category_critical_symptoms.values():
+        words |= set(patterns)
+    for keywords in tables.category_keywords.values():
+        words |= {keyword for keyword, _ in keywords}
+    return sorted(words | {"ruido raro", "tablero apagado", "llanta baja"})
+
+
+def test_decision_table_covers_every_category_and_mask(provider):
+    decisions = provider.tables.urgency_decisions
+
+    assert set(decisions) == set(itertools.product(ProblemCategoryEnum, range(8)))
+
+
+def test_decision_table_matches_legacy_branching(provider):
+    tables = provider.tables
+    vocabulary = _vocabulary(tables)
+    rng = random.Random(28)
+
+    cases = [[]] + [[word] for word in vocabulary]
+    cases += [rng.sample(vocabulary, rng.randint(2, 3)) for _ in range(500)]
+
+    for category in ProblemCategoryEnum:
+        for symptoms in cases:
+            expected = _legacy_urgency(tables, category, symptoms)
+            assert tables.urgency_outcome(category, symptoms) == expected, (category, symptoms)
+
+
+def test_patterns_spanning_adjacent_symptoms_match(provider):
+    tables = provider.tables
+
+    # Ningún síntoma por separado es crítico; unidos forman "temperatura alta"
+    assert tables.urgency_outcome(ProblemCategoryEnum.OTHER, ["temperatura"]) == URGENCY_LOW
+    assert tables.urgency_outcome(ProblemCategoryEnum.OTHER, ["alta"]) == URGENCY_LOW
+    assert tables.urgency_outcome(ProblemCategoryEnum.OTHER, ["temperatura", "alta"]) == URGENCY_CRITICAL
+
+    # "ruido metalico" sube la urgencia de una categoría de urgencia alta
+    assert tables.urgency_outcome(ProblemCategoryEnum.ENGINE, ["ruido"]) == URGENCY_HIGH_MODERATE
+    assert tables.urgency_outcome(ProblemCategoryEnum.ENGINE, ["ruido", "metalico"]) == URGENCY_HIGH
+
+
+def test_service_maps_outcomes_and_unknown_categories(provider):
+    service = UrgencyCalculatorService(tables_provider=provider)
+    tables = provider.tables
+
+    for category in ProblemCategoryEnum:
+        for symptoms in ([], ["humo"], ["fuga"], ["no entra"]):
+            normalized = [normalize_text(s) for s in symptoms]
+            outcome = _legacy_urgency(tables, category, normalized)
+            assert service.calculate_urgency_from_primitives(category.value, symptoms) == \
+                UrgencyCalculatorService.URGENCY_OUTCOMES[outcome]
+
+    # Las categorías desconocidas se tratan como OTHER
+    assert service.calculate_urgency_from_primitives("NO_EXISTE", []) == \
+        service.calculate_urgency_from_primitives(ProblemCategoryEnum.OTHER, [])
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+
+import pytest
+
+from app.infrastructure.cache import ttl_cache as ttl_cache_module
+from app.infrastructure.clients.vehicle_service_client import VehicleServiceClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Sin Redis: solo el nivel en memoria
+    monkeypatch.setattr(ttl_cache_module, "get_cache", lambda: None)
+    client = VehicleServiceClient()
+    client.fetches = []
+    client.vehicles = {}
+    client.failing = False
+
+    async def fetch(vehicle_id, auth_token):
+        client.fetches.append(vehicle_id)
+        if client.failing:
+            raise ConnectionError("vehicle-service no disponible")
+        return client.vehicles.get(vehicle_id)
+
+    monkeypatch.setattr(client, "_fetch_vehicle_location", fetch)
+    return client
+
+
+def _vehicle(vehicle_id, owner_id):
+    return {"id": vehicle_id, "ownerId": owner_id, "latitude": 16.75, "longitude": -93.10}
+
+
+def test_location_is_cached_per_vehicle_and_owner(client):
+    client.vehicles["v1"] = _vehicle("v1", "u1")
+
+    async def run():
+        first = await client.get_vehicle_location("v1", "u1", "token")
+        second = await client.get_vehicle_location("v1", "u1", "token")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second == _vehicle("v1", "u1")
+    assert client.fetches == ["v1"]
+
+
+def test_other_owner_gets_none(client):
+    client.vehicles["v1"] = _vehicle("v1", "u1")
+
+    assert asyncio.run(client.get_vehicle_location("v1", "u2", "token")) is None
+
+
+def test_missing_vehicle_is_cached_as_none(client):
+
+    async def run():
+        await client.get_vehicle_location("v404", "u1", "token")
+        return await client.get_vehicle_location("v404", "u1", "token")
+
+    assert asyncio.run(run()) is None
+    assert client.fetches == ["v404"]
+
+
+def test_errors_are_logged_and_not_cached(client, caplog):
+    client.failing = True
+
+    with caplog.at_level(logging.WARNING):
+        assert asyncio.run(client.get_vehicle_location("v1", "u1", "token")) is None
+
+    assert "v1" in caplog.text
+
+    client.failing = False
+    client.vehicles["v1"] = _vehicle("v1", "u1")
+    assert asyncio.run(client.get_vehicle_location("v1", "u1", "token")) == _vehicle("v1", "u1")
+    assert client.fetches == ["v1", "v1"]
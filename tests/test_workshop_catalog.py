@@ -0,0 +1,104 @@
+import asyncio
+
+import httpx
+
+from app.infrastructure.services.workshop_catalog import WorkshopCatalogProvider
+
+
+def _workshops(count, start=0):
+    return [
+        {
+            "id": f"w{i}",
+            "businessName": f"Taller {i}",
+            "latitude": 16.75 + i * 0.001,
+            "longitude": -93.10,
+            "overallRating": 4.0,
+            "specialties": [{"specialtyType": "FRENOS"}],
+        }
+        for i in range(start, start + count)
+    ]
+
+
+class FakeWorkshopClient:
+    """Sirve un listado paginado; failing_pages lanzan o vienen vacías."""
+
+    def __init__(self, workshops, report_total=True, failing_pages=(), empty_pages=()):
+        self.workshops = workshops
+        self.report_total = report_total
+        self.failing_pages = set(failing_pages)
+        self.empty_pages = set(empty_pages)
+        self.pages = []
+
+    async def fetch_workshops_page(self, page=1, limit=100, **_):
+        self.pages.append(page)
+        if page in self.failing_pages:
+            raise httpx.HTTPError("workshop-service no disponible")
+
+        data = [] if page in self.empty_pages else self.workshops[(page - 1) * limit:page * limit]
+        response = {"data": data}
+        if self.report_total:
+            response["total"] = len(self.workshops)
+        return response
+
+
+def _provider(client, page_size=10):
+    return WorkshopCatalogProvider(workshop_client=client, page_size=page_size)
+
+
+def test_refresh_loads_every_page():
+    client = FakeWorkshopClient(_workshops(25))
+    provider = _provider(client)
+
+    assert asyncio.run(provider.refresh()) is True
+    assert client.pages == [1, 2, 3]
+    assert len(provider.catalog) == 25
+    assert provider.catalog.version == 1
+
+
+def test_exact_multiple_of_page_size_stops_at_total():
+    client = FakeWorkshopClient(_workshops(20))
+    provider = _provider(client)
+
+    assert asyncio.run(provider.refresh()) is True
+    assert client.pages == [1, 2]
+
+
+def test_without_total_a_short_page_ends_the_listing():
+    client = FakeWorkshopClient(_workshops(15), report_total=False)
+    provider = _provider(client)
+
+    assert asyncio.run(provider.refresh()) is True
+    assert client.pages == [1, 2]
+    assert len(provider.catalog) == 15
+
+
+def test_failed_page_keeps_the_previous_catalog():
+    workshops = _workshops(25)
+    provider = _provider(FakeWorkshopClient(workshops))
+    asyncio.run(provider.refresh())
+    previous = provider.catalog
+
+    provider._workshop_client = FakeWorkshopClient(workshops, failing_pages={2})
+
+    assert asyncio.run(provider.refresh()) is False
+    assert provider.catalog is previous
+
+
+def test_empty_page_before_total_keeps_the_previous_catalog():
+    workshops = _workshops(25)
+    provider = _provider(FakeWorkshopClient(workshops))
+    asyncio.run(provider.refresh())
+    previous = provider.catalog
+
+    provider._workshop_client = FakeWorkshopClient(workshops, empty_pages={2})
+
+    assert asyncio.run(provider.refresh()) is False
+    assert provider.catalog is previous
+    assert provider.catalog.fingerprint == previous.fingerprint
+
+
+def test_first_sync_failure_leaves_no_catalog():
+    provider = _provider(FakeWorkshopClient(_workshops(25), failing_pages={1}))
+
+    assert asyncio.run(provider.refresh()) is False
+    assert provider.catalog is None
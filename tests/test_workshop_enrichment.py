@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.cache import ttl_cache as ttl_cache_module
+from app.infrastructure.clients.workshop_service_client import WorkshopServiceClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(ttl_cache_module, "get_cache", lambda: None)
+    client = WorkshopServiceClient()
+    client.settings.WORKSHOP_ENRICHMENT_CONCURRENCY = 3
+    client.settings.WORKSHOP_ENRICHMENT_TIMEOUT_SECONDS = 0.05
+    return client
+
+
+def test_fetches_concurrently_up_to_the_limit(client, monkeypatch):
+    active = 0
+    peak = 0
+    requested = []
+
+    async def get_workshop(workshop_id, auth_token=None):
+        nonlocal active, peak
+        requested.append(workshop_id)
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"id": workshop_id}
+
+    monkeypatch.setattr(client, "get_workshop", get_workshop)
+    ids = [f"w{i}" for i in range(10)] + ["w0", "w1"]
+
+    result = asyncio.run(client.get_workshops_by_ids(ids))
+
+    assert peak == 3
+    # Duplicados se piden una sola vez y se conserva el orden
+    assert requested == [f"w{i}" for i in range(10)]
+    assert list(result) == [f"w{i}" for i in range(10)]
+    assert result["w7"] == {"id": "w7"}
+
+
+def test_failures_and_timeouts_only_affect_their_workshop(client, monkeypatch):
+
+    async def get_workshop(workshop_id, auth_token=None):
+        if workshop_id == "slow":
+            await asyncio.sleep(1)
+        if workshop_id == "broken":
+            raise RuntimeError("respuesta inválida")
+        return {"id": workshop_id}
+
+    monkeypatch.setattr(client, "get_workshop", get_workshop)
+
+    result = asyncio.run(client.get_workshops_by_ids(["ok", "slow", "broken"]))
+
+    assert result == {"ok": {"id": "ok"}, "slow": None, "broken": None}
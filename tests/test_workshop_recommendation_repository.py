@@ -0,0 +1,197 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.problem_classification import ProblemClassification
+from app.infrastructure.repositories.prisma_workshop_recommendation_repository import (
+    PrismaWorkshopRecommendationRepository,
+)
+
+
+class FakeRecommendationTable:
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @staticmethod
+    def _matches(row, where):
+        return all(row.get(field) == value for field, value in where.items())
+
+    async def find_many(self, where, order=None):
+        found = [row for row in self.rows if self._matches(row, where)]
+        if order:
+            (field, direction), = order.items()
+            found.sort(key=lambda row: row[field], reverse=direction == "desc")
+        return [SimpleNamespace(**row) for row in found]
+
+    async def delete_many(self, where):
+        self.rows[:] = [row for row in self.rows if not self._matches(row, where)]
+
+    async def create_many(self, data):
+        self.rows.extend(dict(row) for row in data)
+
+
+class FakeClient:
+
+    def __init__(self):
+        self.rows = []
+        self.workshoprecommendation = FakeRecommendationTable(self.rows)
+
+    def tx(self):
+        client = self
+
+        class Tx:
+            async def __aenter__(self):
+                return client
+
+            async def __aexit__(self, exc_type, exc, tb):
+                return False
+
+        return Tx()
+
+
+TUXTLA = {"latitude": 16.7521, "longitude": -93.1152}
+# ~30 m: misma celda geohash de precisión 7
+TUXTLA_NEARBY = {"latitude": 16.7522, "longitude": -93.1150}
+# ~2 km: otra celda
+TUXTLA_OTHER_CELL = {"latitude": 16.7700, "longitude": -93.1152}
+
+
+def _classification(session_id, category="BRAKES", tables_version="v1", classification_id=None):
+    return ProblemClassification.from_primitives(
+        classification_id=str(classification_id or uuid4()),
+        session_id=str(session_id),
+        category=category,
+        subcategory=None,
+        confidence_score=0.8,
+        symptoms=["frenos"],
+        created_at=datetime(2026, 10, 1),
+        tables_version=tables_version
+    )
+
+
+def _recommendations(count):
+    return [
+        {
+            "workshop_id": f"w{i}",
+            "workshop_name": f"Taller {i}",
+            "match_score": 1.0 - i * 0.05,
+            "reasons": ["Cercano"],
+            "distance_km": 1.0 + i,
+            "rating": 4.5,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def repository():
+    return PrismaWorkshopRecommendationRepository(FakeClient())
+
+
+def test_round_trip_keeps_rank_order_and_caps_at_max(repository):
+    session_id = uuid4()
+    classification = _classification(session_id)
+    recommendations = _recommendations(PrismaWorkshopRecommendationRepository.MAX_RECOMMENDATIONS + 3)
+
+    async def run():
+        written = await repository.replace_for_classification(
+            session_id, classification, "catalog-a", TUXTLA, recommendations
+        )
+        found = await repository.find_for_classification(session_id, classification, "catalog-a", TUXTLA)
+        return written, found
+
+    written, found = asyncio.run(run())
+
+    assert written == PrismaWorkshopRecommendationRepository.MAX_RECOMMENDATIONS
+    assert [rec["workshop_id"] for rec in found] == [
+        rec["workshop_id"] for rec in recommendations[:written]
+    ]
+    assert found[0] == recommendations[0]
+
+
+def test_same_location_cell_hits(repository):
+    session_id = uuid4()
+    classification = _classification(session_id)
+
+    async def run():
+        await repository.replace_for_classification(
+            session_id, classification, "catalog-a", TUXTLA, _recommendations(3)
+        )
+        return await repository.find_for_classification(session_id, classification, "catalog-a", TUXTLA_NEARBY)
+
+    assert asyncio.run(run()) is not None
+
+
+@pytest.mark.parametrize("lookup", [
+    {"catalog_version": "catalog-b"},
+    {"user_location": TUXTLA_OTHER_CELL},
+    {"category": "ENGINE"},
+    {"tables_version": "v2"},
+])
+def test_any_key_change_misses(repository, lookup):
+    session_id = uuid4()
+    classification_id = uuid4()
+    stored = _classification(session_id, classification_id=classification_id)
+
+    current = _classification(
+        session_id,
+        category=lookup.get("category", "BRAKES"),
+        tables_version=lookup.get("tables_version", "v1"),
+        classification_id=classification_id
+    )
+
+    async def run():
+        await repository.replace_for_classification(
+            session_id, stored, "catalog-a", TUXTLA, _recommendations(3)
+        )
+        return await repository.find_for_classification(
+            session_id,
+            current,
+            lookup.get("catalog_version", "catalog-a"),
+            lookup.get("user_location", TUXTLA)
+        )
+
+    assert asyncio.run(run()) is None
+
+
+def test_replace_drops_the_previous_listing(repository):
+    session_id = uuid4()
+    classification = _classification(session_id)
+
+    async def run():
+        await repository.replace_for_classification(
+            session_id, classification, "catalog-a", TUXTLA, _recommendations(5)
+        )
+        await repository.replace_for_classification(
+            session_id, classification, "catalog-b", TUXTLA, _recommendations(2)
+        )
+        old = await repository.find_for_classification(session_id, classification, "catalog-a", TUXTLA)
+        new = await repository.find_for_classification(session_id, classification, "catalog-b", TUXTLA)
+        return old, new
+
+    old, new = asyncio.run(run())
+
+    assert old is None
+    assert len(new) == 2
+    assert len(repository.db.rows) == 2
+
+
+def test_other_sessions_are_not_touched(repository):
+    first, second = uuid4(), uuid4()
+
+    async def run():
+        await repository.replace_for_classification(
+            first, _classification(first), "catalog-a", TUXTLA, _recommendations(3)
+        )
+        await repository.replace_for_classification(
+            second, _classification(second), "catalog-a", TUXTLA, _recommendations(4)
+        )
+
+    asyncio.run(run())
+
+    assert sum(row["sessionId"] == str(first) for row in repository.db.rows) == 3
+    assert sum(row["sessionId"] == str(second) for row in repository.db.rows) == 4
@@ -0,0 +1,90 @@
+import random
+
+import numpy as np
+
+from app.infrastructure.cli.benchmark_recommender import (
+    scalar_haversine_km,
+    scalar_match_score,
+)
+from app.infrastructure.services.workshop_catalog import KNOWN_SPECIALTIES, WorkshopCatalog
+from app.infrastructure.services.workshop_recommender_service import WorkshopRecommenderService
+from app.infrastructure.services.workshop_scoring import haversine_km, match_scores, top_k
+
+
+WEIGHTS = (
+    WorkshopRecommenderService.WEIGHT_SPECIALIZATION,
+    WorkshopRecommenderService.WEIGHT_PROXIMITY,
+    WorkshopRecommenderService.WEIGHT_RATING,
+)
+
+
+def _stable_top_k(scores, k):
+    return sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:k]
+
+
+def test_top_k_matches_stable_sort_with_ties():
+    rng = np.random.default_rng(48)
+
+    for _ in range(200):
+        n = int(rng.integers(0, 40))
+        # Pocos valores distintos para forzar empates alrededor del k-ésimo
+        scores = rng.choice([0.1, 0.25, 0.5, 0.75, 0.9], size=n)
+        k = int(rng.integers(0, n + 3))
+
+        assert top_k(scores, k).tolist() == _stable_top_k(scores.tolist(), k)
+
+
+def test_top_k_all_equal_keeps_positions():
+    assert top_k(np.full(6, 0.5), 3).tolist() == [0, 1, 2]
+
+
+def test_top_k_empty_and_non_positive_k():
+    assert top_k(np.array([]), 3).tolist() == []
+    assert top_k(np.array([0.3, 0.2]), 0).tolist() == []
+
+
+def test_haversine_matches_scalar_reference():
+    rng = random.Random(1)
+    lat, lon = 16.75, -93.10
+    latitudes = np.array([lat + rng.uniform(-1, 1) for _ in range(100)])
+    longitudes = np.array([lon + rng.uniform(-1, 1) for _ in range(100)])
+
+    vectorized = haversine_km(lat, lon, latitudes, longitudes)
+    scalar = [scalar_haversine_km(lat, lon, la, lo) for la, lo in zip(latitudes, longitudes)]
+
+    np.testing.assert_allclose(vectorized, scalar, rtol=1e-9, atol=1e-9)
+
+
+def test_match_scores_match_scalar_reference():
+    rng = random.Random(2)
+    workshops = [
+        {
+            "id": f"w{i}",
+            "latitude": 16.75 + rng.uniform(-0.5, 0.5),
+            "longitude": -93.10 + rng.uniform(-0.5, 0.5),
+            "overallRating": rng.choice([0, 1.5, 3.0, 4.5, 5.0, 6.0]),
+            "specialties": [{"specialtyType": s} for s in rng.sample(KNOWN_SPECIALTIES, rng.randint(0, 3))],
+        }
+        for i in range(300)
+    ]
+    catalog = WorkshopCatalog(workshops, version=1)
+    radius_km = 50.0
+
+    for specialty in ("FRENOS", "MOTOR", "GENERAL"):
+        distances = haversine_km(16.75, -93.10, catalog.latitudes, catalog.longitudes)
+        scores = match_scores(
+            distances,
+            catalog.ratings,
+            catalog.specialty_masks,
+            catalog.specialty_bit(specialty),
+            catalog.specialty_bit("GENERAL"),
+            radius_km,
+            WEIGHTS
+        )
+
+        expected = [
+            scalar_match_score(w["specialties"], specialty, float(d), w["overallRating"], radius_km)
+            for w, d in zip(workshops, distances)
+        ]
+
+        assert scores.tolist() == expected